@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from operator import attrgetter
 
 from temporalio import workflow
 from temporalio.common import RetryPolicy
@@ -8,6 +9,11 @@ from ..whatsapp.schema import SimpleContact
 from .activities import CropCycleActivities
 from .schema import CropCycleEvent
 
+# Always pass through external modules to the sandbox that you know are safe for
+# workflow use
+with workflow.unsafe.imports_passed_through():
+    from farmbase.common.utils.intervals import IntervalIndex
+
 
 @workflow.defn
 class CropCycleWorkflow:
@@ -24,44 +30,42 @@ class CropCycleWorkflow:
             non_retryable_error_types=[],
         )
 
-        # Sort events by start_day
-        events.sort(key=lambda x: x.start_day)
+        # Index the events on their [start_day, end_day] window
+        index = IntervalIndex(events, start=attrgetter("start_day"), end=attrgetter("end_day"))
 
         current_date = workflow.now()
 
-        # Calculate which events should have already been sent
-        for event in events:
-            event_start_date = planting_date + timedelta(days=event.start_day)
-            event_end_date = planting_date + timedelta(days=event.end_day)
-            # If current date is within the event window, and we haven't sent it
-            if (
-                current_date >= event_start_date
-                and current_date <= event_end_date
-                and event.identifier not in self._sent_events
-            ):
+        # Send the events whose window we are currently in, which we have missed
+        elapsed_days = (current_date - planting_date) / timedelta(days=1)
+        for event in index.at(elapsed_days):
+            if event.identifier not in self._sent_events:
                 # Send the message immediately for events we've missed or are currently in
                 await self._send_event_message(contact, event, retry_policy)
                 self._sent_events.add(event.identifier)
 
-        # Now schedule future events
-        for event in events:
+        # Now schedule future events, in start order
+        if demo:
+            start_time = workflow.info().start_time
+            elapsed = (current_date - start_time) / timedelta(minutes=1)
+        else:
+            elapsed = elapsed_days
+
+        for event in index.starting_after(elapsed):
             if event.identifier in self._sent_events:
                 continue
 
             if demo:
-                info = workflow.info()
-                event_start_date = info.start_time + timedelta(minutes=event.start_day)
+                event_start_date = start_time + timedelta(minutes=event.start_day)
             else:
                 event_start_date = planting_date + timedelta(days=event.start_day)
 
-            # If the event is in the future, sleep until the start date
-            if current_date < event_start_date:
-                sleep_duration = event_start_date - current_date
-                await workflow.sleep(sleep_duration)
+            # Sleep until the start date
+            sleep_duration = event_start_date - current_date
+            await workflow.sleep(sleep_duration)
 
-                # Send the message
-                await self._send_event_message(contact, event, retry_policy)
-                self._sent_events.add(event.identifier)
+            # Send the message
+            await self._send_event_message(contact, event, retry_policy)
+            self._sent_events.add(event.identifier)
 
         return f"Crop cycle workflow completed for contact {contact.name}"
 
@@ -1,9 +1,7 @@
 from datetime import datetime, timedelta
 
-from geoalchemy2.functions import ST_Distance, ST_MakePoint, ST_SetSRID, ST_Transform
 from geoalchemy2.shape import to_shape
 from sqlalchemy import and_, select
-from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.orm import selectinload
 from temporalio import activity, workflow
 
@@ -17,17 +15,11 @@ class AlertActivities:
     @activity.defn
     async def get_recent_notes(self) -> list[AlertDetails]:
         """Get notes created in the last hour."""
-        from farmbase.database.core import engine
+        from farmbase.database.core import get_tenant_session_factory
         from farmbase.farm.models import Farm
         from farmbase.farm.note.models import Note
 
-        organization = "default"
-        schema = f"farmbase_organization_{organization}"
-        schema_engine = engine.execution_options(schema_translate_map={None: schema})
-        async_session_factory = async_sessionmaker(
-            bind=schema_engine,
-            expire_on_commit=False,
-        )
+        async_session_factory = get_tenant_session_factory("default")
 
         one_hour_ago = datetime.utcnow() - timedelta(hours=24)
 
@@ -68,16 +60,11 @@ class AlertActivities:
     @activity.defn
     async def find_nearby_farms(self, note_details: AlertDetails, radius_km: float = 5.0) -> list[FarmWithContacts]:
         """Find farms within the specified radius of the note's farm location."""
-        from farmbase.database.core import engine
+        from farmbase.database.core import get_tenant_session_factory
         from farmbase import Farm, FarmContact
+        from farmbase.geospatial.proximity import distance, nearest, within_distance
 
-        organization = "default"
-        schema = f"farmbase_organization_{organization}"
-        schema_engine = engine.execution_options(schema_translate_map={None: schema})
-        async_session_factory = async_sessionmaker(
-            bind=schema_engine,
-            expire_on_commit=False,
-        )
+        async_session_factory = get_tenant_session_factory("default")
 
         if not note_details.note_location:
             return []
@@ -85,27 +72,20 @@ class AlertActivities:
         lat, lon = map(float, note_details.note_location.split(","))
 
         async with async_session_factory() as session:
-            # Create a point from the farm location
-            origin_point = ST_SetSRID(ST_MakePoint(lon, lat), 4326)
-
-            # Find farms within radius (excluding the original farm)
-            distance_query = ST_Distance(
-                ST_Transform(Farm.location, 3857),  # Transform to meters
-                ST_Transform(origin_point, 3857),
-            )
-
+            # Find farms within radius (excluding the original farm), nearest first
             query = (
                 select(
                     Farm,
-                    (distance_query / 1000).label("distance_km"),  # Convert to kilometers
+                    (distance(Farm.location, lat, lon) / 1000).label("distance_km"),  # Convert to kilometers
                 )
                 .filter(
                     and_(
                         Farm.id != note_details.farm_id,  # Exclude the original farm
                         Farm.location.isnot(None),  # Only farms with locations
-                        distance_query <= radius_km * 1000,  # Within radius in meters
+                        within_distance(Farm.location, lat, lon, radius_km * 1000),  # Within radius in meters
                     )
                 )
+                .order_by(nearest(Farm.location, lat, lon))
                 .options(selectinload(Farm.contact_associations).selectinload(FarmContact.contact))
             )
 
@@ -113,7 +93,7 @@ class AlertActivities:
             farm_distance_pairs = results.all()
 
         farms_with_contacts = []
-        for farm, distance in farm_distance_pairs:
+        for farm, distance_km in farm_distance_pairs:
             # Get contacts for this farm
             contacts = []
             for farm_contact in farm.contact_associations:
@@ -132,7 +112,7 @@ class AlertActivities:
                     FarmWithContacts(
                         farm_id=farm.id,
                         farm_name=farm.farm_name,
-                        distance_km=round(distance, 2),
+                        distance_km=round(distance_km, 2),
                         contacts=contacts,
                     )
                 )
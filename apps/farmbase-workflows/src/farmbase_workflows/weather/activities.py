@@ -1,6 +1,5 @@
 from more_itertools import flatten
 from python_weather.forecast import Forecast
-from sqlalchemy.ext.asyncio import async_sessionmaker
 from temporalio import activity
 
 
@@ -12,16 +11,10 @@ class WeatherActivities:
     @activity.defn
     async def get_contacts_with_location(self):
         from farmbase.contact.service import get_all_with_location
-        from farmbase.database.core import engine
+        from farmbase.database.core import get_tenant_session_factory
         from geoalchemy2.shape import to_shape
 
-        organization = "default"
-        schema = f"farmbase_organization_{organization}"
-        schema_engine = engine.execution_options(schema_translate_map={None: schema})
-        async_session_factory = async_sessionmaker(
-            bind=schema_engine,
-            expire_on_commit=False,
-        )
+        async_session_factory = get_tenant_session_factory("default")
 
         async with async_session_factory() as session:
             contacts = await get_all_with_location(db_session=session)
@@ -1,4 +1,3 @@
-from sqlalchemy.ext.asyncio import async_sessionmaker
 from temporalio import activity, workflow
 
 from .schema import SimpleContact
@@ -20,7 +19,7 @@ class WhatsAppActivities:
         from loguru import logger
         from pywa_async.types import Template
         from pywa_async.types.sent_message import SentTemplate
-        from farmbase.database.core import engine
+        from farmbase.database.core import get_tenant_session_factory
         from farmbase.contact.message.service import create
         from datetime import datetime, UTC
         from farmbase.contact.message.models import MessageDirection, MessageType
@@ -47,13 +46,7 @@ class WhatsAppActivities:
         # TODO: Log/alert when message sending failed.
         logger.info(f"Response for message to {contact.phone_number}: {sent_template}")
 
-        organization = "default"
-        schema = f"farmbase_organization_{organization}"
-        schema_engine = engine.execution_options(schema_translate_map={None: schema})
-        async_session_factory = async_sessionmaker(
-            bind=schema_engine,
-            expire_on_commit=False,
-        )
+        async_session_factory = get_tenant_session_factory("default")
 
         async with async_session_factory() as session:
             await create(db_session=session,
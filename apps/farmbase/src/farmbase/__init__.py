@@ -1,44 +1,78 @@
+import importlib
+import importlib.metadata
 import os
 import os.path
 import sys
+import warnings
 from subprocess import check_output
 
 from loguru import logger
 
-from .agronomy.models import (
-    Crop,
-    CropCycle,
-    CropCycleStage,
-    Event,
-    Pathogen,
-    PathogenImage,
-)
-from .commodity.models import Commodity
-from .contact.message.models import Message
-from .contact.models import Contact
-from .contact.runresult.models import Agent, RunResult
-from .farm.activity.models import ActivityProduct, ActivityType, FarmActivity
-from .farm.field.models import BoundaryDefinitionActivity, Field, FieldGroup, FieldGroupMember
-from .farm.harvest.models import HarvestLoad, StorageLocation
-from .farm.models import Farm, FarmContact
-from .farm.note.models import Note
-from .farm.planting.models import Planting
-from .farm.platform.models import Platform
-from .geospatial.models import Region, Subregion
-from .market.models import Market, MarketPrice
-from .organization.models import Organization
-from .plugin.models import Plugin, PluginEvent, PluginInstance
-from .products.models import Manufacturer, Product
-from .topic.models import Subscription, Topic
+# Models are exported lazily (see __getattr__ below) so that importing farmbase, or any one of its
+# modules, doesn't import every model. All models are imported on demand by import_all_models(),
+# which runs before SQLAlchemy configures the mappers.
+_MODELS = {
+    "Crop": ".agronomy.models",
+    "CropCycle": ".agronomy.models",
+    "CropCycleStage": ".agronomy.models",
+    "Event": ".agronomy.models",
+    "Pathogen": ".agronomy.models",
+    "PathogenImage": ".agronomy.models",
+    "Commodity": ".commodity.models",
+    "Message": ".contact.message.models",
+    "Contact": ".contact.models",
+    "Agent": ".contact.runresult.models",
+    "RunResult": ".contact.runresult.models",
+    "ActivityProduct": ".farm.activity.models",
+    "ActivityType": ".farm.activity.models",
+    "FarmActivity": ".farm.activity.models",
+    "BoundaryDefinitionActivity": ".farm.field.models",
+    "Field": ".farm.field.models",
+    "FieldGroup": ".farm.field.models",
+    "FieldGroupMember": ".farm.field.models",
+    "HarvestLoad": ".farm.harvest.models",
+    "StorageLocation": ".farm.harvest.models",
+    "Farm": ".farm.models",
+    "FarmContact": ".farm.models",
+    "Note": ".farm.note.models",
+    "Planting": ".farm.planting.models",
+    "Platform": ".farm.platform.models",
+    "Region": ".geospatial.models",
+    "Subregion": ".geospatial.models",
+    "SubregionCropSuitability": ".geospatial.models",
+    "SubregionSuitability": ".geospatial.models",
+    "Market": ".market.models",
+    "MarketPrice": ".market.models",
+    "MarketLatestPrice": ".market.models",
+    "Organization": ".organization.models",
+    "Plugin": ".plugin.models",
+    "PluginEvent": ".plugin.models",
+    "PluginInstance": ".plugin.models",
+    "Manufacturer": ".products.models",
+    "Product": ".products.models",
+    "Subscription": ".topic.models",
+    "Topic": ".topic.models",
+}
+
+
+def import_all_models() -> None:
+    """Imports every model module so that all tables and relationship targets are registered."""
+    for module in dict.fromkeys(_MODELS.values()):
+        importlib.import_module(module, __name__)
+
+
+def __getattr__(name: str):
+    if name in _MODELS:
+        return getattr(importlib.import_module(_MODELS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 try:
-    VERSION = __import__("pkg_resources").get_distribution("farmbase").version
+    VERSION = importlib.metadata.version("farmbase")
 except Exception:
     VERSION = "unknown"
 
 # fix is in the works see: https://github.com/mpdavis/python-jose/pull/207
-import warnings
-
 warnings.filterwarnings("ignore", message="int_from_bytes is deprecated")
 
 if os.environ.get("LOG_MODULE_IMPORTS", False):
@@ -106,8 +140,7 @@ __version__ = VERSION
 __build__ = get_revision()
 
 # By defining __all__, you are telling Python and PyCharm
-# what 'from farmbase.models import *' should import.
-# PyCharm sees this and marks the imports above as "used".
+# what 'from farmbase import *' should import; the models are resolved by __getattr__.
 __all__ = [
     "Farm",
     "FarmContact",
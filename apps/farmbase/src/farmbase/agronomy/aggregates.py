@@ -0,0 +1,79 @@
+"""Materialized views with precomputed agronomy statistics."""
+
+from sqlalchemy import BigInteger, Column, MetaData, String, Table, text
+
+AGGREGATES_SCHEMA = "farmbase_core"
+
+# declared on their own MetaData, so that create_all and alembic autogenerate leave the views alone
+_metadata = MetaData(schema=AGGREGATES_SCHEMA)
+
+crop_summary = Table(
+    "crop_summary",
+    _metadata,
+    Column("crop_id", String, primary_key=True),
+    Column("pathogen_count", BigInteger, nullable=False),
+    Column("event_count", BigInteger, nullable=False),
+    Column("cycle_count", BigInteger, nullable=False),
+)
+
+# counts of pathogens per pathogen_class and of events per event_category, keyed by dimension
+category_count = Table(
+    "agronomy_category_count",
+    _metadata,
+    Column("dimension", String, primary_key=True),
+    Column("category", String, primary_key=True),
+    Column("count", BigInteger, nullable=False),
+)
+
+# the unique indexes are required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+_CREATE_STATEMENTS = [
+    f"""
+    CREATE MATERIALIZED VIEW IF NOT EXISTS {AGGREGATES_SCHEMA}.crop_summary AS
+    SELECT
+        c.host_id AS crop_id,
+        (
+            SELECT count(DISTINCT p.id)
+            FROM {AGGREGATES_SCHEMA}.pathogen_crop pc
+            JOIN {AGGREGATES_SCHEMA}.pathogen p ON p.id = pc.pathogen_id
+            WHERE pc.crop_id = c.host_id AND p.is_activated
+        ) AS pathogen_count,
+        (
+            SELECT count(DISTINCT ec.event_id)
+            FROM {AGGREGATES_SCHEMA}.event_crop ec
+            WHERE ec.crop_id = c.host_id
+        ) AS event_count,
+        (
+            SELECT count(*)
+            FROM {AGGREGATES_SCHEMA}.crop_cycle cc
+            WHERE cc.crop_id = c.host_id
+        ) AS cycle_count
+    FROM {AGGREGATES_SCHEMA}.crop c
+    """,
+    f"CREATE UNIQUE INDEX IF NOT EXISTS ix_crop_summary_crop_id ON {AGGREGATES_SCHEMA}.crop_summary (crop_id)",
+    f"""
+    CREATE MATERIALIZED VIEW IF NOT EXISTS {AGGREGATES_SCHEMA}.agronomy_category_count AS
+    SELECT 'pathogen_class'::text AS dimension, pathogen_class::text AS category, count(*) AS count
+    FROM {AGGREGATES_SCHEMA}.pathogen
+    WHERE is_activated
+    GROUP BY pathogen_class
+    UNION ALL
+    SELECT 'event_category'::text, event_category::text, count(*)
+    FROM {AGGREGATES_SCHEMA}.event
+    GROUP BY event_category
+    """,
+    f"CREATE UNIQUE INDEX IF NOT EXISTS ix_agronomy_category_count_dimension_category "
+    f"ON {AGGREGATES_SCHEMA}.agronomy_category_count (dimension, category)",
+]
+
+
+def create_aggregate_views(connection) -> None:
+    """Creates the aggregate views if they do not exist. Accepts a Connection or a Session."""
+    for statement in _CREATE_STATEMENTS:
+        connection.execute(text(statement))
+
+
+def refresh_aggregate_views(connection, concurrently: bool = True) -> None:
+    """Recomputes the aggregate views. Accepts a Connection or a Session."""
+    mode = "CONCURRENTLY " if concurrently else ""
+    for table in _metadata.sorted_tables:
+        connection.execute(text(f"REFRESH MATERIALIZED VIEW {mode}{table.fullname}"))
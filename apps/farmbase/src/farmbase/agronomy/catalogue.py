@@ -0,0 +1,199 @@
+import asyncio
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional
+
+from loguru import logger
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from farmbase.agronomy.models import (
+    Crop,
+    CropCycle,
+    CropCycleEvent,
+    Event,
+    EventCategory,
+    Pathogen,
+    PathogenClass,
+    catalogue_version,
+    event_crop_association,
+    pathogen_crop_association,
+)
+from farmbase.agronomy.schemas import CropCycleEventRead, CropCycleRead, CropRead, EventRead, PathogenRead
+from farmbase.common.utils.intervals import IntervalIndex
+from farmbase.config import settings
+from farmbase.metrics import service as metrics_service
+
+
+def _freeze(index: dict) -> Mapping:
+    return MappingProxyType(
+        {key: tuple(values.values() if isinstance(values, dict) else values) for key, values in index.items()}
+    )
+
+
+def _interval_index(events: Iterable) -> IntervalIndex:
+    return IntervalIndex(events, start=attrgetter("start_day"), end=attrgetter("end_day"))
+
+
+@dataclass(frozen=True)
+class CatalogueSnapshot:
+    """An immutable copy of the agronomy catalogue, indexed for the lookups the API serves."""
+
+    version: int
+    crops: Mapping[str, CropRead]
+    # activated pathogens, by crop_id and by (crop_id, pathogen_class)
+    pathogens_by_crop: Mapping[str, tuple[PathogenRead, ...]]
+    pathogens_by_crop_class: Mapping[tuple[str, PathogenClass], tuple[PathogenRead, ...]]
+    # events ordered by start_day (nulls last), by crop_id and by (crop_id, event_category)
+    events_by_crop: Mapping[str, tuple[EventRead, ...]]
+    events_by_crop_category: Mapping[tuple[str, EventCategory], tuple[EventRead, ...]]
+    # events by crop_id and crop cycle events by cycle id, indexed on their [start_day, end_day]
+    event_intervals_by_crop: Mapping[str, IntervalIndex[EventRead]]
+    cycle_event_intervals: Mapping[int, IntervalIndex[CropCycleEventRead]]
+    # crop cycles by crop_id and by (crop_id, koppen_climate_classification)
+    cycles_by_crop: Mapping[str, tuple[CropCycleRead, ...]]
+    cycles_by_crop_koppen: Mapping[tuple[str, str], tuple[CropCycleRead, ...]]
+
+
+async def read_catalogue_version(session: AsyncSession) -> int:
+    """Returns the current catalogue version without advancing it, 0 before the first bump."""
+    # a fresh sequence reports last_value 1 before its first nextval, which also returns 1
+    result = await session.execute(
+        text(
+            f"SELECT CASE WHEN is_called THEN last_value ELSE 0 END "
+            f"FROM {catalogue_version.schema}.{catalogue_version.name}"
+        )
+    )
+    return result.scalar_one()
+
+
+async def bump_catalogue_version(session: AsyncSession) -> int:
+    """Advances the catalogue version; cached catalogues in every process reload on their next check."""
+    result = await session.execute(select(catalogue_version.next_value()))
+    return result.scalar_one()
+
+
+async def load_catalogue(session: AsyncSession, version: int) -> CatalogueSnapshot:
+    """Reads the whole agronomy catalogue into a snapshot."""
+    crops = {crop.host_id: CropRead.model_validate(crop) for crop in (await session.scalars(select(Crop))).all()}
+
+    pathogens = {
+        pathogen.id: PathogenRead.model_validate(pathogen)
+        for pathogen in (
+            await session.scalars(
+                select(Pathogen)
+                .options(selectinload(Pathogen.images))
+                .where(Pathogen.is_activated)
+                .order_by(Pathogen.id)
+            )
+        ).all()
+    }
+    pathogens_by_crop = defaultdict(list)
+    pathogens_by_crop_class = defaultdict(list)
+    pathogen_crops = await session.execute(
+        select(pathogen_crop_association.c.crop_id, pathogen_crop_association.c.pathogen_id)
+        .distinct()
+        .order_by(pathogen_crop_association.c.pathogen_id)
+    )
+    for crop_id, pathogen_id in pathogen_crops:
+        if pathogen := pathogens.get(pathogen_id):
+            pathogens_by_crop[crop_id].append(pathogen)
+            pathogens_by_crop_class[crop_id, pathogen.pathogen_class].append(pathogen)
+
+    events = {event.id: EventRead.model_validate(event) for event in (await session.scalars(select(Event))).all()}
+    # keyed by event id to drop duplicate associations while keeping the start_day order
+    events_by_crop = defaultdict(dict)
+    events_by_crop_category = defaultdict(dict)
+    event_crops = await session.execute(
+        select(event_crop_association.c.crop_id, event_crop_association.c.event_id)
+        .join(Event, Event.id == event_crop_association.c.event_id)
+        .order_by(Event.start_day.nullslast(), Event.id)
+    )
+    for crop_id, event_id in event_crops:
+        event = events[event_id]
+        events_by_crop[crop_id][event_id] = event
+        events_by_crop_category[crop_id, event.event_category][event_id] = event
+
+    cycles_by_crop = defaultdict(list)
+    cycles_by_crop_koppen = defaultdict(list)
+    cycle_event_intervals = {}
+    cycles = await session.scalars(
+        select(CropCycle)
+        .options(
+            selectinload(CropCycle.stages),
+            selectinload(CropCycle.events).selectinload(CropCycleEvent.event),
+            selectinload(CropCycle.crop),
+        )
+        .order_by(CropCycle.id)
+    )
+    for cycle in cycles.all():
+        cycle_read = CropCycleRead.model_validate(cycle)
+        cycles_by_crop[cycle.crop_id].append(cycle_read)
+        cycles_by_crop_koppen[cycle.crop_id, cycle.koppen_climate_classification].append(cycle_read)
+        cycle_event_intervals[cycle.id] = _interval_index(cycle_read.events)
+
+    return CatalogueSnapshot(
+        version=version,
+        crops=MappingProxyType(crops),
+        pathogens_by_crop=_freeze(pathogens_by_crop),
+        pathogens_by_crop_class=_freeze(pathogens_by_crop_class),
+        events_by_crop=_freeze(events_by_crop),
+        events_by_crop_category=_freeze(events_by_crop_category),
+        event_intervals_by_crop=MappingProxyType(
+            {crop_id: _interval_index(events.values()) for crop_id, events in events_by_crop.items()}
+        ),
+        cycle_event_intervals=MappingProxyType(cycle_event_intervals),
+        cycles_by_crop=_freeze(cycles_by_crop),
+        cycles_by_crop_koppen=_freeze(cycles_by_crop_koppen),
+    )
+
+
+class AgronomyCatalogue:
+    """Read-through, in-process cache of the agronomy catalogue.
+
+    The catalogue is reference data that only changes through the agronomy write services and the
+    loader script, both of which bump the catalogue version sequence. The cached snapshot is served
+    as is, and the version is re-read at most every `version_check_interval` seconds; the snapshot is
+    reloaded only when the version has moved on.
+    """
+
+    def __init__(self, version_check_interval: float):
+        self.version_check_interval = version_check_interval
+        self._snapshot: Optional[CatalogueSnapshot] = None
+        self._checked_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_stale(self) -> bool:
+        return self._checked_at is None or time.monotonic() - self._checked_at > self.version_check_interval
+
+    async def get(self, session: AsyncSession) -> CatalogueSnapshot:
+        """Returns the catalogue, reloading it with `session` if its version has changed."""
+        if not self.is_stale:
+            return self._snapshot
+
+        async with self._lock:
+            # another request may have reloaded the catalogue while we waited for the lock
+            if not self.is_stale:
+                return self._snapshot
+
+            version = await read_catalogue_version(session)
+            if self._snapshot is None or self._snapshot.version != version:
+                started = time.perf_counter()
+                self._snapshot = await load_catalogue(session, version)
+                duration = time.perf_counter() - started
+                metrics_service.observe("farmbase_agronomy_catalogue_load_seconds", duration)
+                logger.info(f"Agronomy catalogue version {version} loaded in {duration:.3f}s")
+            self._checked_at = time.monotonic()
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        """Forces a version check on the next lookup."""
+        self._checked_at = None
+
+
+agronomy_catalogue = AgronomyCatalogue(version_check_interval=settings.AGRONOMY_CATALOGUE_VERSION_CHECK_INTERVAL)
@@ -9,6 +9,7 @@ from sqlalchemy import (
     Float,
     ForeignKey,
     Integer,
+    Sequence,
     String,
     Table,
     Text,
@@ -109,6 +110,14 @@ class WateringLevel(FarmbaseEnum):
     HIGH = "high"
 
 
+# ————————————————————————————————————————
+# Catalogue Version
+# ————————————————————————————————————————
+
+# bumped on every change to the agronomy catalogue, so that cached copies can tell they are stale
+catalogue_version = Sequence("agronomy_catalogue_version", schema="farmbase_core", metadata=Base.metadata)
+
+
 # ————————————————————————————————————————
 # Association Tables
 # ————————————————————————————————————————
@@ -13,7 +13,7 @@ from farmbase.agronomy.models import (
     SpreadRisk,
     WateringLevel,
 )
-from farmbase.models import FarmbaseBase, Pagination, PrimaryKey
+from farmbase.models import CursorPagination, FarmbaseBase, PrimaryKey
 
 # ————————————————————————————————————————
 # Crop Schemas
@@ -78,7 +78,7 @@ class CropUpdate(FarmbaseBase):
     temp_day_growth_to: Optional[int] = Field(default=None)
 
 
-class CropPagination(Pagination):
+class CropPagination(CursorPagination):
     """Model for paginated list of crops."""
 
     items: List[CropRead] = Field(default_factory=list)
@@ -168,7 +168,7 @@ class PathogenUpdate(FarmbaseBase):
     version_number: Optional[int] = Field(default=None)
 
 
-class PathogenPagination(Pagination):
+class PathogenPagination(CursorPagination):
     """Model for paginated list of pathogens."""
 
     items: List[PathogenRead] = Field(default_factory=list)
@@ -248,7 +248,7 @@ class EventUpdate(FarmbaseBase):
     weather_limitations: Optional[List[str]] = Field(default=None)
 
 
-class EventPagination(Pagination):
+class EventPagination(CursorPagination):
     """Model for paginated list of events."""
 
     items: List[EventRead] = Field(default_factory=list)
@@ -338,7 +338,7 @@ class CropCycleUpdate(FarmbaseBase):
     koppen_climate_classification: Optional[str] = Field(default=None, max_length=10)
 
 
-class CropCyclePagination(Pagination):
+class CropCyclePagination(CursorPagination):
     """Model for paginated list of crop cycles."""
 
     items: List[CropCycleRead] = Field(default_factory=list)
@@ -1,9 +1,17 @@
 from typing import List, Optional, Sequence
 
+from loguru import logger
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from farmbase.agronomy.aggregates import (
+    category_count,
+    create_aggregate_views,
+    crop_summary,
+    refresh_aggregate_views,
+)
+from farmbase.agronomy.catalogue import agronomy_catalogue, bump_catalogue_version
 from farmbase.agronomy.models import (
     Crop,
     CropCycle,
@@ -17,6 +25,8 @@ from farmbase.agronomy.models import (
     event_pathogen_association,
     pathogen_crop_association,
 )
+from farmbase.agronomy.schemas import CropCycleEventRead, CropCycleRead, CropRead, EventRead, PathogenRead
+from farmbase.database.pagination import Page, paginate
 from farmbase.models import PaginationParams
 
 # ————————————————————————————————————————
@@ -24,9 +34,10 @@ from farmbase.models import PaginationParams
 # ————————————————————————————————————————
 
 
-async def get_crop(session: AsyncSession, host_id: str) -> Optional[Crop]:
-    """Get a crop by host_id."""
-    return await session.get(Crop, host_id)
+async def get_crop(session: AsyncSession, host_id: str) -> Optional[CropRead]:
+    """Get a crop by host_id from the agronomy catalogue."""
+    catalogue = await agronomy_catalogue.get(session)
+    return catalogue.crops.get(host_id)
 
 
 async def get_all_crops(
@@ -34,8 +45,8 @@ async def get_all_crops(
     pagination: Optional[PaginationParams] = None,
     cultivation_type: Optional[str] = None,
     labor_level: Optional[str] = None,
-) -> Sequence[Crop]:
-    """Get all crops with optional filtering and pagination."""
+) -> Page[Crop]:
+    """Get a page of crops with optional filtering, ordered by primary key."""
     query = select(Crop)
 
     # Apply filters
@@ -44,13 +55,7 @@ async def get_all_crops(
     if labor_level:
         query = query.where(Crop.labor == labor_level)
 
-    # Apply pagination
-    if pagination and pagination.limit_offset:
-        limit, offset = pagination.limit_offset
-        query = query.offset(offset).limit(limit)
-
-    result = await session.execute(query)
-    return result.scalars().all()
+    return await paginate(session, query, pagination, order_by=(Crop.host_id,))
 
 
 async def create_crop(session: AsyncSession, crop_data: dict) -> Crop:
@@ -58,6 +63,7 @@ async def create_crop(session: AsyncSession, crop_data: dict) -> Crop:
     crop = Crop(**crop_data)
     session.add(crop)
     await session.commit()
+    await catalogue_changed(session)
     await session.refresh(crop)
     return crop
 
@@ -73,6 +79,7 @@ async def update_crop(session: AsyncSession, host_id: str, crop_data: dict) -> O
             setattr(crop, key, value)
 
     await session.commit()
+    await catalogue_changed(session)
     await session.refresh(crop)
     return crop
 
@@ -85,6 +92,7 @@ async def delete_crop(session: AsyncSession, host_id: str) -> bool:
 
     await session.delete(crop)
     await session.commit()
+    await catalogue_changed(session)
     return True
 
 
@@ -108,8 +116,8 @@ async def get_all_pathogens(
     severity: Optional[int] = None,
     crop_id: Optional[str] = None,
     is_activated: bool = True,
-) -> Sequence[Pathogen]:
-    """Get all pathogens with optional filtering and pagination."""
+) -> Page[Pathogen]:
+    """Get a page of pathogens with optional filtering, ordered by primary key."""
     query = select(Pathogen).options(selectinload(Pathogen.images))
 
     # Apply filters
@@ -122,13 +130,7 @@ async def get_all_pathogens(
     if crop_id:
         query = query.join(pathogen_crop_association).where(pathogen_crop_association.c.crop_id == crop_id)
 
-    # Apply pagination
-    if pagination and pagination.limit_offset:
-        limit, offset = pagination.limit_offset
-        query = query.offset(offset).limit(limit)
-
-    result = await session.execute(query)
-    return result.scalars().all()
+    return await paginate(session, query, pagination, order_by=(Pathogen.id,))
 
 
 async def search_pathogens_by_crop(
@@ -136,23 +138,17 @@ async def search_pathogens_by_crop(
     crop_id: str,
     pathogen_class: Optional[PathogenClass] = None,
     severity: Optional[int] = None,
-) -> Sequence[Pathogen]:
-    """Search pathogens that affect a specific crop."""
-    query = (
-        select(Pathogen)
-        .options(selectinload(Pathogen.images))
-        .join(pathogen_crop_association)
-        .where(pathogen_crop_association.c.crop_id == crop_id)
-        .where(Pathogen.is_activated)
-    )
-
+) -> Sequence[PathogenRead]:
+    """Search the activated pathogens that affect a specific crop in the agronomy catalogue."""
+    catalogue = await agronomy_catalogue.get(session)
     if pathogen_class:
-        query = query.where(Pathogen.pathogen_class == pathogen_class)
-    if severity is not None:
-        query = query.where(Pathogen.severity == severity)
+        pathogens = catalogue.pathogens_by_crop_class.get((crop_id, pathogen_class), ())
+    else:
+        pathogens = catalogue.pathogens_by_crop.get(crop_id, ())
 
-    result = await session.execute(query)
-    return result.scalars().all()
+    if severity is not None:
+        pathogens = [pathogen for pathogen in pathogens if pathogen.severity == severity]
+    return pathogens
 
 
 async def create_pathogen(session: AsyncSession, pathogen_data: dict) -> Pathogen:
@@ -160,6 +156,7 @@ async def create_pathogen(session: AsyncSession, pathogen_data: dict) -> Pathoge
     pathogen = Pathogen(**pathogen_data)
     session.add(pathogen)
     await session.commit()
+    await catalogue_changed(session)
     await session.refresh(pathogen)
     return pathogen
 
@@ -175,6 +172,7 @@ async def update_pathogen(session: AsyncSession, pathogen_id: int, pathogen_data
             setattr(pathogen, key, value)
 
     await session.commit()
+    await catalogue_changed(session)
     await session.refresh(pathogen)
     return pathogen
 
@@ -187,6 +185,7 @@ async def delete_pathogen(session: AsyncSession, pathogen_id: int) -> bool:
 
     await session.delete(pathogen)
     await session.commit()
+    await catalogue_changed(session)
     return True
 
 
@@ -206,8 +205,8 @@ async def get_all_events(
     event_category: Optional[EventCategory] = None,
     crop_id: Optional[str] = None,
     importance: Optional[int] = None,
-) -> Sequence[Event]:
-    """Get all events with optional filtering and pagination."""
+) -> Page[Event]:
+    """Get a page of events with optional filtering, ordered by primary key."""
     query = select(Event)
 
     # Apply filters
@@ -218,13 +217,7 @@ async def get_all_events(
     if crop_id:
         query = query.join(event_crop_association).where(event_crop_association.c.crop_id == crop_id)
 
-    # Apply pagination
-    if pagination and pagination.limit_offset:
-        limit, offset = pagination.limit_offset
-        query = query.offset(offset).limit(limit)
-
-    result = await session.execute(query)
-    return result.scalars().all()
+    return await paginate(session, query, pagination, order_by=(Event.id,))
 
 
 async def get_events_for_crop(
@@ -233,24 +226,22 @@ async def get_events_for_crop(
     event_category: Optional[EventCategory] = None,
     start_day: Optional[int] = None,
     end_day: Optional[int] = None,
-) -> Sequence[Event]:
-    """Get events relevant to a specific crop."""
-    query = select(Event).join(event_crop_association).where(event_crop_association.c.crop_id == crop_id)
-
+) -> Sequence[EventRead]:
+    """Get events relevant to a specific crop from the agronomy catalogue, ordered by start day."""
+    catalogue = await agronomy_catalogue.get(session)
+    if start_day is None and end_day is None:
+        if event_category:
+            return catalogue.events_by_crop_category.get((crop_id, event_category), ())
+        return catalogue.events_by_crop.get(crop_id, ())
+
+    # events overlapping the time window, from the crop's interval index
+    index = catalogue.event_intervals_by_crop.get(crop_id)
+    if index is None:
+        return ()
+    overlapping = index.overlapping(start_day, end_day)
     if event_category:
-        query = query.where(Event.event_category == event_category)
-
-    # Filter by timing if provided
-    if start_day is not None:
-        query = query.where(Event.end_day >= start_day)
-    if end_day is not None:
-        query = query.where(Event.start_day <= end_day)
-
-    # Order by start day for crop planning
-    query = query.order_by(Event.start_day.nullslast())
-
-    result = await session.execute(query)
-    return result.scalars().all()
+        overlapping = [event for event in overlapping if event.event_category == event_category]
+    return overlapping
 
 
 async def get_preventive_events_for_pathogen(
@@ -275,6 +266,7 @@ async def create_event(session: AsyncSession, event_data: dict) -> Event:
     event = Event(**event_data)
     session.add(event)
     await session.commit()
+    await catalogue_changed(session)
     await session.refresh(event)
     return event
 
@@ -290,6 +282,7 @@ async def update_event(session: AsyncSession, event_id: str, event_data: dict) -
             setattr(event, key, value)
 
     await session.commit()
+    await catalogue_changed(session)
     await session.refresh(event)
     return event
 
@@ -302,6 +295,7 @@ async def delete_event(session: AsyncSession, event_id: str) -> bool:
 
     await session.delete(event)
     await session.commit()
+    await catalogue_changed(session)
     return True
 
 
@@ -328,23 +322,12 @@ async def get_crop_cycles_for_crop(
     session: AsyncSession,
     crop_id: str,
     koppen_classification: Optional[str] = None,
-) -> Sequence[CropCycle]:
-    """Get all crop cycles for a specific crop, optionally filtered by climate classification."""
-    query = (
-        select(CropCycle)
-        .options(
-            selectinload(CropCycle.stages),
-            selectinload(CropCycle.events).selectinload(CropCycleEvent.event),
-            selectinload(CropCycle.crop),
-        )
-        .where(CropCycle.crop_id == crop_id)
-    )
-
+) -> Sequence[CropCycleRead]:
+    """Get all crop cycles for a specific crop from the agronomy catalogue, optionally filtered by climate."""
+    catalogue = await agronomy_catalogue.get(session)
     if koppen_classification:
-        query = query.where(CropCycle.koppen_climate_classification == koppen_classification)
-
-    result = await session.execute(query)
-    return result.scalars().all()
+        return catalogue.cycles_by_crop_koppen.get((crop_id, koppen_classification), ())
+    return catalogue.cycles_by_crop.get(crop_id, ())
 
 
 async def get_all_crop_cycles(
@@ -352,8 +335,8 @@ async def get_all_crop_cycles(
     pagination: Optional[PaginationParams] = None,
     crop_id: Optional[str] = None,
     koppen_classification: Optional[str] = None,
-) -> Sequence[CropCycle]:
-    """Get all crop cycles with optional filtering and pagination."""
+) -> Page[CropCycle]:
+    """Get a page of crop cycles with optional filtering, ordered by primary key."""
     query = select(CropCycle).options(
         selectinload(CropCycle.stages),
         selectinload(CropCycle.events).selectinload(CropCycleEvent.event),
@@ -366,13 +349,7 @@ async def get_all_crop_cycles(
     if koppen_classification:
         query = query.where(CropCycle.koppen_climate_classification == koppen_classification)
 
-    # Apply pagination
-    if pagination and pagination.limit_offset:
-        limit, offset = pagination.limit_offset
-        query = query.offset(offset).limit(limit)
-
-    result = await session.execute(query)
-    return result.scalars().all()
+    return await paginate(session, query, pagination, order_by=(CropCycle.id,))
 
 
 async def create_crop_cycle(
@@ -399,6 +376,7 @@ async def create_crop_cycle(
             session.add(event)
 
     await session.commit()
+    await catalogue_changed(session)
     await session.refresh(cycle)
     return cycle
 
@@ -449,6 +427,7 @@ async def update_crop_cycle(
             session.add(event)
 
     await session.commit()
+    await catalogue_changed(session)
     await session.refresh(cycle)
     return cycle
 
@@ -461,6 +440,7 @@ async def delete_crop_cycle(session: AsyncSession, cycle_id: int) -> bool:
 
     await session.delete(cycle)
     await session.commit()
+    await catalogue_changed(session)
     return True
 
 
@@ -485,21 +465,24 @@ async def get_crop_cycle_events_by_time_range(
     cycle_id: int,
     start_day: Optional[int] = None,
     end_day: Optional[int] = None,
-) -> Sequence[CropCycleEvent]:
-    """Get crop cycle events within a specific time range."""
-    query = (
-        select(CropCycleEvent)
-        .options(selectinload(CropCycleEvent.event))
-        .where(CropCycleEvent.crop_cycle_id == cycle_id)
-    )
-
-    if start_day is not None:
-        query = query.where(CropCycleEvent.end_day >= start_day)
-    if end_day is not None:
-        query = query.where(CropCycleEvent.start_day <= end_day)
-
-    result = await session.execute(query.order_by(CropCycleEvent.start_day))
-    return result.scalars().all()
+) -> Sequence[CropCycleEventRead]:
+    """Get crop cycle events overlapping a time range, ordered by start day."""
+    catalogue = await agronomy_catalogue.get(session)
+    index = catalogue.cycle_event_intervals.get(cycle_id)
+    if index is None:
+        return ()
+    return index.overlapping(start_day, end_day)
+
+
+async def get_active_crop_cycle_events(
+    session: AsyncSession, cycle_id: int, day: int
+) -> Optional[Sequence[CropCycleEventRead]]:
+    """Get the crop cycle events active on a day from planting, or None if the crop cycle does not exist."""
+    catalogue = await agronomy_catalogue.get(session)
+    index = catalogue.cycle_event_intervals.get(cycle_id)
+    if index is None:
+        return None
+    return index.at(day)
 
 
 # ————————————————————————————————————————
@@ -520,53 +503,58 @@ async def get_crop_cycle_stages_for_crop_cycle(session: AsyncSession, cycle_id:
 # ————————————————————————————————————————
 
 
+async def catalogue_changed(session: AsyncSession) -> None:
+    """Moves the catalogue version on and refreshes the aggregate views after a committed write."""
+    # the version is bumped only once the write is committed, as sequences are not transactional
+    # and other processes would otherwise reload the catalogue before the write is visible
+    await bump_catalogue_version(session)
+    await session.commit()
+    agronomy_catalogue.invalidate()
+
+    # the write is committed, so stale aggregates are logged rather than failing the request;
+    # the views are created first for databases set up before they existed
+    try:
+        await session.run_sync(create_aggregate_views)
+        await session.run_sync(refresh_aggregate_views)
+        await session.commit()
+    except Exception as e:
+        await session.rollback()
+        logger.error(f"Failed to refresh the agronomy aggregate views: {e}")
+
+
 async def count_pathogens_by_class(session: AsyncSession) -> dict:
-    """Get count of pathogens by class."""
+    """Get count of activated pathogens by class."""
     result = await session.execute(
-        select(Pathogen.pathogen_class, func.count(Pathogen.id))
-        .where(Pathogen.is_activated)
-        .group_by(Pathogen.pathogen_class)
+        select(category_count.c.category, category_count.c.count).where(category_count.c.dimension == "pathogen_class")
     )
-    rows = result.all()
-
-    return {pathogen_class: count for pathogen_class, count in rows}
+    return {PathogenClass(category): count for category, count in result.all()}
 
 
 async def count_events_by_category(session: AsyncSession) -> dict:
     """Get count of events by category."""
-    result = await session.execute(select(Event.event_category, func.count(Event.id)).group_by(Event.event_category))
-    rows = result.all()
-
-    return {category: count for category, count in rows}
+    result = await session.execute(
+        select(category_count.c.category, category_count.c.count).where(category_count.c.dimension == "event_category")
+    )
+    return {EventCategory(category): count for category, count in result.all()}
 
 
 async def get_crop_summary(session: AsyncSession, crop_id: str) -> dict:
-    """Get a summary of data related to a crop."""
-    crop = await session.get(Crop, crop_id)
-    if not crop:
-        return {}
-
-    # Count pathogens
-    pathogen_result = await session.execute(
-        select(func.count(Pathogen.id.distinct()))
-        .join(pathogen_crop_association)
-        .where(pathogen_crop_association.c.crop_id == crop_id)
-        .where(Pathogen.is_activated)
-    )
-    pathogen_count = pathogen_result.scalar()
-
-    # Count events
-    event_result = await session.execute(
-        select(func.count(Event.id.distinct()))
-        .join(event_crop_association)
-        .where(event_crop_association.c.crop_id == crop_id)
+    """Get a summary of data related to a crop from the crop_summary aggregate view."""
+    result = await session.execute(
+        select(
+            Crop,
+            func.coalesce(crop_summary.c.pathogen_count, 0),
+            func.coalesce(crop_summary.c.event_count, 0),
+            func.coalesce(crop_summary.c.cycle_count, 0),
+        )
+        .outerjoin(crop_summary, crop_summary.c.crop_id == Crop.host_id)
+        .where(Crop.host_id == crop_id)
     )
-    event_count = event_result.scalar()
-
-    # Count cycles
-    cycle_result = await session.execute(select(func.count(CropCycle.id)).where(CropCycle.crop_id == crop_id))
-    cycle_count = cycle_result.scalar()
+    row = result.one_or_none()
+    if not row:
+        return {}
 
+    crop, pathogen_count, event_count, cycle_count = row
     return {
         "crop": crop,
         "pathogen_count": pathogen_count,
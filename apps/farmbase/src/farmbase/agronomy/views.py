@@ -40,6 +40,7 @@ from farmbase.agronomy.service import (
     delete_crop_cycle,
     delete_event,
     delete_pathogen,
+    get_active_crop_cycle_events,
     get_all_crop_cycles,
     get_all_crops,
     get_all_events,
@@ -68,7 +69,7 @@ from farmbase.agronomy.service import (
     update_pathogen,
 )
 from farmbase.database.core import DbSession
-from farmbase.models import PaginationParams
+from farmbase.models import CursorPaginationParams
 
 router = APIRouter()
 
@@ -81,12 +82,12 @@ router = APIRouter()
 @router.get("/crops", response_model=CropPagination)
 async def list_crops(
     session: DbSession,
-    pagination: PaginationParams = Depends(),
+    pagination: CursorPaginationParams = Depends(),
     cultivation_type: Optional[str] = Query(None, description="Filter by cultivation type"),
     labor_level: Optional[str] = Query(None, description="Filter by labor level"),
 ) -> CropPagination:
-    """Get all crops with optional filtering and pagination."""
-    crops = await get_all_crops(
+    """Get crops with optional filtering, paginated by page number or by `cursor`."""
+    page = await get_all_crops(
         session=session,
         pagination=pagination,
         cultivation_type=cultivation_type,
@@ -94,10 +95,12 @@ async def list_crops(
     )
 
     return CropPagination(
-        items=[CropRead.model_validate(crop) for crop in crops],
+        items=[CropRead.model_validate(crop) for crop in page.items],
         page=pagination.page,
         items_per_page=pagination.items_per_page,
-        total=len(crops),  # TODO: Implement proper count
+        total=page.total,
+        total_is_estimate=page.total_is_estimate,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -107,7 +110,7 @@ async def get_crop_detail(session: DbSession, crop_id: str) -> CropRead:
     crop = await get_crop(session, crop_id)
     if not crop:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Crop with ID '{crop_id}' not found")
-    return CropRead.model_validate(crop)
+    return crop
 
 
 @router.post("/crops", response_model=CropRead, status_code=status.HTTP_201_CREATED)
@@ -151,14 +154,14 @@ async def get_crop_summary_info(session: DbSession, crop_id: str) -> dict:
 @router.get("/pathogens", response_model=PathogenPagination)
 async def list_pathogens(
     session: DbSession,
-    pagination: PaginationParams = Depends(),
+    pagination: CursorPaginationParams = Depends(),
     pathogen_class: Optional[PathogenClass] = Query(None, description="Filter by pathogen class"),
     severity: Optional[int] = Query(None, description="Filter by severity level"),
     crop_id: Optional[str] = Query(None, description="Filter by affected crop"),
     is_activated: bool = Query(True, description="Filter by activation status"),
 ) -> PathogenPagination:
-    """Get all pathogens with optional filtering and pagination."""
-    pathogens = await get_all_pathogens(
+    """Get pathogens with optional filtering, paginated by page number or by `cursor`."""
+    page = await get_all_pathogens(
         session=session,
         pagination=pagination,
         pathogen_class=pathogen_class,
@@ -168,10 +171,12 @@ async def list_pathogens(
     )
 
     return PathogenPagination(
-        items=[PathogenRead.model_validate(pathogen) for pathogen in pathogens],
+        items=[PathogenRead.model_validate(pathogen) for pathogen in page.items],
         page=pagination.page,
         items_per_page=pagination.items_per_page,
-        total=len(pathogens),  # TODO: Implement proper count
+        total=page.total,
+        total_is_estimate=page.total_is_estimate,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -200,7 +205,7 @@ async def search_pathogens_for_crop(
     )
 
     return PathogenSearchResponse(
-        pathogens=[PathogenRead.model_validate(p) for p in pathogens],
+        pathogens=list(pathogens),
         total_count=len(pathogens),
         search_filters=SearchFilters(
             crop_id=crop_id,
@@ -246,13 +251,13 @@ async def delete_existing_pathogen(session: DbSession, pathogen_id: int) -> None
 @router.get("/events", response_model=EventPagination)
 async def list_events(
     session: DbSession,
-    pagination: PaginationParams = Depends(),
+    pagination: CursorPaginationParams = Depends(),
     event_category: Optional[EventCategory] = Query(None, description="Filter by event category"),
     crop_id: Optional[str] = Query(None, description="Filter by crop"),
     importance: Optional[int] = Query(None, ge=1, le=4, description="Filter by importance level"),
 ) -> EventPagination:
-    """Get all events with optional filtering and pagination."""
-    events = await get_all_events(
+    """Get events with optional filtering, paginated by page number or by `cursor`."""
+    page = await get_all_events(
         session=session,
         pagination=pagination,
         event_category=event_category,
@@ -261,10 +266,12 @@ async def list_events(
     )
 
     return EventPagination(
-        items=[EventRead.model_validate(event) for event in events],
+        items=[EventRead.model_validate(event) for event in page.items],
         page=pagination.page,
         items_per_page=pagination.items_per_page,
-        total=len(events),  # TODO: Implement proper count
+        total=page.total,
+        total_is_estimate=page.total_is_estimate,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -295,7 +302,7 @@ async def get_events_for_crop_endpoint(
     )
 
     return EventSearchResponse(
-        events=[EventRead.model_validate(event) for event in events],
+        events=list(events),
         total_count=len(events),
         search_filters=SearchFilters(
             crop_id=crop_id,
@@ -356,12 +363,12 @@ async def delete_existing_event(session: DbSession, event_id: str) -> None:
 @router.get("/crop-cycles", response_model=CropCyclePagination)
 async def list_crop_cycles(
     session: DbSession,
-    pagination: PaginationParams = Depends(),
+    pagination: CursorPaginationParams = Depends(),
     crop_id: Optional[str] = Query(None, description="Filter by crop ID"),
     koppen_classification: Optional[str] = Query(None, description="Filter by Köppen climate classification"),
 ) -> CropCyclePagination:
-    """Get all crop cycles with optional filtering and pagination."""
-    cycles = await get_all_crop_cycles(
+    """Get crop cycles with optional filtering, paginated by page number or by `cursor`."""
+    page = await get_all_crop_cycles(
         session=session,
         pagination=pagination,
         crop_id=crop_id,
@@ -369,10 +376,12 @@ async def list_crop_cycles(
     )
 
     return CropCyclePagination(
-        items=[CropCycleRead.model_validate(cycle) for cycle in cycles],
+        items=[CropCycleRead.model_validate(cycle) for cycle in page.items],
         page=pagination.page,
         items_per_page=pagination.items_per_page,
-        total=len(cycles),  # TODO: Implement proper count
+        total=page.total,
+        total_is_estimate=page.total_is_estimate,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -392,8 +401,7 @@ async def get_crop_cycles_for_crop_endpoint(
     koppen_classification: Optional[str] = Query(None, description="Filter by Köppen climate classification"),
 ) -> List[CropCycleRead]:
     """Get all crop cycles for a specific crop."""
-    cycles = await get_crop_cycles_for_crop(session, crop_id, koppen_classification)
-    return [CropCycleRead.model_validate(cycle) for cycle in cycles]
+    return list(await get_crop_cycles_for_crop(session, crop_id, koppen_classification))
 
 
 @router.post("/crop-cycles", response_model=CropCycleRead, status_code=status.HTTP_201_CREATED)
@@ -463,6 +471,19 @@ async def get_crop_cycle_events_by_time(
     return [CropCycleEventRead.model_validate(event) for event in events]
 
 
+@router.get("/crop-cycles/{cycle_id}/events/active", response_model=List[CropCycleEventRead])
+async def get_active_crop_cycle_events_endpoint(
+    session: DbSession,
+    cycle_id: int,
+    day: int = Query(..., ge=0, description="Day from planting"),
+) -> List[CropCycleEventRead]:
+    """Get the crop cycle events active on a given day from planting."""
+    events = await get_active_crop_cycle_events(session, cycle_id, day)
+    if events is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Crop cycle with ID '{cycle_id}' not found")
+    return list(events)
+
+
 # ————————————————————————————————————————
 # Crop Cycle Stages Endpoints
 # ————————————————————————————————————————
@@ -1,15 +1,20 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
 
 from farmbase.agronomy.views import router as agronomy_router
-from farmbase.auth import authenticate_user_or_machine
+from farmbase.auth import authenticate_user_or_machine, require_machine
 from farmbase.commodity.views import router as commodity_router
 from farmbase.contact.views import router as contact_router
 from farmbase.data.crops.views import router as crops_router
+from farmbase.data.datasets import dataset_registry
 from farmbase.data.gaez.views import router as gaez_router
+from farmbase.database.tenant import tenant_registry
 from farmbase.farm.note.views import router as note_router
 from farmbase.farm.views import router as farm_router
+from farmbase.geospatial.views import router as geospatial_router
 from farmbase.market.views import price_router
 from farmbase.market.views import router as market_router
+from farmbase.metrics.views import router as metrics_router
 from farmbase.models import OrganizationSlug
 from farmbase.organization.views import router as organization_router
 from farmbase.products.views import router as products_router
@@ -31,6 +36,7 @@ authenticated_organization_api_router = APIRouter(
 
 authenticated_api_router.include_router(gaez_router, prefix="/gaez", tags=["gaez"])
 authenticated_api_router.include_router(crops_router, prefix="/crop-varieties", tags=["crop-varieties"])
+authenticated_api_router.include_router(geospatial_router, prefix="/regions", tags=["regions"])
 authenticated_api_router.include_router(agronomy_router, prefix="/agronomy", tags=["agronomy"])
 
 # NOTE: All api routes should be authenticated by default
@@ -47,6 +53,10 @@ authenticated_organization_api_router.include_router(workflow_router, prefix="/w
 authenticated_api_router.include_router(commodity_router, prefix="/commodities", tags=["commodities"])
 authenticated_api_router.include_router(market_router, prefix="/markets", tags=["markets"])
 authenticated_api_router.include_router(price_router, prefix="/market_prices", tags=["market_prices"])
+# global query instrumentation and per-statement SQL are for operators, not for every authenticated user
+authenticated_api_router.include_router(
+    metrics_router, prefix="/metrics", tags=["metrics"], dependencies=[Depends(require_machine)]
+)
 
 
 @api_router.get("/healthcheck", include_in_schema=False)
@@ -54,6 +64,20 @@ def healthcheck():
     return {"status": "ok"}
 
 
+@api_router.get("/healthcheck/tenants", include_in_schema=False)
+def tenant_registry_stats():
+    return tenant_registry.stats()
+
+
+@api_router.get("/healthcheck/datasets", include_in_schema=False)
+def dataset_readiness():
+    stats = dataset_registry.stats()
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if stats["ready"] else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=stats,
+    )
+
+
 api_router.include_router(authenticated_organization_api_router)
 
 api_router.include_router(authenticated_api_router)
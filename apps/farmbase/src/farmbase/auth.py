@@ -1,19 +1,36 @@
+import functools
+from typing import Optional
+
 from fastapi import Depends, HTTPException, Security
-from fastapi.security import APIKeyHeader
+from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBearer
 from loguru import logger
-from propelauth_fastapi import init_auth
-from starlette.status import HTTP_401_UNAUTHORIZED
+from starlette.status import HTTP_401_UNAUTHORIZED, HTTP_403_FORBIDDEN
 
 from farmbase.config import settings
 
-logger.debug("initialising auth")
-auth = init_auth(
-    "https://6366051.propelauthtest.com",
-    "55d4e0fdd0fc9dd65350587b34d5a25982781c1e7eea7b826469337db8f912140473230a1b5a3c6ca37acb21d0ef25fb",
-    debug_mode=True,
-    log_exceptions=True,
-)
-logger.debug("finished initialising auth")
+
+@functools.lru_cache(maxsize=1)
+def get_auth():
+    """Initialises PropelAuth on first use; this fetches the token verification metadata over the network."""
+    from propelauth_fastapi import init_auth
+
+    logger.debug("initialising auth")
+    auth = init_auth(
+        "https://6366051.propelauthtest.com",
+        "55d4e0fdd0fc9dd65350587b34d5a25982781c1e7eea7b826469337db8f912140473230a1b5a3c6ca37acb21d0ef25fb",
+        debug_mode=True,
+        log_exceptions=True,
+    )
+    logger.debug("finished initialising auth")
+    return auth
+
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+def optional_user(credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)):
+    return get_auth().optional_user(credentials)
+
 
 # API Key - For machine auth
 api_key_scheme = APIKeyHeader(name="X-Farmbase-Key", auto_error=False)
@@ -28,10 +45,17 @@ def verify_api_key(api_key: str = Security(api_key_scheme)):
 # Composite dependency: Accept either
 def authenticate_user_or_machine(
     api_key_result=Depends(verify_api_key),
-    user=Depends(auth.optional_user),
+    user=Depends(optional_user),
 ):
     if user:
         return user
     if api_key_result:
         return api_key_result
     raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+
+
+# Operator endpoints: only the machine API key, not user tokens
+def require_machine(api_key_result=Depends(verify_api_key)):
+    if api_key_result:
+        return api_key_result
+    raise HTTPException(status_code=HTTP_403_FORBIDDEN, detail="Not allowed")
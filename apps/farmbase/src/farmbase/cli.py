@@ -26,10 +26,10 @@ def list_plugins():
     """Shows all available plugins."""
     from tabulate import tabulate
 
-    from farmbase.database.core import SessionLocal
+    from farmbase.database.core import get_tenant_sync_session_factory
     from farmbase.plugin import service as plugin_service
 
-    db_session = SessionLocal()
+    db_session = get_tenant_sync_session_factory("default")()
     table = []
     for record in plugin_service.get_all(db_session=db_session):
         table.append(
@@ -69,14 +69,14 @@ def list_plugins():
 def install_plugins(force):
     """Installs all plugins, or only one."""
     from farmbase.common.utils.cli import install_plugins
-    from farmbase.database.core import SessionLocal
+    from farmbase.database.core import get_tenant_sync_session_factory
     from farmbase.plugin import service as plugin_service
     from farmbase.plugin.models import Plugin, PluginEvent
     from farmbase.plugins.base import plugins
 
     install_plugins()
 
-    db_session = SessionLocal()
+    db_session = get_tenant_sync_session_factory("default")()
     for p in plugins.all():
         record = plugin_service.get_by_slug(db_session=db_session, slug=p.slug)
         if not record:
@@ -128,10 +128,10 @@ def install_plugins(force):
 @click.argument("plugins", nargs=-1)
 def uninstall_plugins(plugins):
     """Uninstalls all plugins, or only one."""
-    from farmbase.database.core import SessionLocal
+    from farmbase.database.core import get_tenant_sync_session_factory
     from farmbase.plugin import service as plugin_service
 
-    db_session = SessionLocal()
+    db_session = get_tenant_sync_session_factory("default")()
 
     for plugin_slug in plugins:
         plugin = plugin_service.get_by_slug(db_session=db_session, slug=plugin_slug)
@@ -154,10 +154,62 @@ def farmbase_database():
 def database_init():
     """Initializes a new database."""
     click.echo("Initializing new database...")
-    from .database.core import engine_sync as engine
+    from .database.core import get_sync_engine
     from .database.manage import init_database
 
-    init_database(engine)
+    init_database(get_sync_engine())
+    click.secho("Success.", fg="green")
+
+
+@farmbase_database.command("refresh-aggregates")
+@click.option(
+    "--concurrently/--blocking",
+    default=True,
+    help="Refresh without locking out readers of the views (requires the views to be populated).",
+)
+def refresh_aggregates(concurrently):
+    """Creates missing aggregate views and recomputes them."""
+    from .agronomy.aggregates import create_aggregate_views, refresh_aggregate_views
+    from .database.core import get_sync_engine
+
+    click.echo("Refreshing aggregate views...")
+    with get_sync_engine().begin() as conn:
+        create_aggregate_views(conn)
+        refresh_aggregate_views(conn, concurrently=concurrently)
+    click.secho("Success.", fg="green")
+
+
+@farmbase_database.command("compute-region-suitability")
+def compute_region_suitability():
+    """Computes the GAEZ zonal statistics of every subregion."""
+    from sqlalchemy.orm import Session
+
+    from .data.gaez.views import get_aez_raster, get_class_map, get_growing_period_raster, get_suitability_raster
+    from .database.core import get_sync_engine
+    from .geospatial.zonal import refresh_subregion_suitability
+
+    click.echo("Computing subregion suitability statistics...")
+    with Session(get_sync_engine()) as session:
+        count = refresh_subregion_suitability(
+            session,
+            aez=get_aez_raster(),
+            class_map=get_class_map(),
+            growing_period=get_growing_period_raster(),
+            suitability=get_suitability_raster(),
+        )
+        session.commit()
+    click.secho(f"Success, computed {count} subregions.", fg="green")
+
+
+@farmbase_database.command("refresh-latest-prices")
+def refresh_latest_market_prices():
+    """Rebuilds the latest price of every commodity at every market."""
+    from .database.core import get_sync_engine
+    from .market.latest import refresh_latest_prices
+
+    click.echo("Refreshing latest market prices...")
+    with get_sync_engine().begin() as conn:
+        refresh_latest_prices(conn)
     click.secho("Success.", fg="green")
 
 
@@ -278,7 +330,7 @@ def upgrade_database(tag, sql, revision, revision_type):
     from alembic.config import Config as AlembicConfig
     from sqlalchemy_utils import database_exists
 
-    from .database.core import engine_sync as engine
+    from .database.core import get_sync_engine
     from .database.manage import init_database
 
     alembic_cfg = AlembicConfig(settings.ALEMBIC_INI_PATH)
@@ -286,7 +338,7 @@ def upgrade_database(tag, sql, revision, revision_type):
     # importlib.import_module(".contact.models.Contact")
     if not database_exists(str(settings.sqlalchemy_database_sync_uri)):
         click.secho("Found no database to upgrade, initializing new database...")
-        init_database(engine)
+        init_database(get_sync_engine())
     else:
         if revision_type:
             if revision_type == "core":
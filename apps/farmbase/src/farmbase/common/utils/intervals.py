@@ -0,0 +1,135 @@
+import bisect
+import math
+from typing import Callable, Generic, Iterable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# (start, end, position, item)
+_Entry = tuple[float, float, int, T]
+
+
+class _Node(Generic[T]):
+    __slots__ = ("center", "by_start", "by_end", "left", "right")
+
+    def __init__(self, center: float, overlapping: list[_Entry]):
+        self.center = center
+        # the intervals containing the center, ascending by start and descending by end
+        self.by_start = sorted(overlapping, key=lambda entry: (entry[0], entry[2]))
+        self.by_end = sorted(overlapping, key=lambda entry: -entry[1])
+        self.left: Optional[_Node[T]] = None
+        self.right: Optional[_Node[T]] = None
+
+
+def _build(entries: list[_Entry]) -> Optional[_Node]:
+    """Builds a centered interval tree from entries sorted by start."""
+    if not entries:
+        return None
+    center = entries[len(entries) // 2][0]
+    left, overlapping, right = [], [], []
+    for entry in entries:
+        if entry[1] < center:
+            left.append(entry)
+        elif entry[0] > center:
+            right.append(entry)
+        else:
+            overlapping.append(entry)
+    node = _Node(center, overlapping)
+    node.left = _build(left)
+    node.right = _build(right)
+    return node
+
+
+class IntervalIndex(Generic[T]):
+    """Static index over items spanning closed [start, end] intervals, such as crop cycle events
+    spanning days from planting.
+
+    A centered interval tree: finding the k items active at a point, or overlapping a range, costs
+    O(log n + k) rather than a scan of every item. Results are ordered by start, ties in the order
+    the items were given.
+
+    Items with a missing bound or with start after end cannot be placed in the tree; they are kept
+    aside and matched the way the equivalent SQL comparisons would match them (a comparison with a
+    missing bound is false), and are returned after the others when their start is missing.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[T],
+        start: Callable[[T], Optional[float]],
+        end: Callable[[T], Optional[float]],
+    ):
+        entries, irregular = [], []
+        for position, item in enumerate(items):
+            entry = (start(item), end(item), position, item)
+            if entry[0] is None or entry[1] is None or entry[0] > entry[1]:
+                irregular.append(entry)
+            else:
+                entries.append(entry)
+        entries.sort(key=lambda entry: (entry[0], entry[2]))
+        self._entries = entries
+        self._starts = [entry[0] for entry in entries]
+        self._irregular = irregular
+        self._root = _build(entries)
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._irregular)
+
+    @staticmethod
+    def _ordered(found: list[_Entry]) -> list[T]:
+        found.sort(key=lambda entry: (entry[0] is None, entry[0] or 0, entry[2]))
+        return [entry[3] for entry in found]
+
+    def _search(self, low: float, high: float) -> list[_Entry]:
+        """Returns the tree entries overlapping [low, high], for low <= high."""
+        found: list[_Entry] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            if high < node.center:
+                # every interval here ends at or after the center, so only its start can exclude it
+                for entry in node.by_start:
+                    if entry[0] > high:
+                        break
+                    found.append(entry)
+                stack.append(node.left)
+            elif low > node.center:
+                for entry in node.by_end:
+                    if entry[1] < low:
+                        break
+                    found.append(entry)
+                stack.append(node.right)
+            else:
+                found.extend(node.by_start)
+                stack.append(node.left)
+                stack.append(node.right)
+        return found
+
+    def overlapping(self, low: Optional[float] = None, high: Optional[float] = None) -> list[T]:
+        """Returns the items with end >= low and start <= high; a missing bound is unbounded."""
+        found = [
+            entry
+            for entry in self._irregular
+            if (low is None or (entry[1] is not None and entry[1] >= low))
+            and (high is None or (entry[0] is not None and entry[0] <= high))
+        ]
+
+        low = -math.inf if low is None else low
+        high = math.inf if high is None else high
+        if low <= high:
+            found += self._search(low, high)
+        else:
+            # an inverted range matches the intervals that span all of [high, low]
+            found += [entry for entry in self._search(high, high) if entry[1] >= low]
+        return self._ordered(found)
+
+    def at(self, point: float) -> list[T]:
+        """Returns the items whose interval contains the point."""
+        return self.overlapping(point, point)
+
+    def starting_after(self, point: float) -> list[T]:
+        """Returns the items whose interval starts strictly after the point."""
+        found = self._entries[bisect.bisect_right(self._starts, point) :]
+        found += [entry for entry in self._irregular if entry[0] is not None and entry[0] > point]
+        return self._ordered(found)
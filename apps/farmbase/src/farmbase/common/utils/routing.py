@@ -0,0 +1,91 @@
+import re
+from typing import Iterable
+
+from starlette.convertors import CONVERTOR_TYPES
+from starlette.routing import PARAM_REGEX, compile_path
+
+
+class _Node:
+    __slots__ = ("static", "dynamic", "terminal")
+
+    def __init__(self):
+        self.static: dict[str, _Node] = {}
+        self.dynamic: dict[str, tuple[re.Pattern, _Node]] = {}
+        self.terminal: int | None = None
+
+
+def _compile_segment(segment: str) -> re.Pattern | None:
+    """Compiles a path segment containing parameters, or returns None if it can span several segments."""
+    pattern = "^"
+    idx = 0
+    for match in PARAM_REGEX.finditer(segment):
+        name, convertor_type = match.groups("str")
+        convertor_type = convertor_type.lstrip(":")
+        if convertor_type == "path":
+            return None
+        pattern += re.escape(segment[idx : match.start()])
+        pattern += f"(?P<{name}>{CONVERTOR_TYPES[convertor_type].regex})"
+        idx = match.end()
+    pattern += re.escape(segment[idx:]) + "$"
+    return re.compile(pattern)
+
+
+class RouteIndex:
+    """Segment trie over route paths, used to extract path params without scanning every route.
+
+    Matching walks the request path one segment at a time, so its cost depends on the path
+    length rather than on the number of routes. As with a linear scan over the routes, the
+    params of the last matching route win.
+    """
+
+    def __init__(self, paths: Iterable[str]):
+        self._root = _Node()
+        # routes that can't be split into segments (e.g. `{file:path}`) are matched by regex
+        self._fallback: list[tuple[int, re.Pattern]] = []
+        for index, path in enumerate(paths):
+            self._insert(index, path)
+
+    @classmethod
+    def from_routes(cls, routes) -> "RouteIndex":
+        return cls(r.path for r in routes)
+
+    def _insert(self, index: int, path: str) -> None:
+        node = self._root
+        for segment in path.split("/"):
+            if "{" not in segment:
+                node = node.static.setdefault(segment, _Node())
+                continue
+
+            pattern = _compile_segment(segment)
+            if pattern is None:
+                path_regex, _, _ = compile_path(path)
+                self._fallback.append((index, path_regex))
+                return
+
+            _, child = node.dynamic.setdefault(pattern.pattern, (pattern, _Node()))
+            node = child
+        node.terminal = index
+
+    def _match(self, node: _Node, segments: list[str], i: int) -> tuple[int, dict[str, str]] | None:
+        if i == len(segments):
+            return (node.terminal, {}) if node.terminal is not None else None
+
+        segment = segments[i]
+        best = None
+        if child := node.static.get(segment):
+            best = self._match(child, segments, i + 1)
+
+        for pattern, child in node.dynamic.values():
+            if match := pattern.match(segment):
+                result = self._match(child, segments, i + 1)
+                if result is not None and (best is None or result[0] > best[0]):
+                    best = (result[0], {**match.groupdict(), **result[1]})
+        return best
+
+    def match(self, path: str) -> dict[str, str]:
+        """Returns the path params of the last route matching the path."""
+        best = self._match(self._root, path.split("/"), 0)
+        for index, path_regex in self._fallback:
+            if (best is None or index > best[0]) and (match := path_regex.match(path)):
+                best = (index, match.groupdict())
+        return best[1] if best is not None else {}
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from typing import Any, Optional
 from urllib import parse
 
@@ -46,6 +47,45 @@ class Settings(BaseSettings):
     DATABASE_ENGINE_POOL_RECYCLE: int = 3600
     DATABASE_ENGINE_POOL_SIZE: int = 20
     DATABASE_ENGINE_POOL_TIMEOUT: int = 30
+    DATABASE_ENGINE_ECHO: bool = False
+    DATABASE_SESSION_LOG_SAMPLE_RATE: float = 0.01
+    DATABASE_QUERY_INSTRUMENTATION_ENABLED: bool = True
+    DATABASE_SLOW_QUERY_THRESHOLD: float = 0.5
+
+    # --- Data ---
+    # object storage holding the datasets: a gs:// bucket, memory:// or a local directory
+    DATA_STORAGE_URL: str = "gs://farmbase_data"
+    # byte ranges of dataset objects downloaded at a time
+    DATA_DOWNLOAD_CONCURRENCY: int = 16
+    # local cache of datasets downloaded from GCS, such as the GAEZ rasters
+    DATA_CACHE_DIR: str = os.path.join(tempfile.gettempdir(), "farmbase-data")
+    # load the datasets behind the data endpoints in the background at startup
+    DATASET_WARMUP_ENABLED: bool = True
+    # seconds clients are asked to wait while a dataset is loading, and between retries of a failed load
+    DATASET_RETRY_AFTER: int = 30
+    DATASET_LOAD_RETRY_INTERVAL: int = 60
+
+    # --- Agronomy ---
+    # how often the cached agronomy catalogue checks whether its version is still current
+    AGRONOMY_CATALOGUE_VERSION_CHECK_INTERVAL: int = 30
+
+    # --- Pagination ---
+    # unfiltered list counts over tables with more rows than this use the planner's estimate
+    PAGINATION_ESTIMATED_COUNT_THRESHOLD: int = 100_000
+
+    # --- Market price signals ---
+    # signals are cached per market, commodity and day for this many seconds, for this many market days
+    MARKET_SIGNALS_TTL: int = 3600
+    MARKET_SIGNALS_CACHE_SIZE: int = 4096
+    # radius of the cross-market price spread
+    MARKET_SIGNALS_DISTANCE_KM: int = 50
+
+    # --- Metrics ---
+    METRICS_ENABLED: bool = True
+
+    # --- Tenants ---
+    TENANT_REGISTRY_TTL: int = 300
+    TENANT_REGISTRY_MISS_REFRESH_INTERVAL: int = 10
 
     # Pydantic will automatically read the environment variable
     # 'GOOGLE_APPLICATION_CREDENTIALS' into this attribute.
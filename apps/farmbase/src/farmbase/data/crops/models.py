@@ -1,6 +1,9 @@
-from typing import List
+from typing import List, Optional, Self
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
+
+# the most (altitude, growing period) pairs a single batch request may filter for
+MAX_BATCH_QUERIES = 10_000
 
 
 class CropVarietyResponse(BaseModel):
@@ -18,3 +21,23 @@ class CropVarietyResponse(BaseModel):
 class CropVarietiesResponse(BaseModel):
     crop: str
     varieties: List[CropVarietyResponse]
+
+
+class VarietyQueryBatch(BaseModel):
+    """A batch of variety queries as two parallel columns, either value of a pair may be null."""
+
+    altitude: List[Optional[float]] = Field(max_length=MAX_BATCH_QUERIES, description="Altitudes in metres")
+    growing_period: List[Optional[int]] = Field(max_length=MAX_BATCH_QUERIES, description="Growing periods in days")
+
+    @model_validator(mode="after")
+    def check_columns(self) -> Self:
+        if len(self.altitude) != len(self.growing_period):
+            raise ValueError("altitude and growing_period must have the same length")
+        return self
+
+
+class CropVarietiesBatchResponse(BaseModel):
+    crop: str
+    varieties: List[CropVarietyResponse]
+    # for each query, the positions in varieties of the varieties suited to it
+    matches: List[List[int]]
@@ -0,0 +1,155 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from farmbase.data.crops.models import CropVarietyResponse
+from farmbase.data.storage import open_object, storage_url
+
+# maturity categories from the shortest to the longest growing period
+MATURITY_CATEGORIES = ("Extremely early", "Early", "Intermediate", "Late", "Very late")
+
+
+def maize_maturity_category(growing_season_days: float | int | None) -> str | None:
+    """
+    Return the maturity category for a maize variety, given its growing-season
+    length in days.
+
+    Categories & thresholds (inclusive):
+        •  76–85  → “Extremely early”
+        •  86–112 → “Early”
+        • 113–129 → “Intermediate”
+        • 130–145 → “Late”
+        • ≥150    → “Very late”
+
+    Parameters
+    ----------
+    growing_season_days : float | int | None
+        Mean number of days from planting to physiological maturity.
+
+    Returns
+    -------
+    str | None
+        The matching category, or `None` if the input is missing or out of range.
+    """
+    if growing_season_days is None:
+        return None
+
+    d = float(growing_season_days)
+
+    if 76 <= d <= 85:
+        return "Extremely early"
+    elif 86 <= d <= 112:
+        return "Early"
+    elif 113 <= d <= 129:
+        return "Intermediate"
+    elif 130 <= d <= 145:
+        return "Late"
+    elif d >= 150:
+        return "Very late"
+    else:
+        # catches values < 76 or any negative / nonsensical input
+        return None
+
+
+@dataclass(frozen=True)
+class VarietySource:
+    path: str
+    # maps a growing period in days to the shortest suitable maturity category, None when unknown
+    maturity_category: Callable[[float | int | None], str | None]
+
+
+# crop variety tables, by crop
+VARIETY_SOURCES = {
+    "maize": VarietySource(storage_url("maize/maize_varieties.csv"), maize_maturity_category),
+}
+
+
+class VarietyTable:
+    """The varieties of a crop held as typed NumPy columns, for selection by altitude and growing period.
+
+    The altitude ranges are indexed by sorting on their lower bound, so the varieties that can grow at
+    an altitude are a prefix of that order found by binary search, filtered on the upper bound. Maturity
+    categories are encoded as their position in MATURITY_CATEGORIES (-1 if unknown), so "this category
+    or a longer one" is a single comparison. Queries return positions in the table, in source order, and
+    the response records are built once when the table is loaded.
+    """
+
+    def __init__(self, crop: str, frame: pd.DataFrame, maturity_category: Callable[[float | int | None], str | None]):
+        self.crop = crop
+        self.maturity_category = maturity_category
+        self.varieties = tuple(CropVarietyResponse(**record) for record in frame.to_dict("records"))
+
+        min_altitude = pd.to_numeric(frame["min_altitude_masl"], errors="coerce").to_numpy(np.float64)
+        max_altitude = pd.to_numeric(frame["max_altitude_masl"], errors="coerce").to_numpy(np.float64)
+        maturity = frame["maturity_category"].map({c: i for i, c in enumerate(MATURITY_CATEGORIES)})
+        self.maturity = maturity.fillna(-1).to_numpy(np.int8)
+
+        # the altitude index, a missing lower bound sorts last and so never matches
+        self._order = np.argsort(min_altitude, kind="stable")
+        self._sorted_min_altitude = min_altitude[self._order]
+        self._sorted_max_altitude = max_altitude[self._order]
+        self._sorted_maturity = self.maturity[self._order]
+
+    def __len__(self) -> int:
+        return len(self.varieties)
+
+    def _maturity_rank(self, growing_period: float | int | None) -> int:
+        """The lowest suitable maturity position for a growing period, -1 to match every variety."""
+        category = self.maturity_category(growing_period)
+        return -1 if category is None else MATURITY_CATEGORIES.index(category)
+
+    def select(self, altitude: Optional[float] = None, growing_period: Optional[float] = None) -> np.ndarray:
+        """Returns the positions of the varieties suited to an altitude and a growing period, either
+        of which may be omitted."""
+        if altitude is None:
+            candidates = np.arange(len(self))
+            mask = np.ones(len(self), dtype=bool)
+            maturity = self.maturity
+        else:
+            end = np.searchsorted(self._sorted_min_altitude, altitude, side="right")
+            candidates = self._order[:end]
+            mask = self._sorted_max_altitude[:end] >= altitude
+            maturity = self._sorted_maturity[:end]
+
+        rank = self._maturity_rank(growing_period)
+        if rank >= 0:
+            mask &= maturity >= rank
+        return np.sort(candidates[mask])
+
+    def select_many(
+        self, altitudes: Sequence[Optional[float]], growing_periods: Sequence[Optional[float]]
+    ) -> list[np.ndarray]:
+        """`select` for many (altitude, growing period) pairs, computed as one mask over every pair."""
+        altitudes = np.array([np.nan if a is None else a for a in altitudes], dtype=np.float64)
+        # the maturity category of each distinct growing period is looked up once
+        periods = [None if p is None else float(p) for p in growing_periods]
+        ranks_by_period = {period: self._maturity_rank(period) for period in set(periods)}
+        ranks = np.array([ranks_by_period[period] for period in periods], dtype=np.int8)
+
+        no_altitude = np.isnan(altitudes)
+        ends = np.searchsorted(self._sorted_min_altitude, altitudes, side="right")
+        ends[no_altitude] = len(self)
+        # rows are pairs, columns are varieties in altitude index order
+        mask = np.arange(len(self)) < ends[:, None]
+        mask &= (self._sorted_max_altitude >= altitudes[:, None]) | no_altitude[:, None]
+        mask &= self._sorted_maturity >= ranks[:, None]
+        return [np.sort(self._order[row]) for row in mask]
+
+
+def load_variety_table(crop: str, source: VarietySource) -> VarietyTable:
+    with open_object(source.path) as f:
+        return VarietyTable(crop, pd.read_csv(f), source.maturity_category)
+
+
+@lru_cache(maxsize=None)
+def get_variety_table(crop: str) -> VarietyTable:
+    """
+    Loads the variety table of a crop from the dataset storage.
+    This function is cached, so it only runs once per crop.
+    """
+    logger.info(f"Loading and caching {crop} variety data")
+    return load_variety_table(crop, VARIETY_SOURCES[crop])
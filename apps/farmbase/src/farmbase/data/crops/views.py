@@ -1,11 +1,13 @@
-from functools import lru_cache
+from functools import partial
 from typing import Any
 
-import pandas as pd
-from fastapi import APIRouter
-from loguru import logger
+import numpy as np
+from fastapi import APIRouter, Depends
 
-from farmbase.data.crops.models import CropVarietiesResponse, CropVarietyResponse
+from farmbase.data.crops.models import CropVarietiesBatchResponse, CropVarietiesResponse, VarietyQueryBatch
+from farmbase.data.crops.varieties import VARIETY_SOURCES, get_variety_table
+from farmbase.data.datasets import dataset_registry
+from farmbase.exceptions.exceptions import EntityDoesNotExistError
 
 router = APIRouter()
 
@@ -18,101 +20,57 @@ router = APIRouter()
 # suitability_df = pd.read_pickle("farmbase/data/kalro/suitability.pkl")
 
 
-@lru_cache(maxsize=None)
-def get_maize_data():
-    """
-    Loads the growing period raster from GCS.
-    This function is cached, so it only runs once.
-    """
-    logger.info("Loading and caching maize variety data")
-    maize_df = pd.read_csv("gs://farmbase_data/maize/maize_varieties.csv")
-    return maize_df
-
-
-@router.get("/maize", response_model=CropVarietiesResponse)
-def get_maize_varieties(altitude: float = None, growing_period: int = None) -> Any:
-    """
-    Filters and returns maize varieties based on optional altitude and growing period criteria.
-    """
-    maize_df = get_maize_data()
+dataset_registry.register_many({f"crops.{crop}": partial(get_variety_table, crop) for crop in VARIETY_SOURCES})
 
-    # Start with the full dataframe, which will be progressively filtered.
-    suitable_df = maize_df.copy()
 
-    # 1. Conditionally filter by altitude if a value is provided.
-    if altitude is not None:
-        suitable_df = suitable_df[
-            (suitable_df["min_altitude_masl"] <= altitude) & (suitable_df["max_altitude_masl"] >= altitude)
-        ]
+async def variety_table_ready(crop: str) -> None:
+    if crop not in VARIETY_SOURCES:
+        raise EntityDoesNotExistError(detail=f"No variety data for crop {crop}")
+    dataset_registry.check(f"crops.{crop}")
 
-    # 2. Conditionally filter by growing period if a value is provided.
-    if growing_period is not None:
-        maturity_category = maize_maturity_category(growing_period)
 
-        if maturity_category is not None:
-            # To correctly filter for varieties with a "greater or equal" maturity period,
-            # we define an explicit order for the categories.
-            category_order = ["Extremely early", "Early", "Intermediate", "Late", "Very late"]
+def select_varieties(crop: str, altitude: float = None, growing_period: int = None) -> CropVarietiesResponse:
+    table = get_variety_table(crop)
+    positions = table.select(altitude=altitude, growing_period=growing_period)
+    return CropVarietiesResponse(crop=crop, varieties=[table.varieties[i] for i in positions])
 
-            try:
-                # Find the position of the requested maturity category in the ordered list.
-                user_category_index = category_order.index(maturity_category)
 
-                # Identify all categories that are suitable (the requested one and all that take longer).
-                suitable_categories = category_order[user_category_index:]
-
-                # Filter the dataframe to include only varieties in the suitable categories.
-                suitable_df = suitable_df[suitable_df["maturity_category"].isin(suitable_categories)]
-            except ValueError:
-                # This handles cases where the calculated maturity_category is not in our defined order.
-                # In this scenario, we do not apply a maturity filter.
-                pass
+@router.get(
+    "/maize", response_model=CropVarietiesResponse, dependencies=[Depends(dataset_registry.require("crops.maize"))]
+)
+def get_maize_varieties(altitude: float = None, growing_period: int = None) -> Any:
+    """
+    Filters and returns maize varieties based on optional altitude and growing period criteria.
+    """
+    return select_varieties("maize", altitude=altitude, growing_period=growing_period)
 
-    varieties = [CropVarietyResponse(**row) for _, row in suitable_df.iterrows()]
 
-    return CropVarietiesResponse(crop="maize", varieties=varieties)
+@router.get("/{crop}", response_model=CropVarietiesResponse, dependencies=[Depends(variety_table_ready)])
+def get_crop_varieties(crop: str, altitude: float = None, growing_period: int = None) -> Any:
+    """
+    Filters and returns the varieties of a crop based on optional altitude and growing period criteria.
+    Varieties are suitable if the altitude is within their range and their maturity category is the
+    one of the growing period or a longer one.
+    """
+    return select_varieties(crop, altitude=altitude, growing_period=growing_period)
 
 
-def maize_maturity_category(growing_season_days: float | int | None) -> str | None:
+@router.post("/{crop}/batch", response_model=CropVarietiesBatchResponse, dependencies=[Depends(variety_table_ready)])
+def get_crop_varieties_batch(crop: str, queries: VarietyQueryBatch) -> Any:
     """
-    Return the maturity category for a maize variety, given its growing-season
-    length in days.
-
-    Categories & thresholds (inclusive):
-        •  76–85  → “Extremely early”
-        •  86–112 → “Early”
-        • 113–129 → “Intermediate”
-        • 130–145 → “Late”
-        • ≥150    → “Very late”
-
-    Parameters
-    ----------
-    growing_season_days : float | int | None
-        Mean number of days from planting to physiological maturity.
-
-    Returns
-    -------
-    str | None
-        The matching category, or `None` if the input is missing or out of range.
+    Filters the varieties of a crop for each of a batch of (altitude, growing period) pairs.
+    Each suitable variety is returned once, and `matches` holds the positions in `varieties` of the
+    varieties suited to each pair, in the order of the pairs.
     """
-    if growing_season_days is None:
-        return None
-
-    d = float(growing_season_days)
-
-    if 76 <= d <= 85:
-        return "Extremely early"
-    elif 86 <= d <= 112:
-        return "Early"
-    elif 113 <= d <= 129:
-        return "Intermediate"
-    elif 130 <= d <= 145:
-        return "Late"
-    elif d >= 150:
-        return "Very late"
-    else:
-        # catches values < 76 or any negative / nonsensical input
-        return None
+    table = get_variety_table(crop)
+    selections = table.select_many(queries.altitude, queries.growing_period)
+
+    positions = np.unique(np.concatenate(selections)) if selections else np.empty(0, dtype=np.intp)
+    return CropVarietiesBatchResponse(
+        crop=crop,
+        varieties=[table.varieties[i] for i in positions],
+        matches=[np.searchsorted(positions, selection).tolist() for selection in selections],
+    )
 
 
 #
@@ -0,0 +1,144 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Mapping, Optional
+
+from loguru import logger
+
+from farmbase.config import settings
+from farmbase.enums import FarmbaseEnum
+from farmbase.exceptions.exceptions import DatasetNotReadyError
+from farmbase.metrics import service as metrics_service
+
+
+class DatasetState(FarmbaseEnum):
+    PENDING = "pending"
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "failed"
+
+
+@dataclass
+class Dataset:
+    name: str
+    # cached loader, such as an lru_cache getter; once it has returned, later calls are free
+    loader: Callable[[], Any]
+    state: DatasetState = DatasetState.PENDING
+    error: Optional[str] = None
+    attempts: int = 0
+    load_seconds: Optional[float] = None
+
+    @property
+    def is_servable(self) -> bool:
+        """Whether requests may read the dataset: loaded, or never warmed up and so loaded on demand."""
+        return self.state in (DatasetState.READY, DatasetState.PENDING)
+
+
+class DatasetRegistry:
+    """Loads the reference datasets the data endpoints read, in the background at startup.
+
+    Each dataset is registered with its cached loader. `start` runs every loader concurrently in the
+    threadpool, retrying failed loads, so a cold instance downloads its datasets before they are asked
+    for rather than on the first request. While a load is under way, or after it failed, the endpoints
+    that depend on it answer 503 with Retry-After instead of blocking a worker on the download. Datasets
+    that were never warmed up, when the registry is not started, are loaded lazily by the first request.
+    """
+
+    def __init__(self, retry_after: int, retry_interval: float):
+        self.retry_after = retry_after
+        self.retry_interval = retry_interval
+        self._datasets: dict[str, Dataset] = {}
+        self._tasks: list[asyncio.Task] = []
+
+    def register(self, name: str, loader: Callable[[], Any]) -> None:
+        self._datasets[name] = Dataset(name=name, loader=loader)
+
+    def register_many(self, loaders: Mapping[str, Callable[[], Any]]) -> None:
+        for name, loader in loaders.items():
+            self.register(name, loader)
+
+    async def _load(self, dataset: Dataset) -> None:
+        while True:
+            dataset.attempts += 1
+            started = time.perf_counter()
+            try:
+                await asyncio.to_thread(dataset.loader)
+            except Exception as e:
+                dataset.state = DatasetState.FAILED
+                dataset.error = str(e)
+                metrics_service.increment("farmbase_dataset_load_errors_total", labels={"dataset": dataset.name})
+                logger.error(f"Failed to load dataset {dataset.name}, retrying in {self.retry_interval}s: {e}")
+                await asyncio.sleep(self.retry_interval)
+                dataset.state = DatasetState.LOADING
+                continue
+
+            dataset.load_seconds = time.perf_counter() - started
+            dataset.state = DatasetState.READY
+            dataset.error = None
+            metrics_service.observe(
+                "farmbase_dataset_load_seconds", dataset.load_seconds, labels={"dataset": dataset.name}
+            )
+            logger.info(f"Dataset {dataset.name} loaded in {dataset.load_seconds:.1f}s")
+            return
+
+    def start(self) -> None:
+        """Starts loading every registered dataset in the background."""
+        for dataset in self._datasets.values():
+            if dataset.state == DatasetState.PENDING:
+                # marked before the task runs so that no request reaches the loader in the meantime
+                dataset.state = DatasetState.LOADING
+                self._tasks.append(asyncio.create_task(self._load(dataset)))
+
+    async def stop(self) -> None:
+        """Stops the background loads. A load already running in a thread finishes on its own."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    @property
+    def is_ready(self) -> bool:
+        return all(dataset.is_servable for dataset in self._datasets.values())
+
+    def require(self, *names: str) -> Callable[[], Awaitable[None]]:
+        """Returns a dependency that fails with 503 unless the named datasets can be served."""
+        datasets = [self._datasets[name] for name in names]
+
+        # async so that the check runs on the event loop rather than taking a threadpool worker
+        async def dependency() -> None:
+            self._check(datasets)
+
+        return dependency
+
+    def check(self, *names: str) -> None:
+        """Raises DatasetNotReadyError unless the named datasets can be served."""
+        self._check([self._datasets[name] for name in names])
+
+    def _check(self, datasets: list[Dataset]) -> None:
+        for dataset in datasets:
+            if not dataset.is_servable:
+                raise DatasetNotReadyError(
+                    detail=f"Dataset {dataset.name} is {dataset.state}, retry later",
+                    headers={"Retry-After": str(self.retry_after)},
+                )
+
+    def stats(self) -> dict[str, Any]:
+        """Returns the state of every dataset."""
+        return {
+            "ready": self.is_ready,
+            "datasets": {
+                dataset.name: {
+                    "state": dataset.state,
+                    "attempts": dataset.attempts,
+                    "load_seconds": dataset.load_seconds,
+                    "error": dataset.error,
+                }
+                for dataset in self._datasets.values()
+            },
+        }
+
+
+dataset_registry = DatasetRegistry(
+    retry_after=settings.DATASET_RETRY_AFTER,
+    retry_interval=settings.DATASET_LOAD_RETRY_INTERVAL,
+)
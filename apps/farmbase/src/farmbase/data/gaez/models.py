@@ -1,5 +1,41 @@
-from pydantic import BaseModel
+from typing import Self
+
+from pydantic import BaseModel, Field, model_validator
+
+# the most coordinates a single batch request may resolve
+MAX_BATCH_POINTS = 10_000
 
 
 class SuitabilityIndexResponse(BaseModel):
     suitability_index: dict[str, int]
+
+
+class CoordinatesBatch(BaseModel):
+    """A batch of coordinates as two parallel columns."""
+
+    latitude: list[float] = Field(max_length=MAX_BATCH_POINTS, description="Latitudes in decimal degrees")
+    longitude: list[float] = Field(max_length=MAX_BATCH_POINTS, description="Longitudes in decimal degrees")
+
+    @model_validator(mode="after")
+    def check_columns(self) -> Self:
+        if len(self.latitude) != len(self.longitude):
+            raise ValueError("latitude and longitude must have the same length")
+        if any(not -90 <= latitude <= 90 for latitude in self.latitude):
+            raise ValueError("Latitude must be between -90 and 90 degrees.")
+        if any(not -180 <= longitude <= 180 for longitude in self.longitude):
+            raise ValueError("Longitude must be between -180 and 180 degrees.")
+        return self
+
+
+class SuitabilityIndexBatchResponse(BaseModel):
+    """Suitability index per crop name, each a column aligned with the requested coordinates."""
+
+    suitability_index: dict[str, list[int]]
+
+
+class AezClassificationBatchResponse(BaseModel):
+    aez_classification: list[str]
+
+
+class GrowingPeriodBatchResponse(BaseModel):
+    growing_period: list[int]
@@ -0,0 +1,270 @@
+import hashlib
+import json
+import math
+import os
+import posixpath
+import tempfile
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Optional, Sequence
+
+import numpy as np
+from loguru import logger
+
+from farmbase.data.storage import download_many
+
+# rows of each band copied at a time when interleaving layers
+_INTERLEAVE_BLOCK_ROWS = 256
+
+
+@dataclass(frozen=True)
+class RasterLayer:
+    """A raster held as a read-only memory-mapped array.
+
+    Only the pages of the array that are actually read are loaded, so a point lookup touches a
+    single page of the file and the resident memory of any number of layers is bounded by the
+    OS page cache rather than by their size. A layer either holds a single band, or several
+    aligned bands interleaved by pixel as the fields of a structured array.
+    """
+
+    name: str
+    array: np.ndarray
+    # geotransform in rasterio Affine order (a, b, c, d, e, f): x = a * col + b * row + c, y = d * col + e * row + f
+    transform: tuple[float, float, float, float, float, float]
+    crs: Optional[str] = None
+    nodata: Optional[float] = None
+    # where the layer was cached from, one path per band for interleaved layers
+    source: Optional[str | tuple[str, ...]] = None
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.array.shape
+
+    @property
+    def bands(self) -> Optional[tuple[str, ...]]:
+        """The band names of an interleaved layer, None for a single band."""
+        return self.array.dtype.names
+
+    @cached_property
+    def inverse(self) -> tuple[float, float, float, float, float, float]:
+        """The inverse geotransform (a, b, c, d, e, f): col = a * x + b * y + c, row = d * x + e * y + f."""
+        a, b, c, d, e, f = self.transform
+        det = a * e - b * d
+        return e / det, -b / det, (b * f - e * c) / det, -d / det, a / det, (d * c - a * f) / det
+
+    def index(self, longitude: float, latitude: float) -> tuple[int, int]:
+        """Returns the (row, col) of the pixel containing a coordinate, clamped to the raster edges
+        as a nearest neighbour lookup would be."""
+        a, b, c, d, e, f = self.inverse
+        rows, cols = self.array.shape
+        col = math.floor(a * longitude + b * latitude + c)
+        row = math.floor(d * longitude + e * latitude + f)
+        return min(max(row, 0), rows - 1), min(max(col, 0), cols - 1)
+
+    def sample(self, longitude: float, latitude: float):
+        """Returns the value of the pixel nearest to a coordinate, a tuple with one value per band
+        for interleaved layers."""
+        return self.array.item(*self.index(longitude, latitude))
+
+    def indices(self, longitudes: np.ndarray, latitudes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized `index`: returns the row and column arrays of the pixels containing each coordinate."""
+        a, b, c, d, e, f = self.inverse
+        x = np.asarray(longitudes, dtype=np.float64)
+        y = np.asarray(latitudes, dtype=np.float64)
+        rows, cols = self.array.shape
+        col = np.clip(np.floor(a * x + b * y + c), 0, cols - 1).astype(np.intp)
+        row = np.clip(np.floor(d * x + e * y + f), 0, rows - 1).astype(np.intp)
+        return row, col
+
+    def sample_many(self, longitudes: np.ndarray, latitudes: np.ndarray) -> np.ndarray:
+        """Returns the values of the pixels nearest to each coordinate, as a structured array with a
+        field per band for interleaved layers."""
+        return self.array[self.indices(longitudes, latitudes)]
+
+
+def _temp_path(path: str) -> str:
+    """Returns a new temporary file next to `path`, unique per process and thread, to be replaced over it."""
+    fd, tmp_path = tempfile.mkstemp(prefix=f"{os.path.basename(path)}.", suffix=".tmp", dir=os.path.dirname(path))
+    os.close(fd)
+    # mkstemp creates the file readable by its owner only, and the cache is shared between processes
+    os.chmod(tmp_path, 0o644)
+    return tmp_path
+
+
+class RasterStore:
+    """Local on-disk cache of GeoTIFF rasters as memory-mapped `.npy` arrays.
+
+    Each raster is downloaded once from object storage, converted block by block into a `.npy` file
+    with a JSON sidecar holding its geotransform, and from then on opened with `np.load(mmap_mode="r")`.
+    Downloads go to temporary files in the cache directory that are removed once converted, or on
+    failure. Writes are atomic, so concurrent processes sharing the directory never see a partial layer.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def _layer_paths(self, stem: str, key: str) -> tuple[str, str]:
+        digest = hashlib.sha1(key.encode()).hexdigest()[:10]
+        base = os.path.join(self.cache_dir, f"{stem}-{digest}")
+        return f"{base}.npy", f"{base}.json"
+
+    @staticmethod
+    def _load(array_path: str, meta_path: str, name: Optional[str]) -> RasterLayer:
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        source = meta["source"]
+        return RasterLayer(
+            name=name or meta["name"],
+            # a plain ndarray view of the memmap skips the memmap subclass overhead on every lookup
+            array=np.load(array_path, mmap_mode="r").view(np.ndarray),
+            transform=tuple(meta["transform"]),
+            crs=meta["crs"],
+            nodata=meta["nodata"],
+            source=tuple(source) if isinstance(source, list) else source,
+        )
+
+    @staticmethod
+    def _write_meta(meta: dict, meta_path: str) -> None:
+        tmp_meta_path = _temp_path(meta_path)
+        try:
+            with open(tmp_meta_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(tmp_meta_path, meta_path)
+        except BaseException:
+            if os.path.exists(tmp_meta_path):
+                os.remove(tmp_meta_path)
+            raise
+
+    def _raster_paths(self, url: str) -> tuple[str, str]:
+        return self._layer_paths(os.path.splitext(posixpath.basename(url))[0], url)
+
+    def open(self, url: str, name: Optional[str] = None) -> RasterLayer:
+        """Returns the first band of the raster at `url`, caching it on first use."""
+        return self.open_many([url], [name])[0]
+
+    def open_many(self, urls: Sequence[str], names: Optional[Sequence[Optional[str]]] = None) -> list[RasterLayer]:
+        """Returns the first band of each raster in `urls`, downloading the uncached ones concurrently."""
+        self._cache([url for url in dict.fromkeys(urls) if not os.path.exists(self._raster_paths(url)[1])])
+        return [
+            self._load(*self._raster_paths(url), name)
+            for url, name in zip(urls, names if names is not None else [None] * len(urls))
+        ]
+
+    def open_interleaved(self, urls: Sequence[str], names: Sequence[str], name: str) -> RasterLayer:
+        """Returns the first band of each raster in `urls` combined by `interleave`, with the bands named
+        by `names`. The single band layers are removed once the combined layer is cached, so the data is
+        not kept on disk twice."""
+        array_path, meta_path = self._layer_paths(name, "\n".join(f"{n}={url}" for n, url in zip(names, urls)))
+        if os.path.exists(meta_path):
+            return self._load(array_path, meta_path, name)
+        try:
+            layers = self.open_many(urls, names)
+        except FileNotFoundError:
+            # another process combined the layers and removed the single band layers meanwhile
+            if not os.path.exists(meta_path):
+                raise
+            return self._load(array_path, meta_path, name)
+        interleaved = self.interleave(layers, name)
+        for url in urls:
+            self._remove(*self._raster_paths(url))
+        return interleaved
+
+    def interleave(self, layers: Sequence[RasterLayer], name: str) -> RasterLayer:
+        """Returns aligned single band layers combined into one layer, caching it on first use.
+
+        The bands are interleaved by pixel as the fields of a structured array, named after the
+        layers, so the values of every band at a point are read together from one place on disk.
+        """
+        for layer in layers[1:]:
+            if layer.shape != layers[0].shape or layer.transform != layers[0].transform:
+                raise ValueError(f"Raster layer {layer.name} is not aligned with {layers[0].name}")
+
+        sources = [layer.source for layer in layers]
+        array_path, meta_path = self._layer_paths(name, "\n".join(f"{layer.name}={layer.source}" for layer in layers))
+        if not os.path.exists(meta_path):
+            logger.info(f"Interleaving {len(layers)} raster layers as {name} in {self.cache_dir}")
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._interleave(layers, array_path)
+            first = layers[0]
+            meta = {"transform": list(first.transform), "crs": first.crs, "nodata": first.nodata}
+            self._write_meta({**meta, "name": name, "source": sources}, meta_path)
+        return self._load(array_path, meta_path, name)
+
+    @staticmethod
+    def _remove(array_path: str, meta_path: str) -> None:
+        # the sidecar marks a layer as cached, so it goes first; open memory maps stay valid after the unlink
+        for path in (meta_path, array_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _interleave(layers: Sequence[RasterLayer], array_path: str) -> None:
+        dtype = np.dtype([(layer.name, layer.array.dtype) for layer in layers])
+        rows = layers[0].shape[0]
+        tmp_array_path = _temp_path(array_path)
+        try:
+            array = np.lib.format.open_memmap(tmp_array_path, mode="w+", dtype=dtype, shape=layers[0].shape)
+            for start in range(0, rows, _INTERLEAVE_BLOCK_ROWS):
+                block = slice(start, start + _INTERLEAVE_BLOCK_ROWS)
+                for layer in layers:
+                    array[layer.name][block] = layer.array[block]
+            array.flush()
+            del array
+            os.replace(tmp_array_path, array_path)
+        except BaseException:
+            if os.path.exists(tmp_array_path):
+                os.remove(tmp_array_path)
+            raise
+
+    def _cache(self, urls: Sequence[str]) -> None:
+        if not urls:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        logger.info(f"Caching {len(urls)} rasters in {self.cache_dir}: {', '.join(urls)}")
+
+        download_paths = []
+        try:
+            for url in urls:
+                fd, download_path = tempfile.mkstemp(suffix=posixpath.splitext(url)[1], dir=self.cache_dir)
+                os.close(fd)
+                download_paths.append(download_path)
+            download_many(list(zip(urls, download_paths)))
+
+            for url, download_path in zip(urls, download_paths):
+                array_path, meta_path = self._raster_paths(url)
+                meta = self._convert(download_path, array_path)
+                meta["name"] = os.path.splitext(posixpath.basename(url))[0]
+                meta["source"] = url
+                self._write_meta(meta, meta_path)
+        finally:
+            for download_path in download_paths:
+                os.remove(download_path)
+
+    @staticmethod
+    def _convert(tif_path: str, array_path: str) -> dict:
+        """Copies band 1 of a GeoTIFF into a `.npy` file one block at a time."""
+        import rasterio
+
+        tmp_array_path = _temp_path(array_path)
+        try:
+            with rasterio.open(tif_path) as src:
+                array = np.lib.format.open_memmap(
+                    tmp_array_path, mode="w+", dtype=src.dtypes[0], shape=(src.height, src.width)
+                )
+                for _, window in src.block_windows(1):
+                    array[window.toslices()] = src.read(1, window=window)
+                array.flush()
+                del array
+                meta = {
+                    "transform": list(src.transform)[:6],
+                    "crs": src.crs.to_string() if src.crs else None,
+                    "nodata": src.nodata,
+                }
+            os.replace(tmp_array_path, array_path)
+        except BaseException:
+            if os.path.exists(tmp_array_path):
+                os.remove(tmp_array_path)
+            raise
+        return meta
@@ -1,34 +1,41 @@
 import os
-import tempfile
+import posixpath
 from functools import lru_cache
 from typing import Annotated
 
-import gcsfs
-from fastapi import APIRouter, Query
+import numpy as np
+from fastapi import APIRouter, Depends, Query
 from loguru import logger
 
-from farmbase.data.gaez.models import SuitabilityIndexResponse
+from farmbase.config import settings
+from farmbase.data.datasets import dataset_registry
+from farmbase.data.gaez.models import (
+    AezClassificationBatchResponse,
+    CoordinatesBatch,
+    GrowingPeriodBatchResponse,
+    SuitabilityIndexBatchResponse,
+    SuitabilityIndexResponse,
+)
+from farmbase.data.gaez.store import RasterLayer, RasterStore
+from farmbase.data.storage import glob_objects, open_object, storage_url
 
 router = APIRouter()
 
-# --- GCS and Path Constants ---
-# The GCS filesystem object is lightweight and can be initialized globally.
-fs = gcsfs.GCSFileSystem()
-
-# Define paths as constants for clarity
-CLASS_MAP_PATH = "gs://farmbase_data/gaez/GAEZ4_symbology_files/clr_files/AEZ_33classes.clr"
-AEZ_RASTER_PATH = "gs://farmbase_data/gaez/LR/aez/aez_v9v2red_ENSEMBLE_rcp4p5_2020s.tif"
-GROWING_PERIOD_RASTER_PATH = "gs://farmbase_data/gaez/res01/ENSEMBLE/rcp4p5/ld1_ENSEMBLE_rcp4p5_2020s.tif"
-SUITABILITY_RASTER_DIR = "gs://farmbase_data/gaez/res05/HadGEM2-ES/rcp4p5/2020sH"
+# --- Dataset Paths ---
+# Paths are relative to the dataset storage, the farmbase_data bucket unless DATA_STORAGE_URL says otherwise
+CLASS_MAP_PATH = storage_url("gaez/GAEZ4_symbology_files/clr_files/AEZ_33classes.clr")
+AEZ_RASTER_PATH = storage_url("gaez/LR/aez/aez_v9v2red_ENSEMBLE_rcp4p5_2020s.tif")
+GROWING_PERIOD_RASTER_PATH = storage_url("gaez/res01/ENSEMBLE/rcp4p5/ld1_ENSEMBLE_rcp4p5_2020s.tif")
+SUITABILITY_RASTER_DIR = storage_url("gaez/res05/HadGEM2-ES/rcp4p5/2020sH")
 
 
 # --- Helper and Caching Functions ---
 
 
-def _read_clr(gcs_path):
+def _read_clr(path):
     """Helper function to read a GAEZ .clr file."""
     colormap = {}
-    with fs.open(gcs_path, "r", encoding="utf-8") as f:
+    with open_object(path, "r", encoding="utf-8") as f:
         for line in f:
             if line.strip() and not line.startswith("#"):
                 parts = line.split(maxsplit=5)
@@ -43,79 +50,72 @@ def _read_clr(gcs_path):
 @lru_cache(maxsize=None)
 def get_class_map():
     """
-    Loads the AEZ class map from GCS.
+    Loads the AEZ class map from the dataset storage.
     This function is cached, so it only runs once.
     """
     logger.info(f"Loading and caching class map from: {CLASS_MAP_PATH}")
     return _read_clr(CLASS_MAP_PATH)
 
 
-def open_raster_from_gcs(path):
-    # Although rioxarray can read gs:// paths, it doesn't seem to handle the ambient credentials
-    # when running in Google Cloud Run. Therefore, use GCSFileSystem to a named temp file
-    import rioxarray
-
-    with fs.open(path, "rb") as f:
-        with tempfile.NamedTemporaryFile(suffix=".tif", delete=False) as tmp:
-            tmp.write(f.read())
-            tmp.flush()
-            return rioxarray.open_rasterio(tmp.name)
+# rasters are kept on local disk as memory-mapped arrays, downloaded once per instance
+raster_store = RasterStore(os.path.join(settings.DATA_CACHE_DIR, "gaez"))
 
 
 @lru_cache(maxsize=None)
-def get_aez_raster():
+def get_aez_raster() -> RasterLayer:
     """
-    Loads the AEZ raster from GCS.
+    Opens the AEZ raster from the local raster store, downloading it on first use.
     This function is cached, so it only runs once.
     """
     logger.info(f"Loading and caching AEZ raster from: {AEZ_RASTER_PATH}")
-    return open_raster_from_gcs(AEZ_RASTER_PATH)
+    return raster_store.open(AEZ_RASTER_PATH)
 
 
 @lru_cache(maxsize=None)
-def get_growing_period_raster():
+def get_growing_period_raster() -> RasterLayer:
     """
-    Loads the growing period raster from GCS.
+    Opens the growing period raster from the local raster store, downloading it on first use.
     This function is cached, so it only runs once.
     """
     logger.info(f"Loading and caching growing period raster from: {GROWING_PERIOD_RASTER_PATH}")
-    return open_raster_from_gcs(GROWING_PERIOD_RASTER_PATH)
+    return raster_store.open(GROWING_PERIOD_RASTER_PATH)
 
 
 @lru_cache(maxsize=None)
-def get_suitability_raster():
+def get_suitability_raster() -> RasterLayer:
     """
-    Loads, aligns, and stacks all crop suitability rasters.
-    This is a heavy operation and is cached to run only once.
+    Opens all crop suitability rasters from the local raster store as one layer, with a band per crop
+    named by its crop code. The bands are interleaved by pixel, so a point lookup reads the values for
+    every crop from one place. This function is cached, so it only runs once.
     """
-    import xarray as xr
-
     logger.info(f"Loading and caching all suitability rasters from: {SUITABILITY_RASTER_DIR}")
-    # Note: Using fs.glob() to find files is more robust
-    raster_paths = fs.glob(os.path.join(SUITABILITY_RASTER_DIR, "suHr0_*.tif"))
+    raster_paths = glob_objects(posixpath.join(SUITABILITY_RASTER_DIR, "suHr0_*.tif"))
+    if not raster_paths:
+        raise FileNotFoundError(f"No suitability rasters found in {SUITABILITY_RASTER_DIR}")
 
-    # Prepend 'gs://' to make them valid URLs for rioxarray
-    full_raster_paths = [f"gs://{path}" for path in raster_paths]
-    rasters = [open_raster_from_gcs(path) for path in full_raster_paths]
+    # Extract crop codes from filenames, e.g. suHr0_mze.tif -> mze; missing layers are downloaded concurrently
+    return raster_store.open_interleaved(
+        raster_paths,
+        names=[posixpath.basename(path).split(".")[0].split("_")[1] for path in raster_paths],
+        name="suitability",
+    )
 
-    # Align rasters to ensure they have the same spatial resolution and extents
-    aligned_rasters = xr.align(*rasters, join="exact")
 
-    # Extract crop codes from filenames for coordinates
-    raster_crop_codes = [os.path.basename(p).split(".")[0].split("_")[1] for p in full_raster_paths]
+# loaded in the background at startup, the endpoints answer 503 until the datasets they read are ready
+dataset_registry.register("gaez.class_map", get_class_map)
+dataset_registry.register("gaez.aez", get_aez_raster)
+dataset_registry.register("gaez.growing_period", get_growing_period_raster)
+dataset_registry.register("gaez.suitability", get_suitability_raster)
 
-    # Stack rasters along a new 'crop' dimension
-    stacked_raster = xr.concat(aligned_rasters, dim="crop")
-
-    # Assign meaningful labels to the new dimension
-    stacked_raster = stacked_raster.assign_coords(crop=raster_crop_codes)
-    return stacked_raster
+aez_ready = Depends(dataset_registry.require("gaez.aez", "gaez.class_map"))
+growing_period_ready = Depends(dataset_registry.require("gaez.growing_period"))
+suitability_ready = Depends(dataset_registry.require("gaez.suitability"))
 
 
 # --- API Endpoints ---
 
 
-@router.get("/aez_classification", response_model=str)
+@router.get("/aez_classification", response_model=str, dependencies=[aez_ready])
 def aez_classification(
     latitude: Annotated[float, Query(description="The latitude coordinate")],
     longitude: Annotated[float, Query(description="The longitude coordinate")],
@@ -125,12 +125,12 @@ def aez_classification(
     raster = get_aez_raster()
     class_map = get_class_map()
 
-    value = raster.sel(x=longitude, y=latitude, method="nearest").item()
+    value = raster.sample(longitude, latitude)
     logger.debug(f"aez classification for lon:{longitude} lat:{latitude} is {value}")
     return class_map.get(value, "Unknown Classification")
 
 
-@router.get("/growing_period", response_model=int)
+@router.get("/growing_period", response_model=int, dependencies=[growing_period_ready])
 def growing_period(
     latitude: Annotated[float, Query(description="The latitude coordinate")],
     longitude: Annotated[float, Query(description="The longitude coordinate")],
@@ -138,12 +138,32 @@ def growing_period(
     """Get the growing period length in days for a given geographical coordinate."""
     # Call the cached getter function
     raster = get_growing_period_raster()
-    logger.debug(f"loaded growing period raster shape {raster.shape}")
-    days = raster.sel(x=longitude, y=latitude, method="nearest").item()
+    days = raster.sample(longitude, latitude)
     logger.debug(f"growing period for lon:{longitude} lat:{latitude} is {days} days")
     return days
 
 
+@router.post("/aez_classification/batch", response_model=AezClassificationBatchResponse, dependencies=[aez_ready])
+def aez_classification_batch(coordinates: CoordinatesBatch):
+    """Get the AEZ classification for each of a batch of coordinates, in the order given."""
+    raster = get_aez_raster()
+    class_map = get_class_map()
+
+    values = raster.sample_many(coordinates.longitude, coordinates.latitude)
+    # look up each distinct class once rather than once per coordinate
+    classes, inverse = np.unique(values, return_inverse=True)
+    labels = np.array([class_map.get(value, "Unknown Classification") for value in classes.tolist()], dtype=object)
+    return AezClassificationBatchResponse(aez_classification=labels[inverse].tolist())
+
+
+@router.post("/growing_period/batch", response_model=GrowingPeriodBatchResponse, dependencies=[growing_period_ready])
+def growing_period_batch(coordinates: CoordinatesBatch):
+    """Get the growing period length in days for each of a batch of coordinates, in the order given."""
+    raster = get_growing_period_raster()
+    days = raster.sample_many(coordinates.longitude, coordinates.latitude)
+    return GrowingPeriodBatchResponse(growing_period=days.tolist())
+
+
 # This can remain global as it's just a static dictionary
 crop_codes = {
     "alf": "Alfalfa",
@@ -180,22 +200,38 @@ crop_codes = {
 }
 
 
-@router.get("/suitability_index", response_model=SuitabilityIndexResponse)
+@lru_cache(maxsize=None)
+def get_crop_names(codes: tuple[str, ...]) -> tuple[str, ...]:
+    """Maps suitability band crop codes to crop names, once per set of bands."""
+    return tuple(crop_codes.get(code, "Unknown Crop") for code in codes)
+
+
+@router.get("/suitability_index", response_model=SuitabilityIndexResponse, dependencies=[suitability_ready])
 def suitability_index(
     latitude: Annotated[float, Query(description="The latitude coordinate")],
     longitude: Annotated[float, Query(description="The longitude coordinate")],
 ):
     """Get the crop suitability index values for a given geographical coordinate."""
-    # Call the cached getter function for the combined suitability raster
-    stacked_raster = get_suitability_raster()
+    # Call the cached getter function for the crop suitability layer
+    raster = get_suitability_raster()
+
+    # Create the response dictionary from the values of every crop band at the given point
+    response_data = dict(zip(get_crop_names(raster.bands), raster.sample(longitude, latitude)))
 
-    # Select the data for the given point
-    suitability_point = stacked_raster.sel(x=longitude, y=latitude, method="nearest")
+    return SuitabilityIndexResponse(suitability_index=response_data)
 
-    # Create the response dictionary
+
+@router.post("/suitability_index/batch", response_model=SuitabilityIndexBatchResponse, dependencies=[suitability_ready])
+def suitability_index_batch(coordinates: CoordinatesBatch):
+    """Get the crop suitability index values for each of a batch of coordinates.
+
+    The response holds one column per crop, aligned with the order of the coordinates.
+    """
+    raster = get_suitability_raster()
+
+    values = raster.sample_many(coordinates.longitude, coordinates.latitude)
     response_data = {
-        crop_codes.get(crop_code.item(), "Unknown Crop"): value.item()
-        for crop_code, value in zip(suitability_point.crop, suitability_point.values)
+        crop_name: values[band].tolist() for crop_name, band in zip(get_crop_names(raster.bands), raster.bands)
     }
 
-    return SuitabilityIndexResponse(suitability_index=response_data)
+    return SuitabilityIndexBatchResponse(suitability_index=response_data)
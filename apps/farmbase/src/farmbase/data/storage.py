@@ -0,0 +1,77 @@
+"""Object storage for the datasets behind the data endpoints."""
+
+import os
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import IO, Optional, Sequence
+
+import fsspec
+from fsspec.core import split_protocol
+
+from farmbase.config import settings
+
+# objects are downloaded in ranges of this size, several at a time
+_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+@lru_cache(maxsize=None)
+def get_filesystem(protocol: str) -> fsspec.AbstractFileSystem:
+    """Returns the shared filesystem of a protocol, such as gs, file or memory."""
+    return fsspec.filesystem(protocol)
+
+
+def resolve(url: str) -> tuple[fsspec.AbstractFileSystem, str]:
+    """Returns the filesystem holding an object and the path of the object within it."""
+    protocol, _ = split_protocol(url)
+    fs = get_filesystem(protocol or "file")
+    return fs, fs._strip_protocol(url)
+
+
+def storage_url(*parts: str) -> str:
+    """Returns the URL of a dataset object, relative to DATA_STORAGE_URL."""
+    return posixpath.join(settings.DATA_STORAGE_URL, *parts)
+
+
+def open_object(url: str, mode: str = "rb", **kwargs) -> IO:
+    fs, path = resolve(url)
+    return fs.open(path, mode, **kwargs)
+
+
+def glob_objects(pattern: str) -> list[str]:
+    """Returns the URLs of the objects matching a glob pattern, sorted."""
+    fs, path = resolve(pattern)
+    return sorted(fs.unstrip_protocol(match) for match in fs.glob(path))
+
+
+def download_many(downloads: Sequence[tuple[str, str]], concurrency: Optional[int] = None) -> None:
+    """Copies objects to local files, given as (url, local path) pairs, reading their ranges concurrently."""
+    concurrency = concurrency or settings.DATA_DOWNLOAD_CONCURRENCY
+    ranges = []
+    files = []
+    try:
+        for url, local_path in downloads:
+            fs, path = resolve(url)
+            size = fs.size(path)
+            fd = os.open(local_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            files.append(fd)
+            os.ftruncate(fd, size)
+            ranges += [(fs, path, fd, start, min(start + _CHUNK_SIZE, size)) for start in range(0, size, _CHUNK_SIZE)]
+
+        def copy_range(fs, path, fd, start, end):
+            data = fs.cat_file(path, start=start, end=end)
+            if len(data) != end - start:
+                raise IOError(f"Short read of {path} at {start}: {len(data)} of {end - start} bytes")
+            os.pwrite(fd, data, start)
+
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="download") as executor:
+            # list() re-raises the first failure
+            list(executor.map(lambda args: copy_range(*args), ranges))
+    finally:
+        for fd in files:
+            os.close(fd)
+
+
+def download(url: str, local_path: str, concurrency: Optional[int] = None) -> None:
+    """Copies an object to a local file, reading its ranges concurrently."""
+    download_many([(url, local_path)], concurrency=concurrency)
@@ -1,21 +1,20 @@
 import functools
 import re
-from typing import Annotated, Any, ClassVar
+from typing import Any, ClassVar
 
-from fastapi import Depends
 from loguru import logger
 from pydantic import ValidationError
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import Engine
 from sqlalchemy.engine.url import URL
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase, Session, object_session, sessionmaker
+from sqlalchemy.orm import DeclarativeBase, Mapper, Session, object_session, sessionmaker
 from sqlalchemy.sql.expression import true
-from sqlalchemy_filterset import AsyncFilterSet, LimitOffsetFilter
-from sqlalchemy_filterset.filtersets import Model
-from sqlalchemy_utils import get_mapper
-from starlette.requests import Request
 
+from farmbase import import_all_models
 from farmbase.config import settings
+from farmbase.database.enums import FARMBASE_ORGANIZATION_SCHEMA_PREFIX
+from farmbase.database.instrumentation import query_instrumentation
 from farmbase.database.logging import SessionTracker
 from farmbase.models import TimeStampMixin
 
@@ -73,34 +72,78 @@ def create_db_engine(async_: bool = True, echo: bool = False):
         return create_engine(url, **timeout_kwargs, echo=echo, connect_args=connect_args)
 
 
-# Create the default asynchronous engine for your application
-engine = create_db_engine(async_=True, echo=False)
+@functools.lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    """Returns the default asynchronous engine, creating it on first use."""
+    _engine = create_db_engine(async_=True, echo=settings.DATABASE_ENGINE_ECHO)
+    # Record query latency and flag slow queries, see farmbase.database.instrumentation
+    query_instrumentation.attach(_engine.sync_engine)
+    return _engine
 
-# Create a synchronous engine, for example, for a script or a migration tool
-# Note: You will need to have a synchronous driver like 'psycopg2-binary' installed.
-engine_sync = create_db_engine(async_=False, echo=True)
 
-# Enable query timing logging
-#
-# Set up logging for query debugging
-#
-#
-# @event.listens_for(Engine, "before_cursor_execute")
-# def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-#     conn.info.setdefault("query_start_time", []).append(time.time())
-#     logger.debug("Start Query: %s", statement)
+@functools.lru_cache(maxsize=1)
+def get_sync_engine() -> Engine:
+    """Returns the synchronous engine, e.g. for scripts and migrations, creating it on first use.
+
+    Note: You will need to have a synchronous driver like 'psycopg2-binary' installed.
+    """
+    _engine = create_db_engine(async_=False, echo=settings.DATABASE_ENGINE_ECHO)
+    query_instrumentation.attach(_engine)
+    return _engine
+
+
+@functools.lru_cache(maxsize=1)
+def get_session_local() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(bind=get_engine())
+
+
+# engines, sessions and the FastAPI helpers are created/imported on first access so that
+# importing this module (e.g. from a worker or script) doesn't pay for what it doesn't use
+_LAZY_ATTRIBUTES = {
+    "engine": get_engine,
+    "engine_sync": get_sync_engine,
+    "SessionLocal": get_session_local,
+}
+_DEPENDENCY_ATTRIBUTES = {"get_db", "DbSession", "BaseFilterSet"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    if name in _DEPENDENCY_ATTRIBUTES:
+        from farmbase.database import dependencies
+
+        return getattr(dependencies, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-# @event.listens_for(Engine, "after_cursor_execute")
-# def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-#     total = time.time() - conn.info["query_start_time"].pop(-1)
-#     logger.debug("Query Complete!")
-#     logger.debug("Total Time: %f", total)
-#     # Log queries that take more than 1 second as warnings
-#     if total > 1.0:
-#         logger.warning("Slow Query (%.2fs): %s", total, statement)
+def get_schema_name(organization_slug: str) -> str:
+    """Returns the tenant schema name for an organization slug."""
+    return f"{FARMBASE_ORGANIZATION_SCHEMA_PREFIX}_{organization_slug}"
 
 
-SessionLocal = async_sessionmaker(bind=engine)
+@functools.lru_cache(maxsize=None)
+def get_tenant_session_factory(organization_slug: str) -> async_sessionmaker[AsyncSession]:
+    """Returns the cached async session factory bound to an organization's schema.
+
+    Reusing the factory (and its schema translated engine) across requests means the engine
+    options and the compiled statement cache are shared rather than rebuilt per request.
+    """
+    schema_engine = get_engine().execution_options(schema_translate_map={None: get_schema_name(organization_slug)})
+    return async_sessionmaker(bind=schema_engine, expire_on_commit=False)
+
+
+@functools.lru_cache(maxsize=None)
+def get_tenant_sync_session_factory(organization_slug: str) -> sessionmaker[Session]:
+    """Returns the cached sync session factory bound to an organization's schema."""
+    schema_engine = get_sync_engine().execution_options(schema_translate_map={None: get_schema_name(organization_slug)})
+    return sessionmaker(bind=schema_engine, expire_on_commit=False)
+
+
+def clear_tenant_session_factories() -> None:
+    """Drops the cached tenant session factories, e.g. after an organization is deleted."""
+    get_tenant_session_factory.cache_clear()
+    get_tenant_sync_session_factory.cache_clear()
 
 
 def resolve_table_name(name):
@@ -171,15 +214,10 @@ class Base(ReprMixin, DeclarativeBase, TimeStampMixin):
     """Project-wide declarative base with universal audit timestamps."""
 
 
-def get_db(request: Request) -> AsyncSession:
-    """Get database session from request state."""
-    session = request.state.db
-    if not hasattr(session, "_farmbase_session_id"):
-        session._farmbase_session_id = SessionTracker.track_session(session, context="fastapi_request")
-    return session
-
-
-DbSession = Annotated[AsyncSession, Depends(get_db)]
+@event.listens_for(Mapper, "before_configured")
+def _import_all_models():
+    """Models are imported on demand, so make sure every relationship target is mapped before configuring."""
+    import_all_models()
 
 
 def get_model_name_by_tablename(table_fullname: str) -> str:
@@ -203,6 +241,7 @@ def get_class_by_tablename(table_fullname: str) -> Any:
     #             if c.__table__.fullname.lower() == name.lower():
     #                 return c
 
+    import_all_models()
     mapped_name = resolve_table_name(table_fullname)
     mapped_class = _find_class(mapped_name)
 
@@ -232,6 +271,8 @@ def get_table_name_by_class_instance(class_instance: Base) -> str:
 
 def ensure_unique_default_per_project(target, value, oldvalue, initiator):
     """Ensures that only one row in table is specified as the default."""
+    from sqlalchemy_utils import get_mapper
+
     session = object_session(target)
     if session is None:
         return
@@ -254,12 +295,7 @@ def ensure_unique_default_per_project(target, value, oldvalue, initiator):
 
 def refetch_db_session(organization_slug: str) -> Session:
     """Create a new database session for a specific organization."""
-    schema_engine = engine.execution_options(
-        schema_translate_map={
-            None: f"farmbase_organization_{organization_slug}",
-        }
-    )
-    session = sessionmaker(bind=schema_engine)()
+    session = get_tenant_sync_session_factory(organization_slug)()
     session._farmbase_session_id = SessionTracker.track_session(session, context=f"organization_{organization_slug}")
     return session
 
@@ -274,10 +310,6 @@ async def get_schema_names(_engine: AsyncEngine) -> list[str]:
         return await async_conn.run_sync(_get_schema_names)
 
 
-class BaseFilterSet(AsyncFilterSet[Model]):
-    limit_offset = LimitOffsetFilter()
-
-
 #
 # @contextmanager
 # def get_session() -> Session:
@@ -0,0 +1,24 @@
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy_filterset import AsyncFilterSet, LimitOffsetFilter
+from sqlalchemy_filterset.filtersets import Model
+from starlette.requests import Request
+
+from farmbase.database.logging import SessionTracker
+
+
+def get_db(request: Request) -> AsyncSession:
+    """Get database session from request state."""
+    session = request.state.db
+    if not hasattr(session, "_farmbase_session_id"):
+        session._farmbase_session_id = SessionTracker.track_session(session, context="fastapi_request")
+    return session
+
+
+DbSession = Annotated[AsyncSession, Depends(get_db)]
+
+
+class BaseFilterSet(AsyncFilterSet[Model]):
+    limit_offset = LimitOffsetFilter()
@@ -0,0 +1,177 @@
+import functools
+import hashlib
+import re
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from farmbase.config import settings
+from farmbase.context import get_request_id
+from farmbase.metrics import service as metrics_service
+
+_STRING_LITERAL = re.compile(r"'(?:''|[^'])*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAM = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<!:):\w+\b")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_TENANT_SCHEMA = re.compile(r"\bfarmbase_organization_\w+\.")
+_WHITESPACE = re.compile(r"\s+")
+
+# distinct statements beyond this are folded into a single "other" entry
+MAX_FINGERPRINTS = 2000
+
+
+@functools.lru_cache(maxsize=4096)
+def fingerprint(statement: str) -> tuple[str, str]:
+    """Normalizes a SQL statement so that executions differing only in literals, bind params,
+    IN-list lengths or tenant schema share a fingerprint. Returns a short id and the normalized SQL."""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_PARAM.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _VALUE_LIST.sub("(?+)", normalized)
+    normalized = _TENANT_SCHEMA.sub("farmbase_organization_?.", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    return hashlib.sha1(normalized.encode()).hexdigest()[:12], normalized
+
+
+def _value_shape(value: Any) -> str:
+    if isinstance(value, (str, bytes, list, tuple, set, dict)):
+        return f"{type(value).__name__}[{len(value)}]"
+    return type(value).__name__
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> Any:
+    """Describes bind parameters by type and size only, so that values are never logged."""
+    if executemany and isinstance(parameters, (list, tuple)):
+        first = parameter_shape(parameters[0]) if parameters else None
+        return {"rows": len(parameters), "row": first}
+    if isinstance(parameters, dict):
+        return {key: _value_shape(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_value_shape(value) for value in parameters]
+    return _value_shape(parameters)
+
+
+@dataclass
+class QueryStats:
+    query_id: str
+    statement: str
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    slow_count: int = 0
+
+
+@dataclass
+class SlowQuery:
+    query_id: str
+    statement: str
+    duration_seconds: float
+    parameters: Any
+    request_id: str | None
+
+
+class QueryInstrumentation:
+    """Records per-statement latency and flags slow queries on the attached engines.
+
+    The cursor listeners are only registered while instrumentation is enabled, so it can be
+    switched on and off at runtime without a restart and costs nothing when off.
+    """
+
+    def __init__(self, enabled: bool, slow_query_threshold: float, slow_query_log_size: int = 100):
+        self.enabled = enabled
+        self.slow_query_threshold = slow_query_threshold
+        self._engines: list[Engine] = []
+        self._stats: dict[str, QueryStats] = {}
+        self._slow_queries: deque[SlowQuery] = deque(maxlen=slow_query_log_size)
+
+    def attach(self, engine: Engine) -> None:
+        """Instruments a (sync) engine; for an AsyncEngine pass its `sync_engine`."""
+        if engine in self._engines:
+            return
+        self._engines.append(engine)
+        if self.enabled:
+            self._listen(engine)
+
+    def _listen(self, engine: Engine) -> None:
+        if not event.contains(engine, "before_cursor_execute", self._before_cursor_execute):
+            event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+            event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _remove(self, engine: Engine) -> None:
+        if event.contains(engine, "before_cursor_execute", self._before_cursor_execute):
+            event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+            event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def configure(self, *, enabled: bool | None = None, slow_query_threshold: float | None = None) -> None:
+        """Changes the instrumentation settings at runtime."""
+        if slow_query_threshold is not None:
+            self.slow_query_threshold = slow_query_threshold
+        if enabled is not None and enabled != self.enabled:
+            self.enabled = enabled
+            for engine in self._engines:
+                if enabled:
+                    self._listen(engine)
+                else:
+                    self._remove(engine)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # kept on the execution context, which is discarded with a failed statement
+        context._query_start_time = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        start_time = getattr(context, "_query_start_time", None)
+        if start_time is None:
+            # instrumentation was enabled while this query was running
+            return
+        self.record(statement, time.perf_counter() - start_time, parameters, executemany)
+
+    def record(self, statement: str, duration: float, parameters: Any = None, executemany: bool = False) -> None:
+        """Records the execution of a statement."""
+        query_id, normalized = fingerprint(statement)
+        stats = self._stats.get(query_id)
+        if stats is None:
+            if len(self._stats) >= MAX_FINGERPRINTS:
+                query_id, normalized = "other", "other"
+                stats = self._stats.setdefault(query_id, QueryStats(query_id, normalized))
+            else:
+                stats = self._stats[query_id] = QueryStats(query_id, normalized)
+
+        stats.count += 1
+        stats.total_seconds += duration
+        stats.max_seconds = max(stats.max_seconds, duration)
+        metrics_service.observe("farmbase_db_query_duration_seconds", duration, labels={"query_id": query_id})
+
+        if duration >= self.slow_query_threshold:
+            stats.slow_count += 1
+            request_id = get_request_id()
+            shape = parameter_shape(parameters, executemany)
+            self._slow_queries.append(SlowQuery(query_id, normalized, duration, shape, request_id))
+            metrics_service.increment("farmbase_db_slow_queries_total", labels={"query_id": query_id})
+            logger.warning(
+                f"Slow query ({duration:.3f}s) [{query_id}] request_id={request_id}: {normalized}",
+                extra={"query_id": query_id, "request_id": request_id, "parameters": shape},
+            )
+
+    def get_stats(self) -> list[dict[str, Any]]:
+        """Returns per-fingerprint statistics, slowest total time first."""
+        return [asdict(s) for s in sorted(self._stats.values(), key=lambda s: s.total_seconds, reverse=True)]
+
+    def get_slow_queries(self) -> list[dict[str, Any]]:
+        """Returns the most recent slow queries, newest first."""
+        return [asdict(q) for q in reversed(self._slow_queries)]
+
+    def reset(self) -> None:
+        """Clears the collected statistics."""
+        self._stats.clear()
+        self._slow_queries.clear()
+
+
+query_instrumentation = QueryInstrumentation(
+    enabled=settings.DATABASE_QUERY_INSTRUMENTATION_ENABLED,
+    slow_query_threshold=settings.DATABASE_SLOW_QUERY_THRESHOLD,
+)
@@ -1,42 +1,92 @@
-import uuid
-from datetime import datetime
+import itertools
+import random
+import time
+import weakref
+from collections import deque
 from typing import Any
 
 from loguru import logger
 from sqlalchemy.orm import Session
 
+from farmbase.config import settings
+from farmbase.metrics import service as metrics_service
+
 
 class SessionTracker:
-    """Tracks database session lifecycle events."""
+    """Tracks database session lifecycle events.
+
+    Sessions are held by weak reference, so a session that is never untracked is not kept
+    alive; when it is garbage collected it is queued, and dropped and counted as leaked on the
+    next tracker call or metrics scrape. Lifecycle events are recorded as metrics, and only a
+    sample of them is logged.
+    """
+
+    _sessions: dict[int, dict[str, Any]] = {}
+    _ids = itertools.count(1)
+    _collected: deque[int] = deque()
+
+    @classmethod
+    def _should_log(cls) -> bool:
+        return random.random() < settings.DATABASE_SESSION_LOG_SAMPLE_RATE
+
+    @classmethod
+    def _on_collected(cls, session_id: int) -> None:
+        # runs inside the garbage collector, possibly while this thread holds the metrics or logging
+        # locks, so it must not take any lock itself
+        cls._collected.append(session_id)
 
-    _sessions: dict[str, dict[str, Any]] = {}
+    @classmethod
+    def record_leaked_sessions(cls) -> None:
+        """Drops the sessions that were garbage collected without being untracked and counts them as leaked."""
+        while cls._collected:
+            session_id = cls._collected.popleft()
+            session_info = cls._sessions.pop(session_id, None)
+            if session_info is None:
+                continue
+            metrics_service.increment("farmbase_db_sessions_leaked_total", labels={"context": session_info["context"]})
+            metrics_service.set_gauge("farmbase_db_sessions_active", len(cls._sessions))
+            logger.warning(f"Database session {session_id} was garbage collected without being closed")
 
     @classmethod
-    def track_session(cls, session: Session, context: str | None = None) -> str:
+    def track_session(cls, session: Session, context: str | None = None) -> int:
         """Tracks a new database session."""
-        session_id = str(uuid.uuid4())
+        cls.record_leaked_sessions()
+        session_id = next(cls._ids)
+        context = context or "unknown"
         cls._sessions[session_id] = {
-            "session": session,
+            "session": weakref.ref(session),
             "context": context,
-            "created_at": datetime.now().timestamp(),
+            "created_at": time.monotonic(),
+            "finalizer": weakref.finalize(session, cls._on_collected, session_id),
         }
-        logger.info(
-            "Database session created",
-            extra={
-                "session_id": session_id,
-                "context": context,
-                "total_active_sessions": len(cls._sessions),
-            },
-        )
+        metrics_service.increment("farmbase_db_sessions_created_total", labels={"context": context})
+        metrics_service.set_gauge("farmbase_db_sessions_active", len(cls._sessions))
+        if cls._should_log():
+            logger.debug(
+                "Database session created",
+                extra={
+                    "session_id": session_id,
+                    "context": context,
+                    "total_active_sessions": len(cls._sessions),
+                },
+            )
         return session_id
 
     @classmethod
-    def untrack_session(cls, session_id: str) -> None:
+    def untrack_session(cls, session_id: int) -> None:
         """Untracks a database session."""
-        if session_id in cls._sessions:
-            session_info = cls._sessions.pop(session_id)
-            duration = datetime.now().timestamp() - session_info["created_at"]
-            logger.info(
+        cls.record_leaked_sessions()
+        session_info = cls._sessions.pop(session_id, None)
+        if session_info is None:
+            return
+
+        session_info["finalizer"].detach()
+        duration = time.monotonic() - session_info["created_at"]
+        metrics_service.increment("farmbase_db_sessions_closed_total", labels={"context": session_info["context"]})
+        metrics_service.observe("farmbase_db_session_duration_seconds", duration)
+        metrics_service.set_gauge("farmbase_db_sessions_active", len(cls._sessions))
+        if cls._should_log():
+            logger.debug(
                 "Database session closed",
                 extra={
                     "session_id": session_id,
@@ -49,12 +99,13 @@ class SessionTracker:
     @classmethod
     def get_active_sessions(cls) -> list[dict[str, Any]]:
         """Returns information about all active sessions."""
-        current_time = datetime.now().timestamp()
+        cls.record_leaked_sessions()
+        current_time = time.monotonic()
         return [
             {
                 "session_id": session_id,
                 "context": info["context"],
                 "age_seconds": current_time - info["created_at"],
             }
-            for session_id, info in cls._sessions.items()
+            for session_id, info in list(cls._sessions.items())
         ]
@@ -4,6 +4,8 @@ from sqlalchemy import inspect, text
 from sqlalchemy.schema import CreateSchema
 from sqlalchemy_utils import create_database, database_exists
 
+from farmbase import import_all_models
+from farmbase.agronomy.aggregates import create_aggregate_views
 from farmbase.commodity.models import Commodity
 from farmbase.organization.models import Organization
 
@@ -26,6 +28,7 @@ def version_schema(script_location: str):
 
 def get_core_tables():
     """Fetches tables that belong to the 'farmbase_core' schema."""
+    import_all_models()
     core_tables = []
     for _, table in Base.metadata.tables.items():
         if table.schema == "farmbase_core":
@@ -35,6 +38,7 @@ def get_core_tables():
 
 def get_tenant_tables():
     """Fetches tables that belong to their own tenant tables."""
+    import_all_models()
     tenant_tables = []
     for _, table in Base.metadata.tables.items():
         if not table.schema:
@@ -113,6 +117,9 @@ def init_database(engine):
 
     Base.metadata.create_all(engine, tables=tables)
 
+    with engine.begin() as conn:
+        create_aggregate_views(conn)
+
     version_schema(script_location=settings.ALEMBIC_CORE_REVISION_PATH)
     # setup_fulltext_search(engine, tables)
 
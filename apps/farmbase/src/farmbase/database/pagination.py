@@ -0,0 +1,106 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, Generic, Optional, Sequence, TypeVar
+
+from sqlalchemy import Select, func, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from farmbase.config import settings
+from farmbase.exceptions.exceptions import InvalidCursorError
+from farmbase.models import PaginationParams
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    items: Sequence[T]
+    total: int
+    total_is_estimate: bool = False
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encodes the sort key values of the last row of a page as an opaque cursor."""
+    payload = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """Decodes a cursor produced by encode_cursor for a sort key of `size` columns."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError(detail="Malformed pagination cursor") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError(detail="Pagination cursor does not match the ordering of this endpoint")
+    return values
+
+
+async def estimate_rows(session: AsyncSession, table_name: str) -> Optional[int]:
+    """Returns the planner's row estimate for a table, or None if it has never been analyzed."""
+    result = await session.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table_name AS regclass)"),
+        {"table_name": table_name},
+    )
+    reltuples = result.scalar_one_or_none()
+    return reltuples if reltuples is not None and reltuples >= 0 else None
+
+
+async def count(session: AsyncSession, query: Select) -> tuple[int, bool]:
+    """Counts the rows matched by a query.
+
+    Unfiltered queries over tables larger than PAGINATION_ESTIMATED_COUNT_THRESHOLD use the
+    pg_class.reltuples estimate instead of scanning the table. Returns the total and whether it is
+    an estimate.
+    """
+    froms = query.get_final_froms()
+    if query.whereclause is None and len(froms) == 1 and hasattr(froms[0], "fullname"):
+        estimate = await estimate_rows(session, froms[0].fullname)
+        if estimate is not None and estimate > settings.PAGINATION_ESTIMATED_COUNT_THRESHOLD:
+            return estimate, True
+
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+    return (await session.execute(count_query)).scalar_one(), False
+
+
+async def paginate(
+    session: AsyncSession,
+    query: Select,
+    pagination: Optional[PaginationParams],
+    order_by: Sequence[InstrumentedAttribute],
+) -> Page:
+    """Runs a list query one page at a time in a stable order.
+
+    `order_by` must be unique across rows (end it with the primary key). Without a cursor the page is
+    selected with OFFSET; with a cursor from a previous page, rows after it are selected with a keyset
+    predicate on `order_by`, which stays fast however deep the page. Every page carries the cursor for
+    the page following it, so clients can switch to keyset paging after the first request.
+    """
+    total, total_is_estimate = await count(session, query)
+
+    query = query.order_by(*order_by)
+    if pagination is None:
+        items = (await session.execute(query)).scalars().all()
+        return Page(items=items, total=total, total_is_estimate=total_is_estimate)
+
+    cursor = getattr(pagination, "cursor", None)
+    if cursor:
+        values = decode_cursor(cursor, len(order_by))
+        query = query.where(tuple_(*order_by) > tuple_(*values))
+        limit = pagination.items_per_page
+    else:
+        limit, offset = pagination.limit_offset
+        query = query.offset(offset)
+
+    # fetch one row beyond the page to tell whether there is a next page
+    items = (await session.execute(query.limit(limit + 1))).scalars().all()
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor([getattr(items[-1], column.key) for column in order_by])
+
+    return Page(items=items, total=total, total_is_estimate=total_is_estimate, next_cursor=next_cursor)
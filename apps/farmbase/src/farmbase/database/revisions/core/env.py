@@ -1,6 +1,7 @@
 from configparser import RawConfigParser
 
 from alembic import context
+from farmbase import import_all_models
 from farmbase.config import settings
 from farmbase.database.core import Base
 from loguru import logger
@@ -17,6 +18,7 @@ config = context.config
 config.file_config = RawConfigParser()
 config.set_main_option("sqlalchemy.url", str(settings.sqlalchemy_database_sync_uri))
 
+import_all_models()
 target_metadata = Base.metadata  # noqa
 
 CORE_SCHEMA_NAME = "farmbase_core"
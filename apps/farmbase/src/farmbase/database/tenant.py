@@ -0,0 +1,123 @@
+import asyncio
+import time
+from typing import Any
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from farmbase.config import settings
+from farmbase.metrics import service as metrics_service
+
+from .core import get_engine, get_schema_names
+from .enums import FARMBASE_ORGANIZATION_SCHEMA_PREFIX
+
+
+class TenantRegistry:
+    """In-process, TTL based cache of the organization schemas that exist in the database.
+
+    The registry is warmed at startup and refreshed in the background so that request handling
+    never has to inspect the database just to validate an organization slug. Organization
+    create/delete invalidate it explicitly.
+    """
+
+    def __init__(self, ttl: float, miss_refresh_interval: float, _engine: AsyncEngine | None = None):
+        self._engine = _engine
+        self.ttl = ttl
+        self.miss_refresh_interval = miss_refresh_interval
+        self._schemas: frozenset[str] = frozenset()
+        self._loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    @property
+    def is_stale(self) -> bool:
+        return self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl
+
+    async def refresh(self) -> frozenset[str]:
+        """Reloads the tenant schema names from the database."""
+        loaded_at = self._loaded_at
+        async with self._lock:
+            # concurrent callers queue on the lock after an expiry or a miss; one reload serves them all
+            if self._loaded_at is not None and self._loaded_at != loaded_at:
+                return self._schemas
+            schema_names = await get_schema_names(self._engine or get_engine())
+            self._schemas = frozenset(s for s in schema_names if s.startswith(FARMBASE_ORGANIZATION_SCHEMA_PREFIX))
+            self._loaded_at = time.monotonic()
+            self.refreshes += 1
+            metrics_service.increment("farmbase_tenant_registry_refreshes_total")
+            logger.debug(f"Tenant registry refreshed with {len(self._schemas)} schemas")
+            return self._schemas
+
+    async def contains(self, schema: str) -> bool:
+        """Returns whether the tenant schema exists, refreshing only when stale or on a rate-limited miss."""
+        if self.is_stale:
+            await self.refresh()
+
+        if schema in self._schemas:
+            self.hits += 1
+            metrics_service.increment("farmbase_tenant_registry_hits_total")
+            return True
+
+        self.misses += 1
+        metrics_service.increment("farmbase_tenant_registry_misses_total")
+        # a schema created by another process will be missing until the next refresh, so allow
+        # an early refresh on a miss, but never more often than the miss refresh interval.
+        if self._loaded_at is None or time.monotonic() - self._loaded_at > self.miss_refresh_interval:
+            await self.refresh()
+            return schema in self._schemas
+        return False
+
+    def add(self, schema: str) -> None:
+        """Registers a newly created schema without a round trip."""
+        self._schemas = self._schemas | {schema}
+
+    def invalidate(self) -> None:
+        """Marks the registry as stale so the next lookup reloads it."""
+        self._loaded_at = None
+
+    def stats(self) -> dict[str, Any]:
+        """Returns cache hit and refresh counters."""
+        return {
+            "schemas": len(self._schemas),
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors,
+            "age_seconds": None if self._loaded_at is None else time.monotonic() - self._loaded_at,
+        }
+
+    async def _refresh_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.ttl)
+            try:
+                await self.refresh()
+            except Exception as e:
+                self.refresh_errors += 1
+                metrics_service.increment("farmbase_tenant_registry_refresh_errors_total")
+                logger.error(f"Failed to refresh tenant registry: {e}")
+
+    async def start(self) -> None:
+        """Warms the registry and starts the background refresh task."""
+        await self.refresh()
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_periodically())
+
+    async def stop(self) -> None:
+        """Stops the background refresh task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+tenant_registry = TenantRegistry(
+    ttl=settings.TENANT_REGISTRY_TTL,
+    miss_refresh_interval=settings.TENANT_REGISTRY_MISS_REFRESH_INTERVAL,
+)
@@ -22,7 +22,21 @@ class EntityAlreadyExistsError(error.ConflictProblem):
     pass
 
 
-#     "BadRequestProblem",
+# fastapi_problem.error.BadRequestProblem provides status 400 errors
+class InvalidCursorError(error.BadRequestProblem):
+    """pagination cursor that is malformed or was issued for a different ordering"""
+
+    pass
+
+
+# fastapi_problem has no 503 problem, the status is set on the subclass
+class DatasetNotReadyError(error.ServerProblem):
+    """reference dataset that is still loading, or failed to load, and cannot be served yet"""
+
+    title = "Service Unavailable"
+    status = 503
+
+
 #     "ForbiddenProblem", TODO:
 #     "RedirectProblem",
 #     "UnauthorisedProblem",
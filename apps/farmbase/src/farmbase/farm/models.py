@@ -23,6 +23,7 @@ from farmbase.enums import FarmContactRole
 from farmbase.farm.field.models import Field, FieldGroup
 from farmbase.farm.harvest.models import StorageLocation
 from farmbase.farm.note.models import Note
+from farmbase.geospatial.proximity import geography_index
 from farmbase.models import FarmbaseBase, Location, Pagination, PrimaryKey
 
 
@@ -67,6 +68,9 @@ class Farm(Base):
         return FarmRead(**data)
 
 
+geography_index("ix_farm_location_geography", Farm.location)
+
+
 class FarmContact(Base):
     __tablename__ = "farm_contact"
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
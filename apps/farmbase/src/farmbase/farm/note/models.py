@@ -19,6 +19,7 @@ from farmbase.contact.models import Contact
 from farmbase.database.core import Base
 from farmbase.farm.field.models import Field
 from farmbase.farm.planting.models import Planting
+from farmbase.geospatial.proximity import geography_index
 from farmbase.models import FarmbaseBase, Location, Pagination, PrimaryKey
 
 if TYPE_CHECKING:
@@ -49,6 +50,9 @@ class Note(Base):
         return f"<Note(id={self.id}, note_text={self.note_text})>"
 
 
+geography_index("ix_note_location_geography", Note.location)
+
+
 class NoteBase(FarmbaseBase):
     # field_id: Optional[int] = PydanticField(default=None, description="ID of the field where the note was made")
     farm_id: int = PydanticField(..., description="ID of the farm where the note was made")
@@ -1,10 +1,11 @@
-from typing import Optional
+from typing import Optional, Sequence
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from farmbase.farm.note.models import Note, NoteCreate, NoteUpdate
+from farmbase.geospatial.proximity import nearest, within_distance
 
 
 async def get_note(*, db_session: AsyncSession, note_id: int) -> Optional[Note]:
@@ -45,3 +46,17 @@ async def delete_note(*, db_session: AsyncSession, note_id: int) -> None:
     if note:
         await db_session.delete(note)
         await db_session.commit()
+
+
+async def get_notes_near_location(
+    *, db_session: AsyncSession, latitude: float, longitude: float, distance_km: float = 5.0, limit: int = 100
+) -> Sequence[Note]:
+    """Fetch the notes recorded within `distance_km` of a location, nearest first."""
+    result = await db_session.execute(
+        select(Note)
+        .where(Note.location.isnot(None))
+        .where(within_distance(Note.location, latitude, longitude, distance_km * 1000))
+        .order_by(nearest(Note.location, latitude, longitude))
+        .limit(limit)
+    )
+    return result.scalars().all()
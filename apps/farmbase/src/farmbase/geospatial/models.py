@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from typing import Optional
+
 from geoalchemy2 import Geometry
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import Float, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy_utils import CountryType
 
@@ -39,3 +41,49 @@ class Subregion(Base):
 
     def __repr__(self):
         return f"<Subregion(id={self.id}, name={self.name}, region_id={self.region_id})>"
+
+
+class SubregionSuitability(Base):
+    """Zonal statistics of the GAEZ rasters over a subregion, computed offline from its boundary."""
+
+    __table_args__ = {"schema": "farmbase_core"}
+    __tablename__ = "subregion_suitability"
+
+    subregion_id: Mapped[int] = mapped_column(ForeignKey(Subregion.id, ondelete="CASCADE"), primary_key=True)
+    # modal AEZ class of the subregion and its label
+    aez_class: Mapped[Optional[int]] = mapped_column(Integer)
+    aez_classification: Mapped[Optional[str]] = mapped_column(String(100))
+    growing_period_median: Mapped[Optional[float]] = mapped_column(Float)
+
+    # Relationships
+    subregion: Mapped[Subregion] = relationship()
+    crops: Mapped[list[SubregionCropSuitability]] = relationship(
+        back_populates="subregion_suitability",
+        cascade="all, delete-orphan",
+        order_by="SubregionCropSuitability.crop_code",
+    )
+
+    def __repr__(self):
+        return f"<SubregionSuitability(subregion_id={self.subregion_id}, aez_class={self.aez_class})>"
+
+
+class SubregionCropSuitability(Base):
+    """Distribution of the suitability index of a crop over a subregion."""
+
+    __table_args__ = {"schema": "farmbase_core"}
+    __tablename__ = "subregion_crop_suitability"
+
+    subregion_id: Mapped[int] = mapped_column(
+        ForeignKey(SubregionSuitability.subregion_id, ondelete="CASCADE"), primary_key=True
+    )
+    # GAEZ crop code, such as mze for maize
+    crop_code: Mapped[str] = mapped_column(String(10), primary_key=True)
+    mean: Mapped[float] = mapped_column(Float, nullable=False)
+    p10: Mapped[float] = mapped_column(Float, nullable=False)
+    p90: Mapped[float] = mapped_column(Float, nullable=False)
+
+    # Relationships
+    subregion_suitability: Mapped[SubregionSuitability] = relationship(back_populates="crops")
+
+    def __repr__(self):
+        return f"<SubregionCropSuitability(subregion_id={self.subregion_id}, crop_code={self.crop_code})>"
@@ -0,0 +1,39 @@
+"""Proximity search over point locations stored as geometry in SRID 4326."""
+
+from sqlalchemy import ColumnElement, Float, Index, func, literal
+
+
+def geography(location) -> ColumnElement:
+    """Returns a geometry column or expression as geography, the expression `geography_index` indexes."""
+    return func.geography(location)
+
+
+def geography_point(latitude: float, longitude: float) -> ColumnElement:
+    # bound as floats whatever their Python type, so the SQL text is the same for every point
+    point = func.ST_MakePoint(literal(longitude, Float), literal(latitude, Float))
+    return func.geography(func.ST_SetSRID(point, 4326))
+
+
+def geography_index(name: str, location) -> Index:
+    """Returns a GiST index on the geography of a location column, for the predicates of this module."""
+    return Index(name, geography(location), postgresql_using="gist")
+
+
+def within_distance(location, latitude: float, longitude: float, distance_m: float) -> ColumnElement[bool]:
+    """Whether a location lies within distance_m metres of a point."""
+    return func.ST_DWithin(geography(location), geography_point(latitude, longitude), literal(distance_m, Float))
+
+
+def within_distance_of(location, origin, distance_m: float) -> ColumnElement[bool]:
+    """Whether a location lies within distance_m metres of another location, such as a scalar subquery."""
+    return func.ST_DWithin(geography(location), geography(origin), literal(distance_m, Float))
+
+
+def distance(location, latitude: float, longitude: float) -> ColumnElement[float]:
+    """Returns the distance in metres from a location to a point."""
+    return func.ST_Distance(geography(location), geography_point(latitude, longitude))
+
+
+def nearest(location, latitude: float, longitude: float) -> ColumnElement[float]:
+    """Returns the index-assisted (KNN) distance to a point, to order by for the nearest locations first."""
+    return geography(location).op("<->", return_type=Float)(geography_point(latitude, longitude))
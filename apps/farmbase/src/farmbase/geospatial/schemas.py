@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import Field
+
+from farmbase.models import FarmbaseBase
+
+
+class CropSuitabilityRead(FarmbaseBase):
+    """Distribution of the suitability index of a crop over a subregion."""
+
+    crop_code: str = Field(description="GAEZ crop code")
+    crop: str = Field(description="Crop name")
+    mean: float = Field(description="Mean suitability index")
+    p10: float = Field(description="10th percentile of the suitability index")
+    p90: float = Field(description="90th percentile of the suitability index")
+
+
+class SubregionSuitabilityRead(FarmbaseBase):
+    """Zonal statistics of the GAEZ rasters over the subregion containing a point."""
+
+    subregion_id: int
+    subregion: str = Field(description="Subregion name")
+    region: str = Field(description="Region name")
+    aez_class: Optional[int] = Field(default=None, description="Most frequent AEZ class")
+    aez_classification: Optional[str] = Field(default=None, description="Label of the most frequent AEZ class")
+    growing_period_median: Optional[float] = Field(default=None, description="Median growing period in days")
+    crops: List[CropSuitabilityRead]
+    updated_at: datetime = Field(description="When the statistics were computed")
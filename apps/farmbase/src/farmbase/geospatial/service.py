@@ -0,0 +1,54 @@
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from farmbase.data.gaez.views import crop_codes
+from farmbase.geospatial.models import Subregion, SubregionSuitability
+from farmbase.geospatial.schemas import CropSuitabilityRead, SubregionSuitabilityRead
+
+
+async def get_subregion_suitability(
+    session: AsyncSession, latitude: float, longitude: float
+) -> Optional[SubregionSuitabilityRead]:
+    """Returns the zonal statistics of the subregion containing a point, the smallest if several do.
+
+    The point is matched with ST_Intersects on the subregion boundaries, which is answered from their
+    GiST index.
+    """
+    point = func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326)
+    result = await session.execute(
+        select(SubregionSuitability)
+        .join(Subregion, Subregion.id == SubregionSuitability.subregion_id)
+        .where(func.ST_Intersects(Subregion.boundary, point))
+        .options(
+            selectinload(SubregionSuitability.crops),
+            selectinload(SubregionSuitability.subregion).selectinload(Subregion.region),
+        )
+        .order_by(func.ST_Area(Subregion.boundary))
+        .limit(1)
+    )
+    suitability = result.scalar_one_or_none()
+    if suitability is None:
+        return None
+
+    return SubregionSuitabilityRead(
+        subregion_id=suitability.subregion_id,
+        subregion=suitability.subregion.name,
+        region=suitability.subregion.region.name,
+        aez_class=suitability.aez_class,
+        aez_classification=suitability.aez_classification,
+        growing_period_median=suitability.growing_period_median,
+        crops=[
+            CropSuitabilityRead(
+                crop_code=crop.crop_code,
+                crop=crop_codes.get(crop.crop_code, "Unknown Crop"),
+                mean=crop.mean,
+                p10=crop.p10,
+                p90=crop.p90,
+            )
+            for crop in suitability.crops
+        ],
+        updated_at=suitability.updated_at,
+    )
@@ -0,0 +1,24 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Query
+
+from farmbase.database.core import DbSession
+from farmbase.exceptions.exceptions import EntityDoesNotExistError
+from farmbase.geospatial.schemas import SubregionSuitabilityRead
+from farmbase.geospatial.service import get_subregion_suitability
+
+router = APIRouter()
+
+
+@router.get("/suitability", response_model=SubregionSuitabilityRead)
+async def subregion_suitability(
+    session: DbSession,
+    latitude: Annotated[float, Query(ge=-90, le=90, description="The latitude coordinate")],
+    longitude: Annotated[float, Query(ge=-180, le=180, description="The longitude coordinate")],
+) -> SubregionSuitabilityRead:
+    """Get the crop suitability, AEZ class and growing period statistics of the subregion containing a
+    geographical coordinate."""
+    suitability = await get_subregion_suitability(session, latitude, longitude)
+    if suitability is None:
+        raise EntityDoesNotExistError(detail=f"No subregion suitability statistics at lon:{longitude} lat:{latitude}")
+    return suitability
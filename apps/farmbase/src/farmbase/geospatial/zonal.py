@@ -0,0 +1,109 @@
+"""Zonal statistics of the GAEZ rasters over the subregion boundaries."""
+
+from typing import Mapping, Optional
+
+import numpy as np
+from geoalchemy2.shape import to_shape
+from loguru import logger
+from rasterio.features import geometry_mask
+from rasterio.transform import Affine
+from shapely.geometry.base import BaseGeometry
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from farmbase.data.gaez.store import RasterLayer
+from farmbase.geospatial.models import Subregion, SubregionCropSuitability, SubregionSuitability
+
+
+def zone_values(layer: RasterLayer, geometry: BaseGeometry) -> np.ndarray:
+    """Returns the values of the pixels whose centre lies within a geometry, or under a point of a smaller one."""
+    min_x, min_y, max_x, max_y = geometry.bounds
+    corners = [layer.index(x, y) for x in (min_x, max_x) for y in (min_y, max_y)]
+    row_start, row_stop = min(r for r, _ in corners), max(r for r, _ in corners) + 1
+    col_start, col_stop = min(c for _, c in corners), max(c for _, c in corners) + 1
+
+    block = layer.array[row_start:row_stop, col_start:col_stop]
+    window_transform = Affine(*layer.transform) * Affine.translation(col_start, row_start)
+    inside = geometry_mask([geometry], out_shape=block.shape, transform=window_transform, invert=True)
+    if not inside.any():
+        point = geometry.representative_point()
+        row, col = layer.index(point.x, point.y)
+        return layer.array[row : row + 1, col]
+    return block[inside]
+
+
+def _valid(values: np.ndarray, nodata: Optional[float]) -> np.ndarray:
+    valid = values[~np.isnan(values)] if values.dtype.kind == "f" else values
+    return valid if nodata is None else valid[valid != nodata]
+
+
+def modal_value(values: np.ndarray, nodata: Optional[float] = None) -> Optional[int]:
+    """Returns the most frequent value, the lowest of equally frequent ones, or None if there is no data."""
+    values = _valid(values, nodata)
+    if not len(values):
+        return None
+    classes, counts = np.unique(values, return_counts=True)
+    return classes[np.argmax(counts)].item()
+
+
+def median_value(values: np.ndarray, nodata: Optional[float] = None) -> Optional[float]:
+    values = _valid(values, nodata)
+    return float(np.median(values)) if len(values) else None
+
+
+def band_distributions(values: np.ndarray, nodata: Optional[float] = None) -> dict[str, tuple[float, float, float]]:
+    """Returns the (mean, p10, p90) of every band of interleaved layer values, leaving out bands with no data."""
+    distributions = {}
+    for band in values.dtype.names:
+        band_values = _valid(values[band], nodata)
+        if len(band_values):
+            p10, p90 = np.percentile(band_values, [10, 90])
+            distributions[band] = (float(band_values.mean()), float(p10), float(p90))
+    return distributions
+
+
+def subregion_suitability(
+    subregion_id: int,
+    geometry: BaseGeometry,
+    aez: RasterLayer,
+    class_map: Mapping[int, str],
+    growing_period: RasterLayer,
+    suitability: RasterLayer,
+) -> SubregionSuitability:
+    """Computes the zonal statistics of a subregion boundary."""
+    aez_class = modal_value(zone_values(aez, geometry), aez.nodata)
+    distributions = band_distributions(zone_values(suitability, geometry), suitability.nodata)
+    return SubregionSuitability(
+        subregion_id=subregion_id,
+        aez_class=aez_class,
+        aez_classification=None if aez_class is None else class_map.get(aez_class, "Unknown Classification"),
+        growing_period_median=median_value(zone_values(growing_period, geometry), growing_period.nodata),
+        crops=[
+            SubregionCropSuitability(subregion_id=subregion_id, crop_code=crop_code, mean=mean, p10=p10, p90=p90)
+            for crop_code, (mean, p10, p90) in distributions.items()
+        ],
+    )
+
+
+def refresh_subregion_suitability(
+    session: Session,
+    aez: RasterLayer,
+    class_map: Mapping[int, str],
+    growing_period: RasterLayer,
+    suitability: RasterLayer,
+) -> int:
+    """Recomputes the zonal statistics of every subregion, replacing the stored ones. Returns their number."""
+    session.execute(delete(SubregionSuitability))
+    count = 0
+    for subregion_id, boundary in session.execute(select(Subregion.id, Subregion.boundary)).all():
+        if boundary is None:
+            continue
+        session.add(
+            subregion_suitability(subregion_id, to_shape(boundary), aez, class_map, growing_period, suitability)
+        )
+        count += 1
+        if count % 100 == 0:
+            session.flush()
+            logger.info(f"Computed suitability statistics for {count} subregions")
+    session.flush()
+    return count
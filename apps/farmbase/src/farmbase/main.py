@@ -1,5 +1,4 @@
-from contextvars import ContextVar
-from typing import Final, Optional
+from contextlib import asynccontextmanager
 from uuid import uuid1
 
 from fastapi import FastAPI, status
@@ -7,20 +6,46 @@ from fastapi.responses import JSONResponse
 from fastapi.routing import APIRoute
 from fastapi_problem.handler import add_exception_handler, new_exception_handler
 from loguru import logger
-from sqlalchemy.ext.asyncio import async_scoped_session, async_sessionmaker
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.gzip import GZipMiddleware
 from starlette.requests import Request
-from starlette.routing import compile_path
 
+from .agronomy.catalogue import agronomy_catalogue
 from .api import api_router
+from .auth import get_auth
 from .common.utils.cli import install_plugin_events, install_plugins
+from .common.utils.routing import RouteIndex
 from .config import settings
-from .database.core import engine, get_schema_names
+from .context import _request_id_ctx_var
+from .data.datasets import dataset_registry
+from .database.core import get_schema_name, get_tenant_session_factory
 from .database.logging import SessionTracker
+from .database.tenant import tenant_registry
+
+
+@asynccontextmanager
+async def lifespan(_):
+    # auth and the engines are initialised lazily, warm them up before serving requests
+    await run_in_threadpool(get_auth)
+    # warm the tenant schema registry so requests never introspect the database
+    await tenant_registry.start()
+    # load the agronomy catalogue up front, if this fails it is loaded by the first request that needs it
+    try:
+        async with get_tenant_session_factory("default")() as session:
+            await agronomy_catalogue.get(session)
+    except Exception as e:
+        logger.error(f"Failed to load the agronomy catalogue: {e}")
+    # download the GAEZ and crop variety datasets in the background, their endpoints answer 503 until loaded
+    if settings.DATASET_WARMUP_ENABLED:
+        dataset_registry.start()
+    yield
+    await dataset_registry.stop()
+    await tenant_registry.stop()
+
 
 # we create the ASGI for the app
-app = FastAPI(openapi_url="")
+app = FastAPI(openapi_url="", lifespan=lifespan)
 # app.state.limiter = limiter
 # app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 app.add_middleware(GZipMiddleware, minimum_size=1000)
@@ -57,15 +82,13 @@ app.add_middleware(
 )
 
 
+# built once all API routes have been added, see the bottom of this module
+route_index: RouteIndex | None = None
+
+
 def get_path_params_from_request(request: Request) -> dict:
-    path_params = {}
-    for r in api_router.routes:
-        path_regex, path_format, param_converters = compile_path(r.path)
-        path = request["path"].removeprefix("/api/v1")  # remove the /api/v1 for matching
-        match = path_regex.match(path)
-        if match:
-            path_params = match.groupdict()
-    return path_params
+    path = request["path"].removeprefix("/api/v1")  # remove the /api/v1 for matching
+    return route_index.match(path)
 
 
 def get_path_template(request: Request) -> str:
@@ -74,14 +97,6 @@ def get_path_template(request: Request) -> str:
     return ".".join(request.url.path.split("/")[1:])
 
 
-REQUEST_ID_CTX_KEY: Final[str] = "request_id"
-_request_id_ctx_var: ContextVar[Optional[str]] = ContextVar(REQUEST_ID_CTX_KEY, default=None)
-
-
-def get_request_id() -> Optional[str]:
-    return _request_id_ctx_var.get()
-
-
 @api.middleware("http")
 async def db_session_middleware(request: Request, call_next):
     request_id = str(uuid1())
@@ -89,7 +104,6 @@ async def db_session_middleware(request: Request, call_next):
     # we create a per-request id such that we can ensure that our session is scoped for a particular request.
     # see: https://github.com/tiangolo/fastapi/issues/726
     ctx_token = _request_id_ctx_var.set(request_id)
-    session = None
 
     try:
         path_params = get_path_params_from_request(request)
@@ -97,25 +111,17 @@ async def db_session_middleware(request: Request, call_next):
         # if this call is organization specific set the correct search path
         organization_slug = path_params.get("organization", "default")
         request.state.organization = organization_slug
-        schema = f"farmbase_organization_{organization_slug}"
+        schema = get_schema_name(organization_slug)
 
         # validate slug exists
-        schema_names = await get_schema_names(engine)
-        if schema not in schema_names:
+        if not await tenant_registry.contains(schema):
             return JSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content={"detail": [{"msg": f"Unknown database schema name: {schema}"}]},
             )
 
-        # add correct schema mapping depending on the request
-        schema_engine = engine.execution_options(schema_translate_map={None: schema})
-        async_session_factory = async_sessionmaker(
-            bind=schema_engine,
-            expire_on_commit=False,
-        )
-
-        AsyncScopedSession = async_scoped_session(async_session_factory, scopefunc=get_request_id)  # noqa: N806
-        request.state.db = AsyncScopedSession()
+        # use the cached session factory with the correct schema mapping for the request
+        request.state.db = get_tenant_session_factory(organization_slug)()
 
         # we track the session
         request.state.db._farmbase_session_id = SessionTracker.track_session(
@@ -153,8 +159,6 @@ async def db_session_middleware(request: Request, call_next):
             # Close the session
             try:
                 await request.state.db.close()
-                if session is not None:
-                    await session.remove()  # Remove the session from the registry
             except Exception as close_error:
                 logger.error(f"Error closing database session: {close_error}")
 
@@ -178,4 +182,7 @@ install_plugin_events(api_router)
 # we add all API routes to the Web API framework
 api.include_router(api_router)
 
+# we index the API routes so organization slugs can be extracted without scanning every route
+route_index = RouteIndex.from_routes(api_router.routes)
+
 app.mount("/api/v1", app=api)
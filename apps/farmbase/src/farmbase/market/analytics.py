@@ -0,0 +1,177 @@
+"""Price signals of the commodities traded at a market."""
+
+import time
+from collections import OrderedDict
+from datetime import date, timedelta
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from sqlalchemy import Date, Float, Select, String, and_, bindparam, func, select, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from farmbase.commodity.models import Commodity
+from farmbase.commodity.schemas import CommodityRead
+from farmbase.config import settings
+from farmbase.geospatial.proximity import within_distance_of
+from farmbase.market.models import Market, MarketLatestPrice, MarketPrice
+from farmbase.market.schemas import CommodityPriceSignals
+from farmbase.metrics import service as metrics_service
+
+# days of history read for the rolling windows at a latest price up to 30 days old
+_HISTORY_DAYS = 60
+
+
+def price_signals_query(*, market_id: int, on: date, distance_km: int) -> Select:
+    """Builds the query for the price signals of every commodity of a market as of a day."""
+    # the days are bound as dates computed here, so that the SQL text is the same for every day
+    history_since = bindparam("history_since", on - timedelta(days=_HISTORY_DAYS), type_=Date)
+    month_since = bindparam("month_since", on - timedelta(days=30), type_=Date)
+    week_since = bindparam("week_since", on - timedelta(days=7), type_=Date)
+    until = bindparam("until", on, type_=Date)
+
+    # 1. Rolling windows over the market's series; the window key is the day number, as RANGE offsets
+    #    on a date column would need intervals
+    day = MarketPrice.date - until
+
+    def mean(days: tuple[int, int]):
+        return func.avg(MarketPrice.retail_price).over(partition_by=MarketPrice.commodity_id, order_by=day, range_=days)
+
+    windows = (
+        select(
+            MarketPrice.commodity_id,
+            MarketPrice.date,
+            MarketPrice.retail_price,
+            MarketPrice.retail_unit,
+            type_coerce(MarketPrice.retail_ccy, String).label("retail_ccy"),
+            mean((-6, 0)).label("mean_7d"),
+            mean((-29, 0)).label("mean_30d"),
+            mean((-13, -7)).label("previous_mean_7d"),
+        )
+        .where(MarketPrice.market_id == market_id)
+        .where(MarketPrice.date > history_since, MarketPrice.date <= until)
+        .where(MarketPrice.retail_price.isnot(None))
+        .subquery()
+    )
+
+    # 2. The latest row of each commodity carries its signals
+    latest = (
+        select(windows)
+        .distinct(windows.c.commodity_id)
+        .where(windows.c.date > month_since)
+        .order_by(windows.c.commodity_id, windows.c.date.desc())
+        .subquery()
+    )
+
+    # 3. Latest price of this week at each market within the radius, for the commodities of this market
+    traded = select(MarketLatestPrice.commodity_id).where(MarketLatestPrice.market_id == market_id)
+    origin = select(Market.location).where(Market.id == market_id).scalar_subquery()
+    nearby = (
+        select(MarketPrice.market_id, MarketPrice.commodity_id, MarketPrice.retail_unit, MarketPrice.retail_price)
+        .distinct(MarketPrice.market_id, MarketPrice.commodity_id)
+        .join(Market, Market.id == MarketPrice.market_id)
+        .where(within_distance_of(Market.location, origin, distance_km * 1000))
+        .where(MarketPrice.commodity_id.in_(traded))
+        .where(MarketPrice.date > week_since, MarketPrice.date <= until)
+        .where(MarketPrice.retail_price.isnot(None))
+        .order_by(MarketPrice.market_id, MarketPrice.commodity_id, MarketPrice.date.desc())
+        .subquery()
+    )
+    spread = (
+        select(
+            nearby.c.commodity_id,
+            nearby.c.retail_unit,
+            func.count().label("nearby_markets"),
+            func.min(nearby.c.retail_price).label("nearby_min_price"),
+            func.percentile_cont(0.5).within_group(nearby.c.retail_price).label("nearby_median_price"),
+            func.max(nearby.c.retail_price).label("nearby_max_price"),
+        )
+        .group_by(nearby.c.commodity_id, nearby.c.retail_unit)
+        .subquery()
+    )
+
+    week_over_week = latest.c.mean_7d / func.nullif(latest.c.previous_mean_7d, 0, type_=Float) - 1
+    return (
+        select(
+            Commodity,
+            latest.c.date.label("price_date"),
+            latest.c.retail_price,
+            latest.c.retail_unit,
+            latest.c.retail_ccy,
+            latest.c.mean_7d,
+            latest.c.mean_30d,
+            week_over_week.label("week_over_week"),
+            func.coalesce(spread.c.nearby_markets, 0).label("nearby_markets"),
+            spread.c.nearby_min_price,
+            spread.c.nearby_median_price,
+            spread.c.nearby_max_price,
+        )
+        .join(Commodity, Commodity.id == latest.c.commodity_id)
+        .outerjoin(
+            spread,
+            and_(
+                spread.c.commodity_id == latest.c.commodity_id,
+                spread.c.retail_unit.is_not_distinct_from(latest.c.retail_unit),
+            ),
+        )
+        .order_by(Commodity.name)
+    )
+
+
+def _to_signals(row) -> CommodityPriceSignals:
+    fields = row._asdict()
+    commodity = fields.pop("Commodity")
+    return CommodityPriceSignals(commodity=CommodityRead.model_validate(commodity), **fields)
+
+
+class PriceSignalCache:
+    """In-process, TTL based cache of the price signals of a market as of a day."""
+
+    def __init__(self, ttl: float, maxsize: int, distance_km: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.distance_km = distance_km
+        self._entries: OrderedDict[tuple[int, date], tuple[float, Mapping[int, CommodityPriceSignals]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, session: AsyncSession, market_id: int, on: date) -> Mapping[int, CommodityPriceSignals]:
+        """Returns the signals of a market as of a day by commodity id, computing them with `session` if needed."""
+        key = (market_id, on)
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] <= self.ttl:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            metrics_service.increment("farmbase_market_signals_cache_hits_total")
+            return entry[1]
+
+        self.misses += 1
+        metrics_service.increment("farmbase_market_signals_cache_misses_total")
+        result = await session.execute(price_signals_query(market_id=market_id, on=on, distance_km=self.distance_km))
+        # the rows are converted while the commodities are loaded in the session
+        signals = MappingProxyType({row.Commodity.id: _to_signals(row) for row in result})
+        self._entries[key] = (time.monotonic(), signals)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return signals
+
+    def invalidate(self) -> None:
+        """Drops all cached signals, e.g. after a price was written."""
+        self._entries.clear()
+
+
+price_signals = PriceSignalCache(
+    ttl=settings.MARKET_SIGNALS_TTL,
+    maxsize=settings.MARKET_SIGNALS_CACHE_SIZE,
+    distance_km=settings.MARKET_SIGNALS_DISTANCE_KM,
+)
+
+
+async def get_price_signals(
+    *, db_session: AsyncSession, market_id: int, on: Optional[date] = None, commodity_id: Optional[int] = None
+) -> list[CommodityPriceSignals]:
+    """Returns the price signals of the commodities traded in a market, as of today unless `on` is given."""
+    signals = await price_signals.get(db_session, market_id, on or date.today())
+    if commodity_id is not None:
+        return [signals[commodity_id]] if commodity_id in signals else []
+    return list(signals.values())
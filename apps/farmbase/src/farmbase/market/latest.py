@@ -0,0 +1,56 @@
+"""Latest price of every commodity at every market."""
+
+from typing import Iterable, Optional
+
+from sqlalchemy import and_, delete, exists, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+
+from farmbase.market.models import MarketLatestPrice, MarketPrice
+
+_KEY = ["market_id", "commodity_id"]
+
+_COLUMNS = _KEY + [
+    "date",
+    "supply_volume",
+    "wholesale_price",
+    "wholesale_unit",
+    "wholesale_ccy",
+    "retail_price",
+    "retail_unit",
+    "retail_ccy",
+]
+
+
+def refresh_latest_prices(connection, keys: Optional[Iterable[tuple[int, int]]] = None) -> None:
+    """Recomputes the latest prices of (market_id, commodity_id) pairs, or of all pairs if keys is None."""
+    # the latest row of each pair is read backwards from the uq_market_price index
+    latest = (
+        select(*(getattr(MarketPrice, column) for column in _COLUMNS))
+        .distinct(MarketPrice.market_id, MarketPrice.commodity_id)
+        .where(MarketPrice.date.isnot(None))
+        .order_by(MarketPrice.market_id, MarketPrice.commodity_id, MarketPrice.date.desc())
+    )
+    priced = exists().where(
+        and_(
+            MarketPrice.market_id == MarketLatestPrice.market_id,
+            MarketPrice.commodity_id == MarketLatestPrice.commodity_id,
+            MarketPrice.date.isnot(None),
+        )
+    )
+    stale = delete(MarketLatestPrice).where(~priced).execution_options(synchronize_session=False)
+
+    if keys is not None:
+        keys = list(set(keys))
+        if not keys:
+            return
+        latest = latest.where(tuple_(MarketPrice.market_id, MarketPrice.commodity_id).in_(keys))
+        stale = stale.where(tuple_(MarketLatestPrice.market_id, MarketLatestPrice.commodity_id).in_(keys))
+
+    # an upsert, so that concurrent refreshes of the same pair do not collide on the primary key
+    upsert = insert(MarketLatestPrice).from_select(_COLUMNS, latest)
+    upsert = upsert.on_conflict_do_update(
+        index_elements=_KEY,
+        set_={column: upsert.excluded[column] for column in _COLUMNS if column not in _KEY},
+    )
+    connection.execute(upsert)
+    connection.execute(stale)
@@ -8,6 +8,7 @@ from sqlalchemy import (
     Date,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
@@ -16,6 +17,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy_utils import CurrencyType
 
 from farmbase.database.core import Base
+from farmbase.geospatial.proximity import geography_index
 
 
 class Market(Base):
@@ -33,6 +35,9 @@ class Market(Base):
     market_prices: Mapped[list["MarketPrice"]] = relationship(back_populates="market")
 
 
+geography_index("ix_market_location_geography", Market.location)
+
+
 class MarketPrice(Base):
     """
     Records the price of a specific commodity at a given market on a particular date.
@@ -41,6 +46,8 @@ class MarketPrice(Base):
 
     __table_args__ = (
         UniqueConstraint("market_id", "commodity_id", "date", name="uq_market_price"),
+        # prices are appended in date order, so a BRIN index serves date ranges
+        Index("ix_market_price_date_brin", "date", postgresql_using="brin"),
         {"schema": "farmbase_core"},
     )
     __tablename__ = "market_price"
@@ -73,3 +80,30 @@ class MarketPrice(Base):
             f"commodity='{commodity_name}', date={self.date}, "
             f"wholesale_price={self.wholesale_price})>"
         )
+
+
+class MarketLatestPrice(Base):
+    """
+    The most recent price of a commodity at a market, one row per market and commodity.
+    Maintained from market_price by farmbase.market.latest.refresh_latest_prices.
+    """
+
+    __table_args__ = (
+        # answers "does the market have a price since <date>" from the index alone
+        Index("ix_market_latest_price_market_id_date", "market_id", "date"),
+        {"schema": "farmbase_core"},
+    )
+    __tablename__ = "market_latest_price"
+
+    market_id: Mapped[int] = mapped_column(ForeignKey("farmbase_core.market.id", ondelete="CASCADE"), primary_key=True)
+    commodity_id: Mapped[int] = mapped_column(
+        ForeignKey("farmbase_core.commodity.id", ondelete="CASCADE"), primary_key=True
+    )
+    date: Mapped[datetime.date] = mapped_column(Date, nullable=False)
+    supply_volume: Mapped[float | None] = mapped_column(Float, nullable=True)
+    wholesale_price: Mapped[float | None] = mapped_column(Float, nullable=True)
+    wholesale_unit: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    wholesale_ccy: Mapped[str | None] = mapped_column(CurrencyType, nullable=True)
+    retail_price: Mapped[float | None] = mapped_column(Float, nullable=True)
+    retail_unit: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    retail_ccy: Mapped[str | None] = mapped_column(CurrencyType, nullable=True)
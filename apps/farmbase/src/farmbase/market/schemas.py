@@ -88,7 +88,7 @@ class CommodityPriceSnapshot(FarmbaseBase):
     commodity: CommodityRead = Field(description="Commodity information")
     price_date: List[date] = Field(description="List of price dates")
     supply_volume: List[Optional[float]] = Field(description="List of supply volumes")
-    # wholesale_price: List[Optional[float]] = Field(description="List of wholesale prices")
+    wholesale_price: List[Optional[float]] = Field(default_factory=list, description="List of wholesale prices")
     # wholesale_unit: Optional[str] = Field(
     #     default=None, description="Unit for wholesale price (consistent across dates)"
     # )
@@ -107,3 +107,33 @@ class MarketSnapshotRead(FarmbaseBase):
     latest_prices: List[CommodityPriceSnapshot] = Field(
         description="Latest prices for each commodity in the market (last 3 months)"
     )
+
+
+class CommodityPriceSignals(FarmbaseBase):
+    """Model for precomputed price signals of a commodity at a market."""
+
+    commodity: CommodityRead = Field(description="Commodity information")
+    price_date: date = Field(description="Date of the latest retail price")
+    retail_price: float = Field(description="Latest retail price")
+    retail_unit: Optional[str] = Field(default=None, description="Unit for retail price")
+    retail_ccy: Optional[str] = Field(default=None, description="Currency for retail price")
+    mean_7d: Optional[float] = Field(default=None, description="Mean retail price over the 7 days to price_date")
+    mean_30d: Optional[float] = Field(default=None, description="Mean retail price over the 30 days to price_date")
+    week_over_week: Optional[float] = Field(
+        default=None, description="Change of the 7 day mean from the 7 days before, as a fraction"
+    )
+    nearby_markets: int = Field(
+        default=0, description="Markets within the radius, this one included, with a price in the same unit this week"
+    )
+    nearby_min_price: Optional[float] = Field(default=None, description="Lowest latest price of the nearby markets")
+    nearby_median_price: Optional[float] = Field(default=None, description="Median latest price of the nearby markets")
+    nearby_max_price: Optional[float] = Field(default=None, description="Highest latest price of the nearby markets")
+
+
+class MarketSignalsRead(FarmbaseBase):
+    """Model for reading the price signals of every commodity traded in a market."""
+
+    market: MarketRead = Field(description="Market information")
+    as_of: date = Field(description="Day the signals were computed for")
+    distance_km: int = Field(description="Radius of the nearby markets, in kilometres")
+    signals: List[CommodityPriceSignals] = Field(default_factory=list, description="Signals for each commodity")
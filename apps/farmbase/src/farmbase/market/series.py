@@ -0,0 +1,50 @@
+"""Market prices as time series."""
+
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import ColumnElement, Date, Select, String, bindparam, func, select, type_coerce
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
+
+from farmbase.commodity.models import Commodity
+from farmbase.market.models import MarketPrice
+
+
+def _by_date(column) -> ColumnElement:
+    return func.array_agg(aggregate_order_by(column, MarketPrice.date))
+
+
+def _first(column) -> ColumnElement:
+    """The earliest non-null value of a column in the series, as text."""
+    values = func.array_agg(aggregate_order_by(type_coerce(column, String), MarketPrice.date)).filter(
+        column.isnot(None)
+    )
+    return type_coerce(values, ARRAY(String))[1]
+
+
+def price_series_query(*, since: date, market_id: Optional[int] = None, commodity_id: Optional[int] = None) -> Select:
+    """Builds the query for the price series since a date, one row of date-ordered arrays per market and commodity."""
+    stmt = (
+        select(
+            Commodity,
+            MarketPrice.market_id,
+            MarketPrice.commodity_id,
+            _by_date(MarketPrice.date).label("price_date"),
+            _by_date(MarketPrice.supply_volume).label("supply_volume"),
+            _by_date(MarketPrice.wholesale_price).label("wholesale_price"),
+            _by_date(MarketPrice.retail_price).label("retail_price"),
+            _first(MarketPrice.wholesale_unit).label("wholesale_unit"),
+            _first(MarketPrice.wholesale_ccy).label("wholesale_ccy"),
+            _first(MarketPrice.retail_unit).label("retail_unit"),
+            _first(MarketPrice.retail_ccy).label("retail_ccy"),
+        )
+        .join(Commodity, Commodity.id == MarketPrice.commodity_id)
+        .where(MarketPrice.date >= bindparam("since", since, type_=Date))
+        .group_by(MarketPrice.market_id, MarketPrice.commodity_id, Commodity.id)
+        .order_by(MarketPrice.market_id, MarketPrice.commodity_id)
+    )
+    if market_id is not None:
+        stmt = stmt.where(MarketPrice.market_id == market_id)
+    if commodity_id is not None:
+        stmt = stmt.where(MarketPrice.commodity_id == commodity_id)
+    return stmt
@@ -1,12 +1,16 @@
 from datetime import date, timedelta
 from typing import Optional, Sequence
 
-from sqlalchemy import func, select, text
+from sqlalchemy import Integer, Row, Select, bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from .models import Market, MarketPrice
+from ..geospatial.proximity import nearest, within_distance
+from .analytics import price_signals
+from .latest import refresh_latest_prices
+from .models import Market, MarketLatestPrice, MarketPrice
 from .schemas import MarketCreate, MarketPriceCreate, MarketPriceUpdate, MarketUpdate
+from .series import price_series_query
 
 
 # Market service functions
@@ -133,7 +137,10 @@ async def create_market_price(*, db_session: AsyncSession, market_price_in: Mark
     market_price = MarketPrice(**market_price_in.model_dump())
 
     db_session.add(market_price)
+    await db_session.flush()
+    await db_session.run_sync(refresh_latest_prices, [(market_price.market_id, market_price.commodity_id)])
     await db_session.commit()
+    price_signals.invalidate()
     await db_session.refresh(market_price)
 
     return await get_market_price(db_session=db_session, market_price_id=market_price.id)
@@ -144,11 +151,18 @@ async def update_market_price(
 ) -> MarketPrice:
     """Updates a market price."""
     update_data = market_price_in.model_dump(exclude_unset=True, exclude_none=True)
+    # the price may move to another market or commodity, which leaves the latest price of its old pair stale
+    previous_key = (market_price.market_id, market_price.commodity_id)
 
     for field, value in update_data.items():
         setattr(market_price, field, value)
 
+    await db_session.flush()
+    await db_session.run_sync(
+        refresh_latest_prices, [previous_key, (market_price.market_id, market_price.commodity_id)]
+    )
     await db_session.commit()
+    price_signals.invalidate()
     await db_session.refresh(market_price)
     return market_price
 
@@ -159,90 +173,75 @@ async def delete_market_price(*, db_session: AsyncSession, market_price_id: int)
     market_price = result.scalar_one_or_none()
     if market_price:
         await db_session.delete(market_price)
+        await db_session.flush()
+        await db_session.run_sync(refresh_latest_prices, [(market_price.market_id, market_price.commodity_id)])
         await db_session.commit()
+        price_signals.invalidate()
 
 
-async def get_market_snapshot(*, db_session: AsyncSession, market_id: int) -> Sequence[MarketPrice]:
-    """Returns all prices from the last month for commodities traded in the given market."""
+async def get_market_snapshot(*, db_session: AsyncSession, market_id: int) -> Sequence[Row]:
+    """Returns the price series of the last month for each commodity traded in the given market."""
     one_month_ago = date.today() - timedelta(days=30)
 
-    # Get all market prices for the market within the last 3 months
-    result = await db_session.execute(
-        select(MarketPrice)
-        .options(selectinload(MarketPrice.market), selectinload(MarketPrice.commodity))
-        .where(MarketPrice.market_id == market_id)
-        .where(MarketPrice.date >= one_month_ago)
-        .order_by(MarketPrice.commodity_id, MarketPrice.date)
-    )
-
-    return result.scalars().all()
+    result = await db_session.execute(price_series_query(since=one_month_ago, market_id=market_id))
+    return result.all()
 
 
-async def get_markets_near_location(
+def markets_near_location_query(
     *,
-    db_session: AsyncSession,
     latitude: float,
     longitude: float,
     distance_km: int = 50,
     limit: int = 100,
     offset: int = 0,
     price_within_days: int | None = None,
-) -> Sequence[Market]:
-    """Returns markets within `distance_km` of the given latitude and longitude using PostGIS via GeoAlchemy2."""
-    # Distance in metres
-    distance_m = distance_km * 1000
+) -> Select:
+    """Builds the query for markets within `distance_km` of the given latitude and longitude using PostGIS."""
+    # 1. Spatial predicate on the geography index: within distance, in metres
+    distance_condition = within_distance(Market.location, latitude, longitude, distance_km * 1000)
 
-    # Build a POINT geometry in SRID 4326 and then transform to 3857
-    # Option A: using ST_MakePoint and ST_SetSRID
-    point_geom = func.ST_Transform(func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326), 3857)
+    # 2. Only markets with prices, looked up per market in the latest price table
+    has_prices = select(MarketLatestPrice.market_id).where(MarketLatestPrice.market_id == Market.id)
 
-    # If Market.location is stored as Geometry with SRID 4326, transform it to 3857
-    market_loc_3857 = func.ST_Transform(Market.location, 3857)
+    # 3. If price_within_days is given, the latest price must be recent enough
+    if price_within_days is not None:
+        # Postgres: current_date - $n, a date minus a bound number of days, so the SQL text stays the same
+        cutoff_expr = func.current_date() - bindparam("price_within_days", price_within_days, type_=Integer)
+        has_prices = has_prices.where(MarketLatestPrice.date >= cutoff_expr)
 
-    # Spatial predicate: within distance
-    distance_condition = func.ST_DWithin(market_loc_3857, point_geom, distance_m)
+    # 4. Build main query: filter spatially and on prices…
+    stmt = select(Market).where(Market.location.isnot(None)).where(distance_condition).where(has_prices.exists())
 
-    # Ordering by actual distance
-    distance_order = func.ST_Distance(market_loc_3857, point_geom)
+    # 5. Order nearest first, by the index (KNN), and paginate
+    return stmt.order_by(nearest(Market.location, latitude, longitude)).limit(limit).offset(offset)
 
-    # 2. Subquery: latest date per market_id in market_prices
-    latest_date_sq = (
-        select(MarketPrice.market_id.label("mkt_id"), func.max(MarketPrice.date).label("max_date"))
-        .group_by(MarketPrice.market_id)
-        .subquery()
-    )
 
-    # 3. Build main query: join Market -> latest_date_sq, filter spatially…
-    stmt = (
-        select(Market)
-        .join(latest_date_sq, Market.id == latest_date_sq.c.mkt_id)
-        .where(Market.location.isnot(None))
-        .where(distance_condition)
+async def get_markets_near_location(
+    *,
+    db_session: AsyncSession,
+    latitude: float,
+    longitude: float,
+    distance_km: int = 50,
+    limit: int = 100,
+    offset: int = 0,
+    price_within_days: int | None = None,
+) -> Sequence[Market]:
+    """Returns markets within `distance_km` of the given latitude and longitude using PostGIS via GeoAlchemy2."""
+    stmt = markets_near_location_query(
+        latitude=latitude,
+        longitude=longitude,
+        distance_km=distance_km,
+        limit=limit,
+        offset=offset,
+        price_within_days=price_within_days,
     )
-
-    # 4. If price_within_days is given, add condition on latest date
-    if price_within_days is not None:
-        # Postgres: current_date - INTERVAL 'x days'
-        interval_text = text(f"INTERVAL '{price_within_days} days'")
-        cutoff_expr = func.current_date() - interval_text
-        stmt = stmt.where(latest_date_sq.c.max_date >= cutoff_expr)
-
-    # 5. Order, paginate
-    stmt = stmt.order_by(distance_order).limit(limit).offset(offset)
-
     result = await db_session.execute(stmt)
     return result.scalars().all()
 
 
 async def count_markets_near_location(*, db_session: AsyncSession, latitude: float, longitude: float) -> int:
     """Returns the count of markets within 50km of the given latitude and longitude."""
-    # Create a point from the provided coordinates
-    point_wkt = f"POINT({longitude} {latitude})"
-
-    # Count markets within 50km
-    distance_condition = text(
-        f"ST_DWithin(ST_Transform(location, 3857), ST_Transform(ST_GeomFromText('{point_wkt}', 4326), 3857), 50000)"
-    )
+    distance_condition = within_distance(Market.location, latitude, longitude, 50_000)
 
     result = await db_session.execute(
         select(func.count(Market.id)).where(Market.location.isnot(None)).where(distance_condition)
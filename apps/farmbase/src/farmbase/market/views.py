@@ -1,3 +1,4 @@
+from datetime import date
 from typing import Annotated
 
 from fastapi import APIRouter, Query
@@ -6,6 +7,7 @@ from farmbase.database.core import DbSession
 from farmbase.models import PrimaryKey
 
 from ..exceptions.exceptions import EntityAlreadyExistsError, EntityDoesNotExistError
+from .analytics import get_price_signals, price_signals
 from .schemas import (
     CommodityPriceSnapshot,
     MarketCreate,
@@ -13,6 +15,7 @@ from .schemas import (
     MarketPricePagination,
     MarketPriceRead,
     MarketRead,
+    MarketSignalsRead,
     MarketSnapshotRead,
     MarketUpdate,
 )
@@ -151,43 +154,21 @@ async def get_market_snapshot_endpoint(
     if not market:
         raise EntityDoesNotExistError(message="Market not found.")
 
-    market_prices = await get_market_snapshot(db_session=db_session, market_id=market_id)
-
-    # Group prices by commodity
-    from collections import defaultdict
-
-    grouped_prices = defaultdict(list)
-    for price in market_prices:
-        grouped_prices[price.commodity_id].append(price)
-
-    # Create commodity snapshots
-    commodity_snapshots = []
-    for commodity_id, prices in grouped_prices.items():
-        # Sort prices by date
-        prices.sort(key=lambda p: p.date or "")
-
-        # Extract the commodity (all prices have the same commodity)
-        commodity = prices[0].commodity
-
-        # Get consistent units and currency from the first non-null entry
-        retail_unit = None
-        retail_ccy = None
-
-        for price in prices:
-            if not retail_unit and price.retail_unit:
-                retail_unit = price.retail_unit
-            if not retail_ccy and price.retail_ccy:
-                retail_ccy = str(price.retail_ccy)
-
-        commodity_snapshot = CommodityPriceSnapshot(
-            commodity=commodity,
-            price_date=[price.date for price in prices],
-            supply_volume=[price.supply_volume for price in prices],
-            retail_price=[price.retail_price for price in prices],
-            retail_unit=retail_unit,
-            retail_ccy=retail_ccy,
+    series = await get_market_snapshot(db_session=db_session, market_id=market_id)
+
+    # the arrays come ordered by date from the database, one row per commodity
+    commodity_snapshots = [
+        CommodityPriceSnapshot(
+            commodity=row.Commodity,
+            price_date=row.price_date,
+            supply_volume=row.supply_volume,
+            wholesale_price=row.wholesale_price,
+            retail_price=row.retail_price,
+            retail_unit=row.retail_unit,
+            retail_ccy=row.retail_ccy,
         )
-        commodity_snapshots.append(commodity_snapshot)
+        for row in series
+    ]
 
     return MarketSnapshotRead(
         market=MarketRead.model_validate(market),
@@ -195,6 +176,29 @@ async def get_market_snapshot_endpoint(
     )
 
 
+@router.get("/{market_id}/signals", response_model=MarketSignalsRead)
+async def get_market_signals_endpoint(
+    db_session: DbSession,
+    market_id: PrimaryKey,
+    commodity_id: int | None = None,
+):
+    """Get today's price signals for each commodity traded in this market: latest price, 7 and 30 day means,
+    week-over-week change and the spread of prices at nearby markets."""
+    market = await get_market(db_session=db_session, market_id=market_id)
+    if not market:
+        raise EntityDoesNotExistError(message="Market not found.")
+
+    today = date.today()
+    signals = await get_price_signals(db_session=db_session, market_id=market_id, on=today, commodity_id=commodity_id)
+
+    return MarketSignalsRead(
+        market=MarketRead.model_validate(market),
+        as_of=today,
+        distance_km=price_signals.distance_km,
+        signals=signals,
+    )
+
+
 # Market price endpoints
 @price_router.get("", response_model=MarketPricePagination)
 async def get_market_prices(
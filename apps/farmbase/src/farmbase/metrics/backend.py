@@ -0,0 +1,141 @@
+import bisect
+import math
+import threading
+from abc import ABC, abstractmethod
+from collections import defaultdict
+
+LabelKey = tuple[tuple[str, str], ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _label_key(labels: dict[str, str] | None) -> LabelKey:
+    return tuple(sorted(labels.items())) if labels else ()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key: LabelKey, extra: LabelKey = ()) -> str:
+    items = key + extra
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in items) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    return repr(float(value))
+
+
+class MetricsBackend(ABC):
+    """Interface for recording counters, gauges and histograms."""
+
+    @abstractmethod
+    def increment(self, name: str, value: float = 1.0, labels: dict[str, str] | None = None) -> None: ...
+
+    @abstractmethod
+    def set_gauge(self, name: str, value: float, labels: dict[str, str] | None = None) -> None: ...
+
+    @abstractmethod
+    def observe(self, name: str, value: float, labels: dict[str, str] | None = None) -> None: ...
+
+    @abstractmethod
+    def render(self) -> str:
+        """Renders the metrics in the Prometheus text exposition format."""
+
+
+class NullMetricsBackend(MetricsBackend):
+    """Discards all metrics."""
+
+    def increment(self, name: str, value: float = 1.0, labels: dict[str, str] | None = None) -> None:
+        pass
+
+    def set_gauge(self, name: str, value: float, labels: dict[str, str] | None = None) -> None:
+        pass
+
+    def observe(self, name: str, value: float, labels: dict[str, str] | None = None) -> None:
+        pass
+
+    def render(self) -> str:
+        return ""
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class InMemoryMetricsBackend(MetricsBackend):
+    """Keeps metrics in process memory and renders them for a Prometheus scrape."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[LabelKey, float]] = defaultdict(dict)
+        self._gauges: dict[str, dict[LabelKey, float]] = defaultdict(dict)
+        self._histograms: dict[str, dict[LabelKey, _Histogram]] = defaultdict(dict)
+
+    def increment(self, name: str, value: float = 1.0, labels: dict[str, str] | None = None) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters[name]
+            series[key] = series.get(key, 0.0) + value
+
+    def set_gauge(self, name: str, value: float, labels: dict[str, str] | None = None) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._gauges[name][key] = value
+
+    def observe(self, name: str, value: float, labels: dict[str, str] | None = None) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms[name]
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(self.buckets)
+            histogram.observe(value)
+
+    def get_counter(self, name: str, labels: dict[str, str] | None = None) -> float:
+        return self._counters.get(name, {}).get(_label_key(labels), 0.0)
+
+    def get_gauge(self, name: str, labels: dict[str, str] | None = None) -> float | None:
+        return self._gauges.get(name, {}).get(_label_key(labels))
+
+    def get_histogram(self, name: str) -> dict[LabelKey, _Histogram]:
+        return dict(self._histograms.get(name, {}))
+
+    def render(self) -> str:
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                lines.append(f"# TYPE {name} counter")
+                lines += [f"{name}{_format_labels(k)} {_format_value(v)}" for k, v in series.items()]
+
+            for name, series in sorted(self._gauges.items()):
+                lines.append(f"# TYPE {name} gauge")
+                lines += [f"{name}{_format_labels(k)} {_format_value(v)}" for k, v in series.items()]
+
+            for name, series in sorted(self._histograms.items()):
+                lines.append(f"# TYPE {name} histogram")
+                for key, histogram in series.items():
+                    cumulative = 0
+                    for bound, count in zip((*histogram.buckets, math.inf), histogram.counts):
+                        cumulative += count
+                        le = (("le", _format_value(bound)),)
+                        lines.append(f"{name}_bucket{_format_labels(key, le)} {cumulative}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {_format_value(histogram.sum)}")
+                    lines.append(f"{name}_count{_format_labels(key)} {histogram.count}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,17 @@
+from typing import Any, Optional
+
+from pydantic import Field
+
+from farmbase.models import FarmbaseBase
+
+
+class QueryInstrumentationUpdate(FarmbaseBase):
+    enabled: Optional[bool] = None
+    slow_query_threshold: Optional[float] = Field(None, gt=0, description="Slow query threshold in seconds")
+
+
+class QueryInstrumentationRead(FarmbaseBase):
+    enabled: bool
+    slow_query_threshold: float
+    queries: list[dict[str, Any]] = []
+    slow_queries: list[dict[str, Any]] = []
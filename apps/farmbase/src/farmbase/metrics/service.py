@@ -0,0 +1,31 @@
+from farmbase.config import settings
+
+from .backend import InMemoryMetricsBackend, MetricsBackend, NullMetricsBackend
+
+_backend: MetricsBackend = InMemoryMetricsBackend() if settings.METRICS_ENABLED else NullMetricsBackend()
+
+
+def get_backend() -> MetricsBackend:
+    """Returns the active metrics backend."""
+    return _backend
+
+
+def set_backend(backend: MetricsBackend) -> None:
+    """Replaces the active metrics backend, e.g. with one that pushes to an external system."""
+    global _backend
+    _backend = backend
+
+
+def increment(name: str, value: float = 1.0, labels: dict[str, str] | None = None) -> None:
+    """Increments a counter."""
+    _backend.increment(name, value, labels)
+
+
+def set_gauge(name: str, value: float, labels: dict[str, str] | None = None) -> None:
+    """Sets a gauge to the given value."""
+    _backend.set_gauge(name, value, labels)
+
+
+def observe(name: str, value: float, labels: dict[str, str] | None = None) -> None:
+    """Records a value in a histogram."""
+    _backend.observe(name, value, labels)
@@ -0,0 +1,47 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from farmbase.database.instrumentation import query_instrumentation
+from farmbase.database.logging import SessionTracker
+
+from .schemas import QueryInstrumentationRead, QueryInstrumentationUpdate
+from .service import get_backend
+
+router = APIRouter()
+
+
+@router.get("", response_class=PlainTextResponse, include_in_schema=False)
+def get_metrics():
+    """Returns the process metrics in the Prometheus text exposition format."""
+    SessionTracker.record_leaked_sessions()
+    return get_backend().render()
+
+
+@router.get("/queries", response_model=QueryInstrumentationRead, include_in_schema=False)
+def get_query_stats():
+    """Returns per-statement query statistics and the most recent slow queries."""
+    return QueryInstrumentationRead(
+        enabled=query_instrumentation.enabled,
+        slow_query_threshold=query_instrumentation.slow_query_threshold,
+        queries=query_instrumentation.get_stats(),
+        slow_queries=query_instrumentation.get_slow_queries(),
+    )
+
+
+@router.put("/queries", response_model=QueryInstrumentationRead, include_in_schema=False)
+def update_query_instrumentation(instrumentation_in: QueryInstrumentationUpdate):
+    """Enables or disables query instrumentation, or changes the slow query threshold, without a restart."""
+    query_instrumentation.configure(
+        enabled=instrumentation_in.enabled,
+        slow_query_threshold=instrumentation_in.slow_query_threshold,
+    )
+    return QueryInstrumentationRead(
+        enabled=query_instrumentation.enabled,
+        slow_query_threshold=query_instrumentation.slow_query_threshold,
+    )
+
+
+@router.delete("/queries", status_code=204, include_in_schema=False)
+def reset_query_stats():
+    """Clears the collected query statistics."""
+    query_instrumentation.reset()
@@ -159,12 +159,21 @@ class PaginationParams(BaseModel):
         return None
 
 
+class CursorPaginationParams(PaginationParams):
+    cursor: Optional[str] = Field(None, description="Opaque cursor from the `next_cursor` of the previous page")
+
+
 class Pagination(FarmbaseBase):
     items_per_page: int
     page: int
     total: int
 
 
+class CursorPagination(Pagination):
+    total_is_estimate: bool = False
+    next_cursor: Optional[str] = None
+
+
 class PrimaryKeyModel(BaseModel):
     id: PrimaryKey
 
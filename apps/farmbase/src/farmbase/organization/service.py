@@ -6,7 +6,8 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.expression import true
 
-from farmbase.database.core import DbSession, engine
+from farmbase.database.core import DbSession, clear_tenant_session_factories, get_engine, get_schema_name
+from farmbase.database.tenant import tenant_registry
 
 from .models import Organization, OrganizationCreate, OrganizationRead, OrganizationUpdate
 
@@ -115,7 +116,8 @@ async def create(*, db_session: AsyncSession, organization_in: OrganizationCreat
     if organization_in.banner_color:
         organization.banner_color = organization_in.banner_color.as_hex()
     # we let the new schema session create the organization
-    organization = init_schema(engine=engine, organization=organization)
+    organization = init_schema(engine=get_engine(), organization=organization)
+    tenant_registry.add(get_schema_name(organization.slug))
     return organization
 
 
@@ -155,3 +157,5 @@ async def delete(*, db_session: AsyncSession, organization_id: int) -> None:
     if organization:
         await db_session.delete(organization)
         await db_session.commit()
+        tenant_registry.invalidate()
+        clear_tenant_session_factories()
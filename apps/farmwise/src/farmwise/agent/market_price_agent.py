@@ -5,7 +5,7 @@ from pywa.types import Section, SectionRow
 from farmwise.agent.prompt_utils import get_profile_and_memories
 from farmwise.context import UserContext
 from farmwise.schema import SectionList, TextResponse
-from farmwise.tools.farmbase import get_market_price_snapshot, get_markets
+from farmwise.tools.farmbase import get_market_price_signals, get_market_price_snapshot, get_markets
 
 
 def market_price_agent_instructions(ctx: RunContextWrapper[UserContext], agent: Agent[UserContext]) -> str:
@@ -35,11 +35,14 @@ Workflow:
 3. Present the list of markets using a SectionList in the response:
    {markets_list}
 4. Wait for the user to select a market by its callback_data.
-5. Upon selection, call the get_market_price_snapshot tool with the selected market ID.
+5. Upon selection, call the get_market_price_signals tool with the selected market ID. It gives, for each product, 
+   the latest price, its 7 and 30 day means, the week-over-week change and the range of prices at nearby markets.
+   Only call get_market_price_snapshot if the user asks for the day by day prices.
 6. If the user has product_interests defined in their profile (ctx.context.contact.product_interests), filter the 
-   snapshot to those products and show each with its current price and a brief trend summary if available 
-   (e.g., “↑5%” for an increase).
+   signals to those products and show each with its current price and its week-over-week change.
    Otherwise, show the current price for all products in the market.
+   If the user asks whether it is a good time to sell, compare the current price with the 30 day mean and with the 
+   prices at nearby markets.
 7. Format the price information clearly in the response content, for example:
    Tomato: 300 KES/kg (↑5% from last week)
    Onion: 50 KES/kg (↔0% change)
@@ -54,7 +57,7 @@ market_price_agent: Agent[UserContext] = Agent(
     name="Market Price Agent",
     handoff_description="Provides current market prices based on farm location and product interests.",
     instructions=market_price_agent_instructions,
-    tools=[get_markets, get_market_price_snapshot],
+    tools=[get_markets, get_market_price_signals, get_market_price_snapshot],
     output_type=TextResponse,
     model="gpt-4.1",
 )
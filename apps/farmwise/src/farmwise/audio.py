@@ -1,51 +1,107 @@
+"""Decoding of the voice notes farmers send, and encoding of the spoken replies."""
+
+import asyncio
+import os
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+import httpx
 import numpy as np
 from agents.voice import (
     AudioInput,
 )
-from loguru import logger
 from pydub import AudioSegment
 
+SAMPLE_RATE = 24000
+
+# Opus streams count granule positions at 48 kHz, whatever the rate they were recorded at
+_OPUS_GRANULE_RATE = 48000
+# buffer for a stream whose length cannot be read from its last page, grown as needed
+_DEFAULT_CAPACITY = SAMPLE_RATE * 60
+_MAX_CAPACITY = SAMPLE_RATE * 60 * 60
+
+# each worker drives one single-threaded ffmpeg process
+_decode_executor = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="audio-decode")
+
+
+def _pcm_capacity(data: bytes) -> int:
+    """Returns the number of 24 kHz samples in an Ogg/Opus stream, from the granule position of its last page."""
+    head = data.find(b"OpusHead")
+    last_page = data.rfind(b"OggS")
+    if head < 0 or last_page < 0 or len(data) < last_page + 14:
+        return _DEFAULT_CAPACITY
+    pre_skip = int.from_bytes(data[head + 10 : head + 12], "little")
+    granule = int.from_bytes(data[last_page + 6 : last_page + 14], "little", signed=True)
+    samples = -(-(granule - pre_skip) * SAMPLE_RATE // _OPUS_GRANULE_RATE)
+    return samples if 0 < samples <= _MAX_CAPACITY else _DEFAULT_CAPACITY
+
+
+def decode_ogg(data: bytes) -> np.ndarray:
+    """Decodes OGG/Opus audio to 24 kHz mono int16 PCM, in memory. Requires ffmpeg."""
+    process = subprocess.Popen(
+        ["ffmpeg", "-nostdin", "-loglevel", "error", "-threads", "1", "-i", "pipe:0"]
+        + ["-f", "s16le", "-acodec", "pcm_s16le", "-ac", "1", "-ar", str(SAMPLE_RATE), "pipe:1"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
 
-def _download_from_gcs_if_needed(path: str) -> str:
-    """Download file from GCS if it's a signed URL, otherwise return the path as-is."""
-    if path.startswith("http"):
-        # It's a signed URL, we need to download it to a temporary file
-        # For now, we'll assume it's already accessible and return the path
-        # In a production system, you might want to download it to a temp file
-        return path
-    else:
-        # It's already a local path
-        return path
-
-
-def load_oga_as_audio_input(input_path: str) -> AudioInput:
-    """Load OGA/Opus file as AudioInput.
+    # fed from another thread so that ffmpeg never blocks on a full stdout pipe while we write
+    def feed():
+        try:
+            process.stdin.write(data)
+        except BrokenPipeError:
+            pass
+        finally:
+            process.stdin.close()
 
-    Args:
-        input_path: Path to the audio file or GCS signed URL
-
-    Returns:
-        AudioInput object with the audio data
-    """
-    # Handle both local paths and GCS URLs
-    processed_path = _download_from_gcs_if_needed(input_path)
+    feeder = threading.Thread(target=feed, daemon=True)
+    feeder.start()
 
+    pcm = np.empty(_pcm_capacity(data) + 1, dtype=np.int16)
+    filled = 0
     try:
-        # Load OGA/Opus file with pydub - requires ffmpeg
-        audio = AudioSegment.from_file(processed_path, format="ogg")
-
-        # Convert to 24000 Hz mono
-        audio = audio.set_frame_rate(24000).set_channels(1).set_sample_width(2)  # int16 = 2 bytes
-
-        # Get raw audio data as numpy array
-        samples = np.frombuffer(audio.raw_data, dtype=np.int16)
-
-        return AudioInput(buffer=samples, frame_rate=24000, sample_width=2, channels=1)
-    except Exception as e:
-        logger.error(f"Error loading audio file {input_path}: {e}")
-        raise
+        while True:
+            if filled == pcm.nbytes:
+                # the stream was longer than its last page said
+                pcm = np.concatenate([pcm, np.empty(len(pcm), dtype=np.int16)])
+            read = process.stdout.readinto(memoryview(pcm).cast("B")[filled:])
+            if not read:
+                break
+            filled += read
+    finally:
+        feeder.join()
+        stderr = process.stderr.read()
+        process.wait()
+
+    if process.returncode != 0:
+        raise ValueError(f"Could not decode audio: {stderr.decode(errors='replace').strip()}")
+    return pcm[: filled // 2]
+
+
+async def fetch_audio(location: str) -> bytes:
+    """Reads audio from a URL, such as a signed URL of the media bucket, or from a local path."""
+    if not location.startswith("http"):
+        return await asyncio.to_thread(_read_file, location)
+    async with httpx.AsyncClient() as client:
+        r = await client.get(location)
+        r.raise_for_status()
+        return r.content
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+async def load_audio_input(location: str) -> AudioInput:
+    """Fetches an OGG/Opus voice note and decodes it on the decode pool into the input of the voice pipeline."""
+    data = await fetch_audio(location)
+    loop = asyncio.get_running_loop()
+    pcm = await loop.run_in_executor(_decode_executor, decode_ogg, data)
+    return AudioInput(buffer=pcm, frame_rate=SAMPLE_RATE, sample_width=2, channels=1)
 
 
 async def write_stream_to_ogg(
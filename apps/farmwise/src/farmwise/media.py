@@ -0,0 +1,21 @@
+"""Media that farmers send over WhatsApp, stored in the media bucket and handed to the model by URL."""
+
+import datetime
+from typing import Optional
+
+from farmwise.settings import settings
+from farmwise.storage import generate_signed_url, upload_bytes_to_gcs
+
+
+def media_bucket() -> str:
+    return settings.GCS_BUCKET.removeprefix("gs://")
+
+
+async def store_media(data: bytes, blob_name: str, content_type: Optional[str] = None) -> Optional[str]:
+    """Uploads media to the media bucket, returning a signed URL to read it or None on failure."""
+    bucket_name = media_bucket()
+    if not await upload_bytes_to_gcs(data, bucket_name, blob_name, content_type):
+        return None
+    return await generate_signed_url(
+        bucket_name, blob_name, expiration=datetime.timedelta(seconds=settings.MEDIA_SIGNED_URL_EXPIRATION_SECS)
+    )
@@ -1,8 +1,6 @@
-import tempfile
 from typing import AsyncIterator
 
 import openai
-import requests
 from agents import (
     Runner,
     RunResultStreaming,
@@ -19,7 +17,7 @@ from openai.types.responses import (
 from zep_cloud import Message
 
 from farmwise.agent import DEFAULT_AGENT, agents
-from farmwise.audio import load_oga_as_audio_input
+from farmwise.audio import load_audio_input
 from farmwise.context import UserContext
 from farmwise.hooks import AgentHooks
 from farmwise.memory.session import SessionState, clear_session_state, get_or_create_session, set_session_state
@@ -116,33 +114,19 @@ class FarmwiseService:
     async def invoke_voice(self, user_input: UserInput) -> str:
         agent = agents[DEFAULT_AGENT]
 
-        with tempfile.NamedTemporaryFile(suffix=".ogg", delete=False) as temp_f:
-            temp_file_path = temp_f.name
-            print(f"Created temporary file: {temp_file_path}")
+        audio_input = await load_audio_input(user_input.voice)
 
-            # Make a request to the URL, streaming the response
-            print(f"Downloading from {user_input.voice}...")
-            with requests.get(user_input.voice, stream=True) as r:
-                # Check if the request was successful
-                r.raise_for_status()
+        pipeline = VoicePipeline(
+            workflow=SingleAgentVoiceWorkflow(agent),
+            config=VoicePipelineConfig(workflow_name="FarmWise", tts_settings=TTSModelSettings(voice="onyx")),
+        )
 
-                # Write the content to the temporary file in chunks
-                for chunk in r.iter_content(chunk_size=8192):
-                    temp_f.write(chunk)
+        result = await pipeline.run(audio_input)
 
-            audio_input = load_oga_as_audio_input(temp_file_path)
-
-            pipeline = VoicePipeline(
-                workflow=SingleAgentVoiceWorkflow(agent),
-                config=VoicePipelineConfig(workflow_name="FarmWise", tts_settings=TTSModelSettings(voice="onyx")),
-            )
-
-            result = await pipeline.run(audio_input)
-
-            # output_path = user_input.voice.replace(".oga", "_response.oga")
-            # await write_stream_to_ogg(result.stream(), output_path)
-            #
-            # return output_path
+        # output_path = user_input.voice.replace(".oga", "_response.oga")
+        # await write_stream_to_ogg(result.stream(), output_path)
+        #
+        # return output_path
 
 
 farmwise = FarmwiseService()
@@ -50,6 +50,13 @@ class Settings(BaseSettings):
     WHATSAPP_BUSINESS_PRIVATE_KEY_PASSWORD: str | None = None
 
     GCS_BUCKET: str = "gs://farmwise_media"
+    MEDIA_SIGNED_URL_EXPIRATION_SECS: int = 60 * 60 * 6  # as long as a session, so the model can revisit media
+    STORAGE_MAX_CONCURRENCY: int = 8  # storage requests in flight at once
+    STORAGE_RESUMABLE_THRESHOLD: int = 8 * 1024 * 1024  # objects at least this large are uploaded in chunks
+    STORAGE_UPLOAD_CHUNK_SIZE: int = 8 * 1024 * 1024  # a multiple of 256 KiB
+    STORAGE_RETRY_INITIAL_SECS: float = 1.0
+    STORAGE_RETRY_MAX_SECS: float = 30.0
+    STORAGE_RETRY_DEADLINE_SECS: float = 120.0
 
     UPSTASH_REDIS_REST_URL: str
     UPSTASH_REDIS_REST_TOKEN: str
@@ -1,13 +1,45 @@
+"""Asyncio interface to Google Cloud Storage."""
+
+import asyncio
 import datetime
+import functools
 import os
-from typing import Optional
-
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Optional, TypeVar
+
+from google.api_core.retry import Retry
+from google.auth.credentials import Signing
+from google.auth.transport.requests import Request
 from google.cloud import storage
+from google.cloud.storage.retry import DEFAULT_RETRY
 from loguru import logger
 
+from farmwise.settings import settings
+
+T = TypeVar("T")
+
+_executor = ThreadPoolExecutor(max_workers=settings.STORAGE_MAX_CONCURRENCY, thread_name_prefix="storage")
+
+# also applied to uploads, which the library only retries when a generation precondition is set: media
+# objects are written once under a fresh name, so resending an upload cannot overwrite anything else
+_retry: Retry = DEFAULT_RETRY.with_delay(
+    initial=settings.STORAGE_RETRY_INITIAL_SECS, maximum=settings.STORAGE_RETRY_MAX_SECS, multiplier=2.0
+).with_timeout(settings.STORAGE_RETRY_DEADLINE_SECS)
+
+_refresh_lock = threading.Lock()
+
+
+async def _run(fn: Callable[..., T], *args, **kwargs) -> T:
+    """Runs a blocking storage call on the storage thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(fn, *args, **kwargs))
+
 
+@lru_cache(maxsize=None)
 def get_storage_client(service_account_file: Optional[str] = None) -> storage.Client:
-    """Get a Google Cloud Storage client, using service account file if provided."""
+    """Get a shared Google Cloud Storage client, using service account file if provided."""
     if service_account_file and os.path.exists(service_account_file):
         return storage.Client.from_service_account_json(service_account_file)
     else:
@@ -15,30 +47,59 @@ def get_storage_client(service_account_file: Optional[str] = None) -> storage.Cl
         return storage.Client()
 
 
-def make_blob_public(bucket_name, blob_name):
+def _blob(bucket_name: str, blob_name: str, size: int = 0, service_account_file: Optional[str] = None) -> storage.Blob:
+    """Returns a blob handle, uploaded in resumable chunks if size reaches STORAGE_RESUMABLE_THRESHOLD."""
+    bucket = get_storage_client(service_account_file).bucket(bucket_name)
+    chunk_size = settings.STORAGE_UPLOAD_CHUNK_SIZE if size >= settings.STORAGE_RESUMABLE_THRESHOLD else None
+    return bucket.blob(blob_name, chunk_size=chunk_size)
+
+
+async def make_blob_public(bucket_name, blob_name) -> Optional[str]:
     """
     Makes a specific object in a Google Cloud Storage bucket public.
 
     Args:
         bucket_name (str): Your bucket name (e.g. 'my-bucket').
         blob_name (str): Your object name (e.g. 'my-file.txt').
+
+    Returns:
+        str: The public URL, or None if there was an error.
     """
-    storage_client = storage.Client()
-    bucket = storage_client.bucket(bucket_name)
-    blob = bucket.blob(blob_name)
+    blob = _blob(bucket_name, blob_name)
 
     # Note: This requires the "Storage Object Admin" role on your user account.
     # It internally grants the "Storage Object Viewer" role to "allUsers".
     try:
-        blob.make_public()
+        await _run(blob.make_public, retry=_retry)
         return blob.public_url
 
     except Exception as e:
         logger.error(f"An error occurred: {e}")
 
 
-def generate_signed_url(
-    bucket_name: str, blob_name: str, service_account_file: Optional[str] = None, expiration_hours: int = 1
+def _sign(blob: storage.Blob, credentials, expiration: datetime.timedelta) -> str:
+    # credentials holding a private key sign locally, others, such as those of the Cloud Run service
+    # account, sign through the IAM API with their access token, refreshed only once it has expired
+    if isinstance(credentials, Signing):
+        return blob.generate_signed_url(version="v4", expiration=expiration, method="GET", credentials=credentials)
+
+    with _refresh_lock:
+        if not credentials.valid:
+            credentials.refresh(Request())
+    return blob.generate_signed_url(
+        version="v4",
+        expiration=expiration,
+        method="GET",
+        service_account_email=credentials.service_account_email,
+        access_token=credentials.token,
+    )
+
+
+async def generate_signed_url(
+    bucket_name: str,
+    blob_name: str,
+    service_account_file: Optional[str] = None,
+    expiration: datetime.timedelta = datetime.timedelta(hours=1),
 ) -> Optional[str]:
     """Generates a v4 signed URL for downloading a blob.
 
@@ -46,25 +107,15 @@ def generate_signed_url(
         bucket_name (str): Your bucket name (e.g. 'farmwise_media')
         blob_name (str): Your object name (e.g. 'images/photo.jpg')
         service_account_file (str, optional): The path to your service account key file.
-        expiration_hours (int): Number of hours the URL should be valid for (default: 1)
+        expiration (timedelta): How long the URL should be valid for (default: 1 hour)
 
     Returns:
         str: The signed URL, or None if there was an error.
     """
     try:
         storage_client = get_storage_client(service_account_file)
-        bucket = storage_client.bucket(bucket_name)
-        blob = bucket.blob(blob_name)
-
-        # Set the expiration time for the URL
-        expiration_time = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(hours=expiration_hours)
-
-        # Generate the signed URL (for a GET request)
-        signed_url = blob.generate_signed_url(
-            version="v4",
-            expiration=expiration_time,
-            method="GET",
-        )
+        blob = _blob(bucket_name, blob_name, service_account_file=service_account_file)
+        signed_url = await _run(_sign, blob, storage_client._credentials, expiration)
         logger.info(f"Successfully generated signed URL for {blob_name}")
         return signed_url
 
@@ -73,7 +124,7 @@ def generate_signed_url(
         return None
 
 
-def upload_file_to_gcs(
+async def upload_file_to_gcs(
     file_path: str, bucket_name: str, blob_name: str, service_account_file: Optional[str] = None
 ) -> bool:
     """Upload a file to Google Cloud Storage.
@@ -88,11 +139,8 @@ def upload_file_to_gcs(
         bool: True if upload was successful, False otherwise.
     """
     try:
-        storage_client = get_storage_client(service_account_file)
-        bucket = storage_client.bucket(bucket_name)
-        blob = bucket.blob(blob_name)
-
-        blob.upload_from_filename(file_path)
+        blob = _blob(bucket_name, blob_name, os.path.getsize(file_path), service_account_file)
+        await _run(blob.upload_from_filename, file_path, retry=_retry)
         logger.info(f"Successfully uploaded {file_path} to gs://{bucket_name}/{blob_name}")
         return True
 
@@ -101,7 +149,7 @@ def upload_file_to_gcs(
         return False
 
 
-def upload_bytes_to_gcs(
+async def upload_bytes_to_gcs(
     data: bytes, bucket_name: str, blob_name: str, content_type: str = None, service_account_file: Optional[str] = None
 ) -> bool:
     """Upload bytes data to Google Cloud Storage.
@@ -117,14 +165,8 @@ def upload_bytes_to_gcs(
         bool: True if upload was successful, False otherwise.
     """
     try:
-        storage_client = get_storage_client(service_account_file)
-        bucket = storage_client.bucket(bucket_name)
-        blob = bucket.blob(blob_name)
-
-        if content_type:
-            blob.content_type = content_type
-
-        blob.upload_from_string(data)
+        blob = _blob(bucket_name, blob_name, len(data), service_account_file)
+        await _run(blob.upload_from_string, data, content_type=content_type or "application/octet-stream", retry=_retry)
         logger.info(f"Successfully uploaded data to gs://{bucket_name}/{blob_name}")
         return True
 
@@ -5,7 +5,11 @@ from agents import RunContextWrapper, function_tool
 
 from farmbase_client.api.contacts import contacts_patch_contact, contacts_create_contact_consent
 from farmbase_client.api.farms import farms_create_farm
-from farmbase_client.api.markets import markets_get_market_snapshot_endpoint, markets_get_markets
+from farmbase_client.api.markets import (
+    markets_get_market_signals_endpoint,
+    markets_get_market_snapshot_endpoint,
+    markets_get_markets,
+)
 from farmbase_client.api.notes import notes_create_note
 from farmbase_client.models import (
     ContactPatch,
@@ -146,3 +150,44 @@ async def get_market_price_snapshot(_: RunContextWrapper[UserContext], market_id
     snapshot_csv = format_market_snapshot_csv(snapshot=result)
 
     return snapshot_csv
+
+
+@function_tool(
+    description_override="""
+Get precomputed price signals for each commodity in a given market: the latest price, its 7 and 30 day means, 
+the week-over-week change, and the range of prices at nearby markets. Use it to judge whether now is a good time 
+to sell.
+"""
+)
+async def get_market_price_signals(_: RunContextWrapper[UserContext], market_id: int) -> str:
+
+    def number(value) -> str | None:
+        return f"{value:.0f}" if isinstance(value, (int, float)) else None
+
+    def format_signals(signals) -> str:
+        price = number(signals.retail_price)
+        unit = "/".join(part for part in [signals.retail_ccy, signals.retail_unit] if part)
+        if unit:
+            price = f"{price} {unit}"
+        parts = [f"{signals.commodity.name}: {price} on {signals.price_date.isoformat()}"]
+        means = [
+            f"{label} {number(value)}"
+            for label, value in [("7d mean", signals.mean_7d), ("30d mean", signals.mean_30d)]
+            if number(value) is not None
+        ]
+        if isinstance(signals.week_over_week, float):
+            means.append(f"week-over-week {signals.week_over_week:+.1%}")
+        if means:
+            parts.append(", ".join(means))
+        if isinstance(signals.nearby_markets, int) and signals.nearby_markets > 1:
+            parts.append(
+                f"{signals.nearby_markets} nearby markets {number(signals.nearby_min_price)}"
+                f"-{number(signals.nearby_max_price)}, median {number(signals.nearby_median_price)}"
+            )
+        return "; ".join(parts)
+
+    result = await markets_get_market_signals_endpoint.asyncio(client=farmbase_api_client, market_id=market_id)
+
+    lines = [f"Market: {result.market.name} (as of {result.as_of}, nearby = within {result.distance_km} km)"]
+    lines += [format_signals(signals) for signals in result.signals or []]
+    return "\n".join(lines)
@@ -4,10 +4,9 @@ from loguru import logger
 from pywa_async import WhatsApp, filters, types
 
 from farmwise.context import get_or_create_user
+from farmwise.media import store_media
 from farmwise.schema import ActivityData, AudioResponse, TextResponse, UserInput
 from farmwise.service import farmwise
-from farmwise.settings import settings
-from farmwise.storage import make_blob_public, upload_bytes_to_gcs
 from farmwise.whatsapp import commands
 from farmwise.whatsapp.activities import activities
 from farmwise.whatsapp.responses import send_audio_reply, send_responses, send_text_reply
@@ -161,24 +160,10 @@ async def image_handler(_: WhatsApp, msg: types.Message):
     image_bytes = await msg.image.download(in_memory=True)
     await msg.indicate_typing()
 
-    # Generate a unique blob name for GCS
     blob_name = f"images/{uuid.uuid4()}.jpg"
-    bucket_name = settings.GCS_BUCKET.replace("gs://", "")
-
-    # Upload to GCS
-    upload_success = upload_bytes_to_gcs(
-        data=image_bytes,
-        bucket_name=bucket_name,
-        blob_name=blob_name,
-    )
-
-    if upload_success:
-        # TODO: Generate signed URL for the uploaded image
-        # signed_url = generate_signed_url( bucket_name=bucket_name, blob_name=blob_name, )
-        url = make_blob_public(bucket_name, blob_name)
-
-    else:
-        logger.error("Failed to upload image to GCS")
+    url = await store_media(image_bytes, blob_name, content_type=msg.image.mime_type)
+    if url is None:
+        logger.error("Failed to store image")
         await msg.reply_text("Sorry, there was an error processing your image.")
         return
 
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark for decoding WhatsApp voice notes.
+
+Compares the pydub path, which writes every note to a temporary file for ffmpeg and converts the result
+in Python, against farmwise.audio.decode_ogg, which pipes the note through ffmpeg into a preallocated
+buffer. Throughput is reported in seconds of audio decoded per second, on one core and across the decode
+pool. The voice notes are synthesized by ffmpeg as mono Opus at the bitrate WhatsApp uses, so ffmpeg
+with libopus is required.
+
+Usage:
+    uv run --package farmwise python dev/benchmarks/audio_decode.py [--seconds 30] [--notes 64]
+"""
+
+import argparse
+import io
+import os
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from pydub import AudioSegment
+
+from farmwise import audio
+
+
+def synthesize_note(seconds: float) -> bytes:
+    """Encodes pink noise as a mono 16 kbit/s Ogg/Opus voice note."""
+    return subprocess.run(
+        ["ffmpeg", "-nostdin", "-loglevel", "error", "-f", "lavfi", "-i", f"anoisesrc=c=pink:d={seconds}"]
+        + ["-ac", "1", "-c:a", "libopus", "-b:a", "16k", "-f", "ogg", "pipe:1"],
+        check=True,
+        capture_output=True,
+    ).stdout
+
+
+def decode_pydub(data: bytes) -> np.ndarray:
+    segment = AudioSegment.from_file(io.BytesIO(data), format="ogg")
+    segment = segment.set_frame_rate(audio.SAMPLE_RATE).set_channels(1).set_sample_width(2)
+    return np.frombuffer(segment.raw_data, dtype=np.int16)
+
+
+def throughput(decode, notes: list[bytes], workers: int) -> float:
+    """Returns the seconds of audio decoded per second."""
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        decoded = list(executor.map(decode, notes))
+    elapsed = time.perf_counter() - started
+    return sum(len(pcm) for pcm in decoded) / audio.SAMPLE_RATE / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=30, help="Length of each voice note")
+    parser.add_argument("--notes", type=int, default=64, help="Voice notes decoded per run")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Size of the decode pool")
+    args = parser.parse_args()
+
+    note = synthesize_note(args.seconds)
+    notes = [note] * args.notes
+    # the buffer is sized from the stream, and both decoders resample to the same length, within a frame
+    expected = args.seconds * audio.SAMPLE_RATE
+    assert abs(audio._pcm_capacity(note) - expected) <= audio.SAMPLE_RATE // 50
+    assert abs(len(decode_pydub(note)) - len(audio.decode_ogg(note))) <= audio.SAMPLE_RATE // 50
+
+    print(f"{args.notes} notes of {args.seconds:.0f}s, {len(note) / 1024:.0f} KiB each, {args.workers} workers")
+    print(f"{'decoder':>12} {'1 core s/s':>12} {'pool s/s':>10} {'per core':>10}")
+    for label, decode in [("pydub", decode_pydub), ("decode_ogg", audio.decode_ogg)]:
+        single = throughput(decode, notes, 1)
+        pooled = throughput(decode, notes, args.workers)
+        print(f"{label:>12} {single:>12.0f} {pooled:>10.0f} {pooled / args.workers:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark for downloading multi-file datasets from object storage.
+
+Compares copying a set of layers one after another, the way the suitability rasters used to be
+fetched, against farmbase.data.storage.download_many, which reads byte ranges of every layer
+concurrently. Object storage is simulated offline by an in-memory filesystem that adds a fixed
+latency and a bandwidth cap to every request, roughly like a single GCS stream.
+
+Usage:
+    uv run python dev/benchmarks/dataset_download.py [--layers 31] [--size-mb 16] [--latency-ms 40]
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import fsspec
+from farmbase.data import storage
+from fsspec.implementations.memory import MemoryFileSystem
+
+
+class SlowMemoryFileSystem(MemoryFileSystem):
+    """Memory filesystem where every read pays a round trip and streams at a capped rate."""
+
+    protocol = "slowmemory"
+    latency = 0.04
+    bandwidth = 50 * 1024 * 1024
+
+    @classmethod
+    def _strip_protocol(cls, path):
+        return super()._strip_protocol(path.removeprefix(f"{cls.protocol}://"))
+
+    def cat_file(self, path, start=None, end=None, **kwargs):
+        data = super().cat_file(path, start=start, end=end, **kwargs)
+        time.sleep(self.latency + len(data) / self.bandwidth)
+        return data
+
+    def _open(self, path, mode="rb", **kwargs):
+        f = super()._open(path, mode, **kwargs)
+        read = f.read
+
+        def slow_read(size=-1):
+            data = read(size)
+            time.sleep(self.latency + len(data) / self.bandwidth)
+            return data
+
+        f.read = slow_read
+        return f
+
+
+def sequential(downloads: list[tuple[str, str]]) -> None:
+    for url, local_path in downloads:
+        with storage.open_object(url) as src, open(local_path, "wb") as dst:
+            shutil.copyfileobj(src, dst, 16 * 1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--layers", type=int, default=31, help="Objects in the dataset")
+    parser.add_argument("--size-mb", type=int, default=16, help="Size of each object")
+    parser.add_argument("--latency-ms", type=float, default=40, help="Latency of each request")
+    parser.add_argument("--concurrency", type=int, default=16, help="Ranges read at a time")
+    args = parser.parse_args()
+
+    fsspec.register_implementation(SlowMemoryFileSystem.protocol, SlowMemoryFileSystem, clobber=True)
+    SlowMemoryFileSystem.latency = args.latency_ms / 1000
+
+    memory = fsspec.filesystem("memory")
+    for i in range(args.layers):
+        memory.pipe(f"/bench/layer_{i:02d}.tif", os.urandom(args.size_mb * 1024 * 1024))
+    urls = storage.glob_objects("slowmemory://bench/layer_*.tif")
+    assert len(urls) == args.layers, urls
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = {}
+        for label, fn in [("sequential", sequential), ("download_many", storage.download_many)]:
+            os.makedirs(os.path.join(directory, label))
+            downloads = [(url, os.path.join(directory, label, os.path.basename(url))) for url in urls]
+            started = time.perf_counter()
+            if fn is sequential:
+                fn(downloads)
+            else:
+                fn(downloads, concurrency=args.concurrency)
+            results[label] = time.perf_counter() - started
+
+            for url, local_path in downloads:
+                with open(local_path, "rb") as f:
+                    assert f.read() == memory.cat_file(storage.resolve(url)[1]), url
+
+    total_mb = args.layers * args.size_mb
+    print(f"{args.layers} objects, {total_mb} MB, {args.latency_ms:.0f} ms latency")
+    for label, seconds in results.items():
+        print(f"{label:>14} {seconds:>7.2f}s {total_mb / seconds:>8.1f} MB/s")
+    print(f"{'speedup':>14} {results['sequential'] / results['download_many']:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
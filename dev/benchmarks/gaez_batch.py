@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the GAEZ point-query endpoints.
+
+Compares resolving N coordinates with N single GET requests against one POST to the batch
+endpoint, for the AEZ classification, growing period and suitability index. The rasters are
+synthetic memory-mapped layers shaped like the GAEZ grids, so no GCS access is needed.
+
+Usage:
+    uv run python dev/benchmarks/gaez_batch.py [--crops 31] [--sizes 1 100 10000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+from farmbase.data.gaez import views
+from farmbase.data.gaez.store import RasterLayer, RasterStore
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# 5 arc-minute global grid, as the suitability and AEZ rasters
+ROWS, COLS = 2160, 4320
+TRANSFORM = (1 / 12, 0.0, -180.0, 0.0, -1 / 12, 90.0)
+
+
+def make_layer(directory: str, name: str, high: int, rng: np.random.Generator) -> RasterLayer:
+    path = os.path.join(directory, f"{name}.npy")
+    np.save(path, rng.integers(0, high, size=(ROWS, COLS), dtype=np.int16))
+    return RasterLayer(name=name, array=np.load(path, mmap_mode="r"), transform=TRANSFORM)
+
+
+def install_layers(directory: str, crops: int) -> None:
+    """Points the view getters at synthetic layers."""
+    rng = np.random.default_rng(42)
+    aez = make_layer(directory, "aez", 34, rng)
+    growing_period = make_layer(directory, "growing_period", 366, rng)
+    suitability = RasterStore(directory).interleave(
+        [make_layer(directory, code, 10_000, rng) for code in list(views.crop_codes)[:crops]], name="suitability"
+    )
+    class_map = {value: f"AEZ class {value}" for value in range(33)}
+
+    views.get_aez_raster = lambda: aez
+    views.get_growing_period_raster = lambda: growing_period
+    views.get_suitability_raster = lambda: suitability
+    views.get_class_map = lambda: class_map
+
+
+def single(client: TestClient, endpoint: str, latitudes: list[float], longitudes: list[float]) -> list:
+    results = []
+    for latitude, longitude in zip(latitudes, longitudes):
+        response = client.get(endpoint, params={"latitude": latitude, "longitude": longitude})
+        response.raise_for_status()
+        results.append(response.json())
+    return results
+
+
+def batch(client: TestClient, endpoint: str, latitudes: list[float], longitudes: list[float]) -> dict:
+    response = client.post(f"{endpoint}/batch", json={"latitude": latitudes, "longitude": longitudes})
+    response.raise_for_status()
+    return response.json()
+
+
+def as_rows(endpoint: str, columns: dict) -> list:
+    """Converts a columnar batch response into the responses of the single endpoint."""
+    if endpoint == "/suitability_index":
+        crops = columns["suitability_index"]
+        return [{"suitability_index": dict(zip(crops, values))} for values in zip(*crops.values())]
+    return next(iter(columns.values()))
+
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--crops", type=int, default=len(views.crop_codes), help="Suitability layers")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 10_000], help="Coordinates per run")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        install_layers(directory, args.crops)
+        app = FastAPI()
+        app.include_router(views.router)
+        client = TestClient(app)
+
+        rng = np.random.default_rng(7)
+        print(f"{'endpoint':>20} {'N':>7} {'single ms':>11} {'batch ms':>10} {'speedup':>8}")
+        for endpoint in ["/aez_classification", "/growing_period", "/suitability_index"]:
+            for n in args.sizes:
+                latitudes = rng.uniform(-60, 80, n).tolist()
+                longitudes = rng.uniform(-180, 180, n).tolist()
+
+                expected, single_seconds = timed(single, client, endpoint, latitudes, longitudes)
+                columns, batch_seconds = timed(batch, client, endpoint, latitudes, longitudes)
+                assert as_rows(endpoint, columns) == expected, endpoint
+
+                print(
+                    f"{endpoint:>20} {n:>7} {single_seconds * 1e3:>11.1f} {batch_seconds * 1e3:>10.1f} "
+                    f"{single_seconds / batch_seconds:>7.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Import-time budget check for farmbase.
+
+Cold-imports a module in fresh interpreters with `python -X importtime` and fails (exit
+code 1) when the best cumulative import time exceeds the budget, printing the slowest
+imports so the regression can be tracked down. Run by the farmbase-import-time pre-commit hook
+on every commit that touches apps/farmbase/src/farmbase.
+
+Usage:
+    uv run python dev/benchmarks/import_time.py [--module farmbase.database.core] [--budget-ms 1000]
+"""
+
+import argparse
+import subprocess
+import sys
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Returns the cumulative import time in microseconds of every module imported by a cold import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, _, cumulative, name = (part.strip() for part in line.replace("import time:", "|").split("|"))
+        times[name] = int(cumulative)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="farmbase.database.core", help="Module to cold-import")
+    parser.add_argument("--budget-ms", type=float, default=1000, help="Maximum cumulative import time")
+    parser.add_argument("--runs", type=int, default=5, help="Cold imports to run; the fastest one counts")
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports to show")
+    args = parser.parse_args()
+
+    runs = [import_times(args.module) for _ in range(args.runs)]
+    best = min(runs, key=lambda times: times[args.module])
+    total_ms = best[args.module] / 1000
+
+    print(f"{args.module}: {total_ms:.0f} ms (budget {args.budget_ms:.0f} ms, best of {args.runs})")
+    for name, cumulative in sorted(best.items(), key=lambda item: item[1], reverse=True)[1 : args.top + 1]:
+        print(f"  {cumulative / 1000:>8.1f} ms  {name}")
+
+    if total_ms > args.budget_ms:
+        print(f"FAIL: import of {args.module} exceeds its budget by {total_ms - args.budget_ms:.0f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
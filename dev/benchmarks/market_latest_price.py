@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the market proximity search with a price recency filter.
+
+Compares the previous recency filter, which grouped the whole market_price table by market for max(date)
+on every call, against the lookup in the market_latest_price table, for a synthetic KAMIS-sized history: every
+market reporting a share of the commodities every day. Also times the incremental refresh for one day of
+ingest against a full rebuild of the latest prices.
+
+The tables are created in a scratch schema of the configured database, which is dropped afterwards, so
+PostgreSQL with PostGIS is required.
+
+Usage:
+    uv run python dev/benchmarks/market_latest_price.py [--markets 200] [--commodities 150] [--days 730]
+"""
+
+import argparse
+import statistics
+import time
+
+from farmbase.commodity.models import Commodity
+from farmbase.database.core import Base, create_db_engine
+from farmbase.geospatial.proximity import nearest, within_distance
+from farmbase.market.latest import refresh_latest_prices
+from farmbase.market.models import Market, MarketLatestPrice, MarketPrice
+from farmbase.market.service import markets_near_location_query
+from sqlalchemy import func, select, text
+from sqlalchemy.schema import CreateSchema, DropSchema
+
+SCHEMA = "bench_market_latest_price"
+
+# a spread of points around Kenya, where the KAMIS markets are
+LOCATIONS = [(-1.29, 36.82), (-0.09, 34.77), (-4.04, 39.67), (0.52, 35.27), (-0.42, 36.95), (0.05, 37.65)]
+
+
+def previous_query(latitude: float, longitude: float, price_within_days: int, limit: int = 100):
+    """The query with the recency filter as it was before the latest price table."""
+    latest_date_sq = (
+        select(MarketPrice.market_id.label("mkt_id"), func.max(MarketPrice.date).label("max_date"))
+        .group_by(MarketPrice.market_id)
+        .subquery()
+    )
+    return (
+        select(Market)
+        .join(latest_date_sq, Market.id == latest_date_sq.c.mkt_id)
+        .where(Market.location.isnot(None))
+        .where(within_distance(Market.location, latitude, longitude, 50_000))
+        .where(latest_date_sq.c.max_date >= func.current_date() - text(f"INTERVAL '{price_within_days} days'"))
+        .order_by(nearest(Market.location, latitude, longitude))
+        .limit(limit)
+    )
+
+
+def populate(conn, markets: int, commodities: int, days: int, density: float) -> int:
+    conn.execute(
+        text(f"""
+        INSERT INTO {SCHEMA}.market (name, location)
+        SELECT 'Market ' || i, ST_SetSRID(ST_MakePoint(34 + random() * 7.5, -4.5 + random() * 9), 4326)
+        FROM generate_series(1, :markets) AS i
+        """),
+        {"markets": markets},
+    )
+    conn.execute(
+        text(f"INSERT INTO {SCHEMA}.commodity (name) SELECT 'Commodity ' || i FROM generate_series(1, :n) AS i"),
+        {"n": commodities},
+    )
+    # markets stop reporting at different times, so that the recency filter has something to filter
+    conn.execute(
+        text(f"""
+        INSERT INTO {SCHEMA}.market_price (market_id, commodity_id, date, supply_volume, retail_price, retail_unit)
+        SELECT m.id, c.id, current_date - d, random() * 1000, 10 + random() * 200, 'Kg'
+        FROM {SCHEMA}.market m
+        CROSS JOIN {SCHEMA}.commodity c
+        CROSS JOIN generate_series(0, :days - 1) AS d
+        WHERE d >= m.id % 60 AND random() < :density
+        """),
+        {"days": days, "density": density},
+    )
+    return conn.execute(select(func.count()).select_from(MarketPrice)).scalar_one()
+
+
+def timed(conn, stmt, repeat: int) -> tuple[float, list]:
+    """Returns the median milliseconds of a query, and the first column of its rows."""
+    seconds = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = conn.execute(stmt).scalars().all()
+        seconds.append(time.perf_counter() - started)
+    return statistics.median(seconds) * 1e3, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--markets", type=int, default=200, help="Markets in the history")
+    parser.add_argument("--commodities", type=int, default=150, help="Commodities in the history")
+    parser.add_argument("--days", type=int, default=730, help="Days of history")
+    parser.add_argument("--density", type=float, default=0.1, help="Share of commodities a market reports a day")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs of each query")
+    args = parser.parse_args()
+
+    engine = create_db_engine(async_=False).execution_options(schema_translate_map={"farmbase_core": SCHEMA})
+    tables = [Market.__table__, Commodity.__table__, MarketPrice.__table__, MarketLatestPrice.__table__]
+    with engine.begin() as conn:
+        conn.execute(CreateSchema(SCHEMA, if_not_exists=True))
+        Base.metadata.create_all(conn, tables=tables)
+
+    try:
+        with engine.begin() as conn:
+            started = time.perf_counter()
+            rows = populate(conn, args.markets, args.commodities, args.days, args.density)
+            print(f"Loaded {rows:,} prices in {time.perf_counter() - started:.0f}s")
+            started = time.perf_counter()
+            refresh_latest_prices(conn)
+            print(f"Built the latest prices in {(time.perf_counter() - started) * 1e3:.0f} ms")
+            conn.execute(text(f"ANALYZE {SCHEMA}.market_price"))
+            conn.execute(text(f"ANALYZE {SCHEMA}.market_latest_price"))
+
+        with engine.connect() as conn:
+            print(f"{'location':>16} {'days':>5} {'previous ms':>12} {'latest ms':>10} {'speedup':>8}")
+            for latitude, longitude in LOCATIONS:
+                for days in (7, 30):
+                    previous_ms, previous = timed(conn, previous_query(latitude, longitude, days), args.repeat)
+                    latest_ms, latest = timed(
+                        conn,
+                        markets_near_location_query(latitude=latitude, longitude=longitude, price_within_days=days),
+                        args.repeat,
+                    )
+                    assert latest == previous, (latitude, longitude, days)
+                    print(
+                        f"{latitude:>7.2f},{longitude:>7.2f} {days:>5} {previous_ms:>12.2f} {latest_ms:>10.2f} "
+                        f"{previous_ms / latest_ms:>7.1f}x"
+                    )
+
+        # one day of ingest touches every pair reported that day
+        with engine.begin() as conn:
+            keys = conn.execute(
+                select(MarketPrice.market_id, MarketPrice.commodity_id).where(MarketPrice.date == func.current_date())
+            ).all()
+            started = time.perf_counter()
+            refresh_latest_prices(conn, keys)
+            incremental = time.perf_counter() - started
+            started = time.perf_counter()
+            refresh_latest_prices(conn)
+            full = time.perf_counter() - started
+            print(f"Refresh after a day of {len(keys)} prices: {incremental * 1e3:.0f} ms")
+            print(f"Full rebuild: {full * 1e3:.0f} ms")
+    finally:
+        with engine.begin() as conn:
+            conn.execute(DropSchema(SCHEMA, cascade=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Check that the market proximity and recency queries compile to the same SQL whatever their arguments.
+
+asyncpg prepares each distinct SQL text once per connection and keeps it in its statement cache, so a
+query that interpolates its arguments into the SQL is prepared again on every call and never hits the
+cache. This check compiles the market service queries with the asyncpg dialect for many random
+arguments, and fails if any of them produces more than one SQL text. With --database, it also runs them
+on one connection to the configured database, and fails if pg_prepared_statements grows after the first
+round.
+
+Usage:
+    uv run python dev/benchmarks/market_statements.py [--calls 500] [--database]
+"""
+
+import argparse
+import asyncio
+import random
+from collections import defaultdict
+from datetime import date, timedelta
+
+from farmbase.database.core import create_db_engine
+from farmbase.market import analytics, service
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class _EmptyResult:
+    def scalars(self):
+        return self
+
+    def all(self):
+        return []
+
+    def scalar_one(self):
+        return 0
+
+    def __iter__(self):
+        return iter([])
+
+
+class RecordingSession:
+    """Stands in for an AsyncSession, collecting the SQL each query compiles to under asyncpg."""
+
+    dialect = asyncpg.dialect()
+
+    def __init__(self):
+        self.statements: dict[str, set[str]] = defaultdict(set)
+        self.query = None
+
+    async def execute(self, stmt):
+        self.statements[self.query].add(str(stmt.compile(dialect=self.dialect)))
+        return _EmptyResult()
+
+
+def random_calls(n: int, rng: random.Random):
+    """Yields (query name, coroutine function, arguments), with coordinates as ints or floats."""
+    for _ in range(n):
+        latitude = rng.choice([rng.uniform(-5, 5), rng.randint(-5, 5)])
+        longitude = rng.choice([rng.uniform(33, 42), rng.randint(33, 42)])
+        days = rng.randint(1, 365)
+        yield (
+            "count_markets_near_location",
+            service.count_markets_near_location,
+            dict(latitude=latitude, longitude=longitude),
+        )
+        yield (
+            "get_markets_near_location",
+            service.get_markets_near_location,
+            dict(latitude=latitude, longitude=longitude, limit=rng.randint(1, 100), offset=rng.randint(0, 50)),
+        )
+        yield (
+            "get_markets_near_location(price_within_days)",
+            service.get_markets_near_location,
+            dict(latitude=latitude, longitude=longitude, distance_km=rng.randint(1, 200), price_within_days=days),
+        )
+        yield "get_market_snapshot", service.get_market_snapshot, dict(market_id=rng.randint(1, 1000))
+        yield (
+            "get_price_signals",
+            analytics.get_price_signals,
+            dict(market_id=rng.randint(1, 1000), on=date.today() - timedelta(days=rng.randint(0, 365))),
+        )
+
+
+async def check_compiled(calls: int) -> bool:
+    session = RecordingSession()
+    for query, fn, kwargs in random_calls(calls, random.Random(42)):
+        session.query = query
+        await fn(db_session=session, **kwargs)
+
+    ok = True
+    for query, statements in session.statements.items():
+        print(f"{query:>46} {len(statements):>3} SQL text(s) over {calls} calls")
+        ok &= len(statements) == 1
+    return ok
+
+
+async def check_prepared(calls: int) -> bool:
+    engine = create_db_engine(async_=True)
+    try:
+        async with engine.connect() as conn:
+            session = AsyncSession(bind=conn)
+            counts = []
+            for seed in (1, 2):
+                for _, fn, kwargs in random_calls(calls, random.Random(seed)):
+                    await fn(db_session=session, **kwargs)
+                counts.append((await conn.execute(text("SELECT count(*) FROM pg_prepared_statements"))).scalar_one())
+            await conn.rollback()
+    finally:
+        await engine.dispose()
+
+    print(f"prepared statements after round 1: {counts[0]}, after round 2: {counts[1]}")
+    return counts[0] == counts[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=500, help="Calls of each query")
+    parser.add_argument("--database", action="store_true", help="Also count prepared statements in PostgreSQL")
+    args = parser.parse_args()
+
+    ok = asyncio.run(check_compiled(args.calls))
+    if args.database:
+        ok &= asyncio.run(check_prepared(args.calls))
+    if not ok:
+        raise SystemExit("The SQL of a market query depends on its arguments")
+
+
+if __name__ == "__main__":
+    main()
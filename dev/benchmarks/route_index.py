@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for extracting path params in the farmbase API middleware.
+
+Compares the original linear scan (compile_path for every route on every request)
+with the RouteIndex segment trie as the number of routes grows.
+
+Usage:
+    uv run python dev/benchmarks/route_index.py [--requests 2000]
+"""
+
+import argparse
+import random
+import timeit
+
+from farmbase.common.utils.routing import RouteIndex
+from starlette.routing import compile_path
+
+RESOURCES = ["contacts", "farms", "notes", "products", "topics", "subscriptions", "crops", "pathogens", "markets"]
+
+
+def make_paths(n: int) -> list[str]:
+    """Builds n route paths shaped like the farmbase API (organization scoped and global)."""
+    paths = ["/healthcheck"]
+    i = 0
+    while len(paths) < n:
+        resource = f"{RESOURCES[i % len(RESOURCES)]}{i // len(RESOURCES)}"
+        paths += [
+            f"/{{organization}}/{resource}",
+            f"/{{organization}}/{resource}/{{item_id}}",
+            f"/{{organization}}/{resource}/{{item_id}}/history",
+            f"/{resource}/{{item_id}}",
+        ]
+        i += 1
+    return paths[:n]
+
+
+def make_requests(paths: list[str], n: int) -> list[str]:
+    rng = random.Random(42)
+    return [
+        p.replace("{organization}", "default").replace("{item_id}", str(rng.randint(1, 10_000)))
+        for p in rng.choices(paths, k=n)
+    ]
+
+
+def linear_scan(paths: list[str], path: str) -> dict:
+    path_params = {}
+    for p in paths:
+        path_regex, _, _ = compile_path(p)
+        match = path_regex.match(path)
+        if match:
+            path_params = match.groupdict()
+    return path_params
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000, help="Request paths to match per run")
+    args = parser.parse_args()
+
+    print(f"{'routes':>8} {'linear us/req':>14} {'index us/req':>14} {'speedup':>8}")
+    for n in [10, 50, 100, 250, 500, 1000]:
+        paths = make_paths(n)
+        requests = make_requests(paths, args.requests)
+        index = RouteIndex(paths)
+
+        for request in requests:
+            assert index.match(request) == linear_scan(paths, request), request
+
+        linear = min(timeit.repeat(lambda: [linear_scan(paths, r) for r in requests], number=1, repeat=3))
+        indexed = min(timeit.repeat(lambda: [index.match(r) for r in requests], number=1, repeat=3))
+        linear_us = linear / len(requests) * 1e6
+        indexed_us = indexed / len(requests) * 1e6
+        print(f"{n:>8} {linear_us:>14.2f} {indexed_us:>14.2f} {linear_us / indexed_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ from tqdm import tqdm
 
 from farmbase import MarketPrice, Market, Commodity
 from farmbase.config import settings
+from farmbase.market.latest import refresh_latest_prices
 
 # from farmwise.settings import settings
 
@@ -87,6 +88,9 @@ async def load_market_prices(df: pd.DataFrame):
                     index_elements=["market_id", "commodity_id", "date"]
                 )
                 await session.execute(stmt)
+                await session.run_sync(
+                    refresh_latest_prices, {(row["market_id"], row["commodity_id"]) for row in rows_to_insert}
+                )
 
             await session.commit()
             print("✅ Successfully loaded all market prices (duplicates skipped).")
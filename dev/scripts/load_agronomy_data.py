@@ -22,12 +22,14 @@ import os
 # Add the app directory to the Python path
 # sys.path.insert(0, str(Path(__file__).parent.parent / "apps/farmbase/src"))
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, select
 from sqlalchemy.orm import sessionmaker
 
 from farmbase.config import settings
 from farmbase.database.core import Base
+from farmbase.agronomy.aggregates import create_aggregate_views, refresh_aggregate_views
 from farmbase.agronomy.models import (
+    catalogue_version,
     Crop,
     Pathogen,
     PathogenImage,
@@ -463,6 +465,11 @@ def main():
         if args.dry_run:
             print("[DRY RUN] No changes made to database")
         else:
+            # refresh the statistics and tell running API processes to reload their cached catalogue
+            create_aggregate_views(session)
+            refresh_aggregate_views(session)
+            session.execute(select(catalogue_version.next_value()))
+            session.commit()
             print(f"\nSuccessfully loaded data! Total records: {total_loaded}")
         
     except Exception as e:
@@ -0,0 +1,205 @@
+from http import HTTPStatus
+from typing import Any, Optional, Union, cast
+
+import httpx
+
+
+from ...client import AuthenticatedClient, Client
+from ...types import Response, UNSET
+from ... import errors
+
+from ...models import MarketSignalsRead
+from fastapi.exceptions import RequestValidationError
+from ...types import UNSET, Unset
+from typing import cast
+from typing import cast, Union
+from typing import Union
+
+
+def _get_kwargs(
+    market_id: int,
+    *,
+    commodity_id: Union[None, Unset, int] = UNSET,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {}
+
+    json_commodity_id: Union[None, Unset, int]
+    if isinstance(commodity_id, Unset):
+        json_commodity_id = UNSET
+    else:
+        json_commodity_id = commodity_id
+    params["commodity_id"] = json_commodity_id
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
+    _kwargs: dict[str, Any] = {
+        "method": "get",
+        "url": "/markets/{market_id}/signals".format(
+            market_id=market_id,
+        ),
+        "params": params,
+    }
+
+    return _kwargs
+
+
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[Union[MarketSignalsRead, RequestValidationError]]:
+    if response.status_code == 200:
+        response_200 = MarketSignalsRead.model_validate(response.json())
+
+        return response_200
+    if response.status_code == 422:
+        response_422 = RequestValidationError.model_validate(response.json())
+
+        return response_422
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[Union[MarketSignalsRead, RequestValidationError]]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    market_id: int,
+    *,
+    client: AuthenticatedClient,
+    commodity_id: Union[None, Unset, int] = UNSET,
+) -> Response[Union[MarketSignalsRead, RequestValidationError]]:
+    """Get Market Signals Endpoint
+
+     Get today's price signals for each commodity traded in this market: latest price, 7 and 30 day
+    means,
+    week-over-week change and the spread of prices at nearby markets.
+
+    Args:
+        market_id (int):
+        commodity_id (Union[None, Unset, int]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[MarketSignalsRead, RequestValidationError]]
+    """
+
+    kwargs = _get_kwargs(
+        market_id=market_id,
+        commodity_id=commodity_id,
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    market_id: int,
+    *,
+    client: AuthenticatedClient,
+    commodity_id: Union[None, Unset, int] = UNSET,
+) -> Optional[Union[MarketSignalsRead, RequestValidationError]]:
+    """Get Market Signals Endpoint
+
+     Get today's price signals for each commodity traded in this market: latest price, 7 and 30 day
+    means,
+    week-over-week change and the spread of prices at nearby markets.
+
+    Args:
+        market_id (int):
+        commodity_id (Union[None, Unset, int]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[MarketSignalsRead, RequestValidationError]
+    """
+
+    return sync_detailed(
+        market_id=market_id,
+        client=client,
+        commodity_id=commodity_id,
+    ).parsed
+
+
+async def asyncio_detailed(
+    market_id: int,
+    *,
+    client: AuthenticatedClient,
+    commodity_id: Union[None, Unset, int] = UNSET,
+) -> Response[Union[MarketSignalsRead, RequestValidationError]]:
+    """Get Market Signals Endpoint
+
+     Get today's price signals for each commodity traded in this market: latest price, 7 and 30 day
+    means,
+    week-over-week change and the spread of prices at nearby markets.
+
+    Args:
+        market_id (int):
+        commodity_id (Union[None, Unset, int]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[MarketSignalsRead, RequestValidationError]]
+    """
+
+    kwargs = _get_kwargs(
+        market_id=market_id,
+        commodity_id=commodity_id,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    market_id: int,
+    *,
+    client: AuthenticatedClient,
+    commodity_id: Union[None, Unset, int] = UNSET,
+) -> Optional[Union[MarketSignalsRead, RequestValidationError]]:
+    """Get Market Signals Endpoint
+
+     Get today's price signals for each commodity traded in this market: latest price, 7 and 30 day
+    means,
+    week-over-week change and the spread of prices at nearby markets.
+
+    Args:
+        market_id (int):
+        commodity_id (Union[None, Unset, int]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[MarketSignalsRead, RequestValidationError]
+    """
+
+    return (
+        await asyncio_detailed(
+            market_id=market_id,
+            client=client,
+            commodity_id=commodity_id,
+        )
+    ).parsed
@@ -1315,6 +1315,9 @@ class CommodityPriceSnapshot(BaseModel):
     supply_volume: list[float | None] = Field(
         ..., description='List of supply volumes', title='Supply Volume'
     )
+    wholesale_price: list[float | None] | None = Field(
+        None, description='List of wholesale prices', title='Wholesale Price'
+    )
     retail_price: list[float | None] = Field(
         ..., description='List of retail prices', title='Retail Price'
     )
@@ -1330,6 +1333,57 @@ class CommodityPriceSnapshot(BaseModel):
     )
 
 
+class CommodityPriceSignals(BaseModel):
+    commodity: CommodityRead = Field(..., description='Commodity information')
+    price_date: date = Field(
+        ..., description='Date of the latest retail price', title='Price Date'
+    )
+    retail_price: float = Field(
+        ..., description='Latest retail price', title='Retail Price'
+    )
+    retail_unit: str | None = Field(
+        None, description='Unit for retail price', title='Retail Unit'
+    )
+    retail_ccy: str | None = Field(
+        None, description='Currency for retail price', title='Retail Ccy'
+    )
+    mean_7d: float | None = Field(
+        None,
+        description='Mean retail price over the 7 days to price_date',
+        title='Mean 7D',
+    )
+    mean_30d: float | None = Field(
+        None,
+        description='Mean retail price over the 30 days to price_date',
+        title='Mean 30D',
+    )
+    week_over_week: float | None = Field(
+        None,
+        description='Change of the 7 day mean from the 7 days before, as a fraction',
+        title='Week Over Week',
+    )
+    nearby_markets: int = Field(
+        0,
+        description='Markets within the radius, this one included, with a price in the same unit this week',
+        title='Nearby Markets',
+    )
+    nearby_min_price: float | None = Field(
+        None,
+        description='Lowest latest price of the nearby markets',
+        title='Nearby Min Price',
+    )
+    nearby_median_price: float | None = Field(
+        None,
+        description='Median latest price of the nearby markets',
+        title='Nearby Median Price',
+    )
+    nearby_max_price: float | None = Field(
+        None,
+        description='Highest latest price of the nearby markets',
+        title='Nearby Max Price',
+    )
+
+
 class ContactRead(BaseModel):
     preferred_form_of_address: str | None = Field(
         None,
@@ -1459,6 +1513,21 @@ class MarketPricePagination(BaseModel):
     )
 
 
+class MarketSignalsRead(BaseModel):
+    market: MarketRead = Field(..., description='Market information')
+    as_of: date = Field(
+        ..., description='Day the signals were computed for', title='As Of'
+    )
+    distance_km: int = Field(
+        ...,
+        description='Radius of the nearby markets, in kilometres',
+        title='Distance Km',
+    )
+    signals: list[CommodityPriceSignals] | None = Field(
+        None, description='Signals for each commodity', title='Signals'
+    )
+
+
 class MarketSnapshotRead(BaseModel):
     market: MarketRead = Field(..., description='Market information')
     latest_prices: list[CommodityPriceSnapshot] = Field(